@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""bench_bbox.py
+
+Micro-benchmark: list-based ``_page_bbox`` (the original implementation)
+versus the NumPy reduction in ``center_pdf``.
+
+Pages are faked with plain dicts shaped like pdfplumber objects, so the
+numbers measure only the bbox reduction, not PDF parsing.
+
+Usage:
+    uv run benchmarks/bench_bbox.py [--objects 20000] [--repeat 20]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from center_pdf import _iter_objects, _page_bbox  # noqa: E402
+
+
+class FakePage:
+    """Object lists shaped like a pdfplumber page (chars, lines, rects, ...)."""
+
+    def __init__(self, n_objects: int, seed: int = 0):
+        rng = random.Random(seed)
+
+        def obj():
+            x0, y0 = rng.uniform(50, 500), rng.uniform(50, 700)
+            return {"x0": x0, "x1": x0 + rng.uniform(2, 12),
+                    "y0": y0, "y1": y0 + rng.uniform(2, 12), "text": "x"}
+
+        self.chars = [obj() for _ in range(int(n_objects * 0.9))]
+        self.lines = [obj() for _ in range(int(n_objects * 0.04))]
+        self.rects = [obj() for _ in range(int(n_objects * 0.04))]
+        self.curves = [obj() for _ in range(int(n_objects * 0.01))]
+        self.images = [obj() for _ in range(int(n_objects * 0.01))]
+
+
+def list_page_bbox(page):
+    """The original list-based implementation, kept verbatim for comparison."""
+    xs0, xs1, ys0, ys1 = [], [], [], []
+    for obj in _iter_objects(page):
+        try:
+            xs0.append(float(obj["x0"]))
+            xs1.append(float(obj["x1"]))
+            ys0.append(float(obj["y0"]))
+            ys1.append(float(obj["y1"]))
+        except (ValueError, TypeError):
+            continue
+    if not xs0:
+        return None
+    return min(xs0), max(xs1), min(ys0), max(ys1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("--objects", type=int, nargs="+", default=[100, 2000, 20000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'objects':>8} {'list (ms)':>10} {'numpy (ms)':>11} {'pct=1 (ms)':>11} {'speedup':>8}")
+    for n in args.objects:
+        page = FakePage(n)
+        assert list_page_bbox(page) == _page_bbox(page)
+
+        t_list = min(timeit.repeat(lambda: list_page_bbox(page), number=1, repeat=args.repeat))
+        t_np = min(timeit.repeat(lambda: _page_bbox(page), number=1, repeat=args.repeat))
+        t_pct = min(timeit.repeat(lambda: _page_bbox(page, 1.0), number=1, repeat=args.repeat))
+        print(f"{n:>8} {t_list * 1e3:>10.3f} {t_np * 1e3:>11.3f} {t_pct * 1e3:>11.3f} "
+              f"{t_list / t_np:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""corpus.py
+
+Deterministic synthetic PDF corpus for the benchmark suite.
+
+Every document is generated from a fixed seed with PyPDF2 alone, so the
+same corpus (byte for byte) can be rebuilt on any machine instead of
+checking binary fixtures into the repo. Content sits off-center on each
+page so centering actually shifts it.
+
+    text       text-dense pages (50 lines of Helvetica per page)
+    vector     vector-heavy pages (thousands of line, curve and rect segments)
+    image      image-heavy pages (several Flate-compressed RGB images per page)
+    templated  many certificate-style pages from one template, name varies
+
+Usage:
+    uv run benchmarks/corpus.py OUT_DIR [--scale 1.0]
+"""
+
+import argparse
+import random
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from PyPDF2 import PdfWriter
+from PyPDF2.generic import (DecodedStreamObject, DictionaryObject, EncodedStreamObject,
+                            NameObject, NumberObject)
+
+PAGE_W, PAGE_H = 612, 792
+
+_WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+          "incididunt ut labore et dolore magna aliqua certificate award presented").split()
+_NAMES = ("Kim Minjun", "Alexandra Montgomery", "Lee Seoyeon", "Jo", "Park Jiho",
+          "Maximilian Featherstonehaugh-Smith", "Choi Yuna", "Ng")
+
+
+def _font(writer: PdfWriter):
+    return writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+
+
+def _add_page(writer: PdfWriter, content: str, resources: dict):
+    writer.add_blank_page(PAGE_W, PAGE_H)
+    page = writer.pages[-1]
+    stream = DecodedStreamObject()
+    stream.set_data(content.encode("latin-1"))
+    page[NameObject("/Contents")] = writer._add_object(stream)
+    page[NameObject("/Resources")] = DictionaryObject(
+        {NameObject(k): DictionaryObject(v) for k, v in resources.items()})
+
+
+def _offset(rng: random.Random):
+    # 콘텐츠를 페이지 한쪽으로 치우치게 배치
+    return rng.uniform(10, 120), rng.uniform(10, 160)
+
+
+def text_pdf(writer: PdfWriter, rng: random.Random, pages: int):
+    font = _font(writer)
+    for _ in range(pages):
+        ox, oy = _offset(rng)
+        lines = ["BT /F1 9 Tf 11 TL", f"{ox:.2f} {oy + 590:.2f} Td"]
+        for _ in range(50):
+            words = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 12)))
+            lines.append(f"({words}) '")
+        lines.append("ET")
+        _add_page(writer, "\n".join(lines), {"/Font": {NameObject("/F1"): font}})
+
+
+def vector_pdf(writer: PdfWriter, rng: random.Random, pages: int):
+    for _ in range(pages):
+        ox, oy = _offset(rng)
+        ops = ["0.3 w"]
+        for _ in range(1500):
+            x, y = ox + rng.uniform(0, 400), oy + rng.uniform(0, 550)
+            kind = rng.random()
+            if kind < 0.5:
+                ops.append(f"{x:.2f} {y:.2f} m {x + rng.uniform(-20, 20):.2f} "
+                           f"{y + rng.uniform(-20, 20):.2f} l S")
+            elif kind < 0.8:
+                ops.append(f"{x:.2f} {y:.2f} m {x + 5:.2f} {y + 9:.2f} {x + 12:.2f} "
+                           f"{y - 4:.2f} {x + 15:.2f} {y + 3:.2f} c S")
+            else:
+                ops.append(f"{x:.2f} {y:.2f} {rng.uniform(1, 15):.2f} {rng.uniform(1, 15):.2f} re f")
+        _add_page(writer, "\n".join(ops), {})
+
+
+def image_pdf(writer: PdfWriter, rng: random.Random, pages: int, size: int = 256):
+    for _ in range(pages):
+        ox, oy = _offset(rng)
+        ops, xobjects = [], {}
+        for j in range(4):
+            image = EncodedStreamObject()
+            # 무작위 잡음은 압축되지 않으므로 실제 사진 크기에 가까운 스트림이 됨
+            image._data = zlib.compress(rng.randbytes(size * size * 3), 1)
+            image.update({
+                NameObject("/Type"): NameObject("/XObject"),
+                NameObject("/Subtype"): NameObject("/Image"),
+                NameObject("/Width"): NumberObject(size),
+                NameObject("/Height"): NumberObject(size),
+                NameObject("/ColorSpace"): NameObject("/DeviceRGB"),
+                NameObject("/BitsPerComponent"): NumberObject(8),
+                NameObject("/Filter"): NameObject("/FlateDecode"),
+            })
+            xobjects[NameObject(f"/Im{j}")] = writer._add_object(image)
+            x, y = ox + (j % 2) * 210, oy + (j // 2) * 260
+            ops.append(f"q 200 0 0 250 {x:.2f} {y:.2f} cm /Im{j} Do Q")
+        _add_page(writer, "\n".join(ops), {"/XObject": xobjects})
+
+
+def templated_pdf(writer: PdfWriter, rng: random.Random, pages: int):
+    font = _font(writer)
+    for i in range(pages):
+        name = _NAMES[i % len(_NAMES)]
+        x = 230 - len(name) * 3.5
+        content = (
+            "q 1 0 0 1 40 300 cm 2 w 0 0 420 260 re S 10 10 400 240 re S "
+            "BT /F1 22 Tf 120 200 Td (Certificate of Award) Tj ET "
+            f"BT /F1 16 Tf {x:.2f} 120 Td ({name}) Tj ET "
+            "BT /F1 9 Tf 130 40 Td (presented in recognition of outstanding work) Tj ET Q"
+        )
+        _add_page(writer, content, {"/Font": {NameObject("/F1"): font}})
+
+
+# 이름 -> (생성 함수, 기본 페이지 수)
+DOCUMENTS: Dict[str, tuple] = {
+    "text": (text_pdf, 40),
+    "vector": (vector_pdf, 30),
+    "image": (image_pdf, 30),
+    "templated": (templated_pdf, 600),
+}
+
+
+def build(path: Path, make: Callable, pages: int, seed: int):
+    writer = PdfWriter()
+    make(writer, random.Random(seed), pages)
+    with path.open("wb") as f:
+        writer.write(f)
+
+
+def generate_corpus(directory, scale: float = 1.0, seed: int = 0) -> List[Path]:
+    """Write every corpus document into *directory* and return their paths.
+
+    *scale* multiplies each document's page count; equal arguments always
+    produce byte-identical files.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, (name, (make, pages)) in enumerate(DOCUMENTS.items()):
+        path = directory / f"{name}.pdf"
+        build(path, make, max(1, round(pages * scale)), seed + i)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[2])
+    parser.add_argument("out_dir")
+    parser.add_argument("--scale", type=float, default=1.0, help="페이지 수 배율 (기본값: 1.0)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for path in generate_corpus(args.out_dir, args.scale, args.seed):
+        print(f"{path} ({path.stat().st_size / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
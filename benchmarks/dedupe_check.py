@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""dedupe_check.py
+
+Size and equivalence check of ``center_pdf``'s resource deduplication.
+
+A batch of certificate files is generated the way many template engines
+write them: every page embeds its own copy of the same background image
+and seal, and every file its own copy of the same font. The batch is then
+centered
+    per file     ``center_pdf_bytes`` with and without ``dedupe``
+    combined     ``center_pdf_combined`` into one file, with and without ``dedupe``
+and output bytes, bytes saved and time are reported. The check fails when a
+deduplicated output renders differently (PDFium at ``--dpi``, exact pixel
+match) from the plain output.
+
+Usage:
+    uv run benchmarks/dedupe_check.py [--files 20] [--pages 10] [--image-size 400]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pypdfium2 as pdfium
+from PyPDF2 import PdfWriter
+from PyPDF2.generic import EncodedStreamObject, NameObject, NumberObject
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from center_pdf import center_pdf_bytes, center_pdf_combined  # noqa: E402
+from corpus import _NAMES, _add_page, _font  # noqa: E402
+from resource_dedupe import DedupeReport  # noqa: E402
+
+
+def _image(writer: PdfWriter, pixels: bytes, size: int):
+    image = EncodedStreamObject()
+    image._data = zlib.compress(pixels, 6)
+    image.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(size),
+        NameObject("/Height"): NumberObject(size),
+        NameObject("/ColorSpace"): NameObject("/DeviceRGB"),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+        NameObject("/Filter"): NameObject("/FlateDecode"),
+    })
+    return writer._add_object(image)
+
+
+def certificates(path: Path, index: int, pages: int, background: bytes, seal: bytes, size: int):
+    """Write one certificate file whose pages each carry their own copy of the images."""
+    writer = PdfWriter()
+    font = _font(writer)
+    for i in range(pages):
+        name = _NAMES[(index + i) % len(_NAMES)]
+        content = (
+            "q 300 0 0 300 60 380 cm /Bg Do Q q 60 0 0 60 340 400 cm /Seal Do Q "
+            f"BT /F1 22 Tf 110 600 Td (Certificate of Award) Tj ET "
+            f"BT /F1 16 Tf 120 520 Td ({name}) Tj ET"
+        )
+        _add_page(writer, content, {
+            "/Font": {NameObject("/F1"): font},
+            "/XObject": {NameObject("/Bg"): _image(writer, background, size),
+                         NameObject("/Seal"): _image(writer, seal, size // 4)},
+        })
+    with path.open("wb") as f:
+        writer.write(f)
+
+
+def _render(data: bytes, dpi: float) -> List[np.ndarray]:
+    pdf = pdfium.PdfDocument(data)
+    try:
+        pages = []
+        for page in pdf:
+            bitmap = page.render(scale=dpi / 72.0)
+            pages.append(bitmap.to_numpy().copy())
+            bitmap.close()
+            page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+def _same_render(a: bytes, b: bytes, dpi: float) -> bool:
+    pages_a, pages_b = _render(a, dpi), _render(b, dpi)
+    return len(pages_a) == len(pages_b) and all(
+        x.shape == y.shape and np.array_equal(x, y) for x, y in zip(pages_a, pages_b))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="중복 리소스 제거 전후의 출력 크기와 렌더링 비교")
+    parser.add_argument("--files", type=int, default=20, help="생성할 파일 수 (기본값: 20)")
+    parser.add_argument("--pages", type=int, default=10, help="파일당 쪽 수 (기본값: 10)")
+    parser.add_argument("--image-size", type=int, default=400,
+                        help="배경 이미지 한 변의 픽셀 수 (기본값: 400)")
+    parser.add_argument("--engine", default="stream")
+    parser.add_argument("--dpi", type=float, default=50.0, help="비교 렌더링 해상도 (기본값: 50)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    size = args.image_size
+    background = rng.randbytes(size * size * 3)
+    seal = rng.randbytes((size // 4) ** 2 * 3)
+
+    failed = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            path = Path(tmp) / f"cert{i:03d}.pdf"
+            certificates(path, i, args.pages, background, seal, size)
+            paths.append(path)
+        input_bytes = sum(p.stat().st_size for p in paths)
+        print(f"입력: {args.files}개 파일, {args.files * args.pages}쪽, {input_bytes / (1 << 20):.1f} MB")
+
+        for dedupe in (False, True):
+            report = DedupeReport()
+            start = time.perf_counter()
+            outputs = [center_pdf_bytes(str(p), engine=args.engine, dedupe=dedupe,
+                                        dedupe_report=report) for p in paths]
+            elapsed = time.perf_counter() - start
+            total = sum(map(len, outputs))
+            print(f"파일별 dedupe={dedupe!s:<5} {total / (1 << 20):7.1f} MB  {elapsed:6.2f}s  "
+                  f"({report})")
+            if not dedupe:
+                plain = outputs
+        if not _same_render(plain[0], outputs[0], args.dpi):
+            failed.append("파일별")
+
+        combined = {}
+        for dedupe in (False, True):
+            report = DedupeReport()
+            out = Path(tmp) / f"combined_{dedupe}.pdf"
+            start = time.perf_counter()
+            center_pdf_combined(paths, out, engine=args.engine, dedupe=dedupe, dedupe_report=report)
+            elapsed = time.perf_counter() - start
+            combined[dedupe] = out.read_bytes()
+            print(f"합본   dedupe={dedupe!s:<5} {len(combined[dedupe]) / (1 << 20):7.1f} MB  "
+                  f"{elapsed:6.2f}s  ({report})")
+        if not _same_render(combined[False], combined[True], args.dpi):
+            failed.append("합본")
+
+    if failed:
+        print(f"중복 제거 후 렌더링이 달라진 출력: {', '.join(failed)}")
+        return 1
+    print("중복 제거 전후의 렌더링이 모두 같습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""startup.py
+
+Startup-time benchmark based on ``python -X importtime``.
+
+Each case starts a fresh interpreter, so nothing is already imported:
+    import      ``import center_pdf`` (what the GUI and other modules pay)
+    cli_help    ``center_pdf.py --help``
+    cli_empty   ``center_pdf.py`` in a folder without ``pdfs/`` (exits with an error)
+    warm_up     ``center_pdf.warm_up()``, i.e. the deferred numpy/pdfplumber/PyPDF2 cost
+    gui_import  ``import pdf_transfer_app`` (only when PyQt6 is installed)
+
+Reported per case: wall time of the whole process, total import time
+reported by ``-X importtime``, peak RSS, and which heavy modules were
+loaded. With ``--check`` the script exits with status 1 when any case other
+than ``warm_up`` loads a heavy module, so an eager import slipping back in
+fails CI. ``suite.py run`` includes these cases as ``startup/<case>``.
+
+Usage:
+    uv run benchmarks/startup.py [--repeat 5] [--check] [--top 10]
+"""
+
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 시작 시 불러오면 안 되는 모듈 (첫 변환 때 불러옴)
+HEAVY_MODULES = ("numpy", "pdfplumber", "pdfminer", "PyPDF2", "PIL", "pypdfium2")
+
+# 이름 -> (인터프리터 인자, 작업 폴더가 빈 임시 폴더인지)
+CASES: Dict[str, Tuple[List[str], bool]] = {
+    "import": (["-c", "import center_pdf"], False),
+    "cli_help": ([str(ROOT / "center_pdf.py"), "--help"], False),
+    "cli_empty": ([str(ROOT / "center_pdf.py")], True),
+    "warm_up": (["-c", "import center_pdf; center_pdf.warm_up()"], False),
+    "gui_import": (["-c", "import pdf_transfer_app"], False),
+}
+
+
+def parse_importtime(text: str) -> Dict[str, Tuple[int, bool]]:
+    """Parse ``-X importtime`` output into {module: (cumulative µs, is top-level import)}."""
+    modules = {}
+    for line in text.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # 머리글 줄
+        modules[name.strip()] = (int(cumulative), name.startswith(" ") and not name[1:].startswith(" "))
+    return modules
+
+
+def _run_case(args: List[str], empty_cwd: bool) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT),
+                                                                   os.environ.get("PYTHONPATH")])))
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, "-X", "importtime", *args],
+                                cwd=tmp if empty_cwd else ROOT, env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        # stderr를 먼저 다 읽어야 파이프가 차서 멈추지 않음
+        stderr = proc.stderr.read()
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        proc.stderr.close()
+
+    modules = parse_importtime(stderr)
+    top_level = {name: us for name, (us, is_top) in modules.items() if is_top}
+    # Linux는 KB, macOS는 바이트 단위
+    peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    return {
+        "wall": wall,
+        "imports": sum(top_level.values()) / 1e6,
+        "peak_rss": peak_rss,
+        "heavy": sorted({name.split(".")[0] for name in modules} & set(HEAVY_MODULES)),
+        "top": sorted(top_level.items(), key=lambda item: -item[1]),
+    }
+
+
+def available_cases() -> List[str]:
+    cases = list(CASES)
+    if importlib.util.find_spec("PyQt6") is None:
+        cases.remove("gui_import")
+    return cases
+
+
+def measure_startup(repeat: int = 5, cases: List[str] = None) -> Dict[str, dict]:
+    """Run every startup case *repeat* times; median times, lowest peak RSS."""
+    results = {}
+    for name in cases or available_cases():
+        runs = [_run_case(*CASES[name]) for _ in range(repeat)]
+        results[name] = {
+            "stages": {"wall": statistics.median(run["wall"] for run in runs),
+                       "imports": statistics.median(run["imports"] for run in runs)},
+            "peak_rss": min(run["peak_rss"] for run in runs),
+            "heavy_modules": runs[0]["heavy"],
+            "top_imports": runs[0]["top"][:10],
+        }
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="centerframe-pdf 시작 시간 측정 (python -X importtime)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (기본값: 5)")
+    parser.add_argument("--top", type=int, default=5, help="사례마다 표시할 느린 import 수 (기본값: 5)")
+    parser.add_argument("--check", action="store_true",
+                        help="warm_up 외의 사례가 무거운 모듈을 불러오면 1로 종료")
+    args = parser.parse_args(argv)
+
+    results = measure_startup(args.repeat)
+    failed = []
+    print(f"{'case':<12} {'wall':>9} {'imports':>9} {'peak RSS':>9}  heavy modules")
+    for name, result in results.items():
+        stages = result["stages"]
+        heavy = ", ".join(result["heavy_modules"]) or "-"
+        print(f"{name:<12} {stages['wall'] * 1000:>7.0f}ms {stages['imports'] * 1000:>7.0f}ms "
+              f"{result['peak_rss'] / (1 << 20):>7.0f}MB  {heavy}")
+        for module, us in result["top_imports"][:args.top]:
+            print(f"{'':<14}{us / 1000:>7.1f}ms  {module}")
+        if name != "warm_up" and result["heavy_modules"]:
+            failed.append(name)
+
+    if args.check and failed:
+        print(f"무거운 모듈을 시작 시 불러오는 사례: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""suite.py
+
+Reproducible end-to-end benchmark suite over the synthetic corpus in
+``corpus.py``.
+
+``run`` measures, per document and engine, the time spent in each stage:
+    open        PdfReader construction
+    extract     pdfplumber object extraction (pdfplumber engine only)
+    render      PDFium rendering (raster engine only)
+    page_bbox   ``_page_bbox`` reductions over the extracted objects
+    analyze     full bbox analysis (extract + page_bbox, render + ink bbox, or the
+                stream engine pass)
+    write       shift and serialize with ``_write_shifted``
+    center_pdf  the public path-based call, end to end
+and two batch paths over the whole corpus:
+    gui         files one after another through ``center_pdf``, as the GUI's
+                ``ConversionWorker`` does
+    batch       ``center_batch`` on a process pool
+plus the interpreter startup cases of ``startup.py`` as ``startup/<case>``.
+
+Each measurement runs in a fresh process so peak RSS is attributable to it.
+Stage times are the median over ``--repeat`` runs. Results (plus
+environment and corpus hashes) are written as JSON.
+
+``compare`` diffs two result files and exits with status 1 when any time or
+peak RSS grew, or any throughput dropped, by more than ``--tolerance``.
+
+Usage:
+    uv run benchmarks/suite.py run -o bench.json [--scale 1.0] [--repeat 3]
+    uv run benchmarks/suite.py compare baseline.json bench.json [--tolerance 0.15]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from importlib import metadata
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import DOCUMENTS, generate_corpus  # noqa: E402
+from startup import measure_startup  # noqa: E402
+
+RESULTS_VERSION = 1
+
+# 이보다 작은 시간 차이(초)는 측정 잡음으로 보고 회귀로 판단하지 않음
+MIN_TIME_DELTA = 0.005
+
+
+def _peak_rss() -> int:
+    from center_batch import peak_rss_bytes
+
+    return peak_rss_bytes() or 0
+
+
+def _measure_document(path: str, engine: str) -> dict:
+    """Child-process body: time every stage for one document and engine."""
+    import pdfplumber
+    from PyPDF2 import PdfReader
+
+    from center_pdf import (RASTER_DPI, RASTER_TOLERANCE, _center, _page_bbox, _page_geometry,
+                            _shift_for_bbox, _stream_page_geometry, _write_shifted)
+
+    stages: Dict[str, float] = {}
+    start = time.perf_counter()
+    reader = PdfReader(path)
+    pages = len(reader.pages)
+    stages["open"] = time.perf_counter() - start
+
+    geometry = []
+    if engine == "stream":
+        start = time.perf_counter()
+        geometry = [_stream_page_geometry(page) for page in reader.pages]
+        stages["analyze"] = time.perf_counter() - start
+    elif engine == "raster":
+        import raster_bbox
+
+        render = reduce = 0.0
+        with raster_bbox.open_document(path) as doc:
+            for page in doc:
+                t0 = time.perf_counter()
+                pixels, page_w, page_h = raster_bbox.render_page(page, RASTER_DPI)
+                t1 = time.perf_counter()
+                mask = raster_bbox.ink_mask(pixels, RASTER_TOLERANCE)
+                geometry.append((raster_bbox.mask_bbox(mask, page_w, page_h), page_w, page_h))
+                render += t1 - t0
+                reduce += time.perf_counter() - t1
+                page.close()
+        stages.update(render=render, page_bbox=reduce, analyze=render + reduce)
+    else:
+        extract = reduce = 0.0
+        with pdfplumber.open(path) as pdf:
+            for page in pdf.pages:
+                t0 = time.perf_counter()
+                page.objects  # 객체 추출만 따로 측정
+                t1 = time.perf_counter()
+                _page_bbox(page)
+                extract += t1 - t0
+                reduce += time.perf_counter() - t1
+                geometry.append(_page_geometry(page))
+                page.close()
+        stages.update(extract=extract, page_bbox=reduce, analyze=extract + reduce)
+
+    shifts = [_shift_for_bbox(*geom) for geom in geometry]
+    start = time.perf_counter()
+    _write_shifted(reader, shifts, io.BytesIO())
+    stages["write"] = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        _center(Path(path), Path(tmp) / "out.pdf", engine=engine)
+        stages["center_pdf"] = time.perf_counter() - start
+
+    return {"pages": pages, "stages": stages, "peak_rss": _peak_rss()}
+
+
+def _measure_gui(paths: List[str]) -> dict:
+    """Child-process body: convert files sequentially through ``center_pdf``."""
+    from center_pdf import center_pdf
+
+    with tempfile.TemporaryDirectory() as tmp, redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for path in paths:
+            center_pdf(path, os.path.join(tmp, os.path.basename(path)))
+        elapsed = time.perf_counter() - start
+    return {"stages": {"total": elapsed}, "peak_rss": _peak_rss()}
+
+
+def _measure_batch(paths: List[str], workers: int) -> dict:
+    """Child-process body: convert all files with ``center_batch``."""
+    from center_batch import center_batch
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs = [(path, os.path.join(tmp, os.path.basename(path))) for path in paths]
+        summary = center_batch(jobs, workers=workers)
+    return {"stages": {"total": summary.elapsed}, "peak_rss": summary.peak_rss or 0}
+
+
+def _in_fresh_process(fn, *args) -> dict:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+        return pool.submit(fn, *args).result()
+
+
+def _repeat(fn, args: tuple, repeat: int) -> dict:
+    """Run *fn* *repeat* times in fresh processes; median stage times, lowest peak RSS."""
+    runs = [_in_fresh_process(fn, *args) for _ in range(repeat)]
+    result = dict(runs[0])
+    result["stages"] = {name: statistics.median(run["stages"][name] for run in runs)
+                        for name in runs[0]["stages"]}
+    result["peak_rss"] = min(run["peak_rss"] for run in runs)
+    return result
+
+
+def _environment() -> dict:
+    versions = {}
+    for package in ("numpy", "pdfplumber", "pdfminer.six", "PyPDF2"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+        "commit": commit,
+    }
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def run(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = Path(args.corpus) if args.corpus else Path(tmp)
+        paths = generate_corpus(corpus_dir, args.scale)
+        corpus = {p.stem: {"bytes": p.stat().st_size, "sha256": _sha256(p)} for p in paths}
+
+        results = {}
+        total_pages = 0
+        for path in paths:
+            for engine in args.engines:
+                name = f"{path.stem}/{engine}"
+                print(f"  {name} ...", end="", flush=True)
+                result = _repeat(_measure_document, (str(path), engine), args.repeat)
+                result["pages_per_s"] = result["pages"] / result["stages"]["center_pdf"]
+                corpus[path.stem]["pages"] = result["pages"]
+                results[name] = result
+                print(f" {result['pages_per_s']:.1f} pages/s, "
+                      f"{result['peak_rss'] / (1 << 20):.0f} MB")
+            total_pages += corpus[path.stem]["pages"]
+
+        str_paths = [str(p) for p in paths]
+        for name, fn, fn_args in (("gui", _measure_gui, (str_paths,)),
+                                  ("batch", _measure_batch, (str_paths, args.workers))):
+            print(f"  {name} ...", end="", flush=True)
+            result = _repeat(fn, fn_args, args.repeat)
+            elapsed = result["stages"]["total"]
+            result.update(files_per_s=len(paths) / elapsed, pages_per_s=total_pages / elapsed)
+            results[name] = result
+            print(f" {result['files_per_s']:.2f} files/s, {result['pages_per_s']:.1f} pages/s")
+
+    print("  startup ...", end="", flush=True)
+    for case, result in measure_startup(args.repeat).items():
+        results[f"startup/{case}"] = result
+    print(f" {results['startup/cli_help']['stages']['wall'] * 1000:.0f} ms (--help)")
+
+    data = {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "settings": {"scale": args.scale, "repeat": args.repeat, "engines": args.engines,
+                     "workers": args.workers},
+        "environment": _environment(),
+        "corpus": corpus,
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(data, indent=1, sort_keys=True))
+    print(f"결과를 '{args.output}'에 저장했습니다.")
+    return 0
+
+
+def _metrics(result: dict) -> Dict[str, tuple]:
+    """Flatten one result into {metric: (value, higher_is_better)}."""
+    metrics = {f"{stage}_s": (value, False) for stage, value in result["stages"].items()}
+    metrics["peak_rss_mb"] = (result["peak_rss"] / (1 << 20), False)
+    for key in ("pages_per_s", "files_per_s"):
+        if key in result:
+            metrics[key] = (result[key], True)
+    return metrics
+
+
+def compare(args) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+
+    for name, doc in current["corpus"].items():
+        if baseline["corpus"].get(name, {}).get("sha256") != doc["sha256"]:
+            print(f"경고: '{name}' 문서가 기준 결과와 다릅니다 (corpus 또는 --scale 변경).")
+
+    regressions = 0
+    print(f"{'case':<22} {'metric':<16} {'baseline':>10} {'current':>10} {'change':>8}")
+    for case, result in current["results"].items():
+        if case not in baseline["results"]:
+            continue
+        old_metrics = _metrics(baseline["results"][case])
+        for metric, (value, higher_is_better) in _metrics(result).items():
+            if metric not in old_metrics:
+                continue
+            old = old_metrics[metric][0]
+            change = (value - old) / old if old else 0.0
+            worse = -change if higher_is_better else change
+            regressed = worse > args.tolerance
+            if metric.endswith("_s") and not metric.endswith("per_s"):
+                regressed = regressed and abs(value - old) >= MIN_TIME_DELTA
+            regressions += regressed
+            flag = "  << 회귀" if regressed else ""
+            print(f"{case:<22} {metric:<16} {old:>10.4g} {value:>10.4g} {change:>+7.1%}{flag}")
+
+    if regressions:
+        print(f"{regressions}개 지표가 허용 범위({args.tolerance:.0%})를 넘어 나빠졌습니다.")
+        return 1
+    print("회귀 없음.")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="centerframe-pdf 벤치마크 모음")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="합성 PDF로 단계별 시간과 처리량, 최대 메모리를 측정")
+    p_run.add_argument("-o", "--output", default="bench.json", help="결과 JSON (기본값: bench.json)")
+    p_run.add_argument("--scale", type=float, default=1.0, help="문서 페이지 수 배율 (기본값: 1.0)")
+    p_run.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (기본값: 3)")
+    p_run.add_argument("--engines", nargs="+", default=["pdfplumber", "stream"],
+                       choices=["pdfplumber", "stream", "raster"])
+    p_run.add_argument("-j", "--workers", type=int, default=None,
+                       help="batch 측정의 프로세스 수 (기본값: CPU 코어 수)")
+    p_run.add_argument("--corpus", default=None, help="합성 PDF를 남겨 둘 폴더 (기본값: 임시 폴더)")
+
+    p_cmp = sub.add_parser("compare", help="두 결과 파일을 비교해 회귀가 있으면 1로 종료")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--tolerance", type=float, default=0.15,
+                       help="허용할 악화 비율 (기본값: 0.15)")
+
+    args = parser.parse_args(argv)
+    return run(args) if args.command == "run" else compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
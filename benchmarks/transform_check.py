@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""transform_check.py
+
+Equivalence and speed check of the two transform modes of ``center_pdf``:
+    matrix  ``Transformation().translate`` wraps each content stream in ``q cm ... Q``
+    box     MediaBox/CropBox/... are moved by (-tx, -ty), content streams are copied
+
+For every document (the synthetic corpus of ``corpus.py`` unless PDFs are
+given) both modes are run with the same analysis, and the check fails when
+    * a page of the box output renders differently from the matrix output
+      (PDFium at ``--dpi``; a channel may differ by at most ``--tolerance``
+      on at most ``--max-diff-pct`` % of the pixels, for anti-aliasing, and
+      each pixel is matched against its neighbours within one device pixel,
+      for edges snapped to the pixel grid), or
+    * a content stream of the box output is not byte-identical to the input's.
+The transform and write stage times of both modes are reported alongside.
+
+Images rendered below their own resolution are resampled with a phase
+that depends on the page origin, which shows up as differences on noisy
+images such as the corpus's at low ``--dpi``; the default of 150 avoids it.
+
+Usage:
+    uv run benchmarks/transform_check.py [PDF ...] [--scale 0.2] [--engine stream]
+"""
+
+import argparse
+import io
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pypdfium2 as pdfium
+from PyPDF2 import PdfReader
+from PyPDF2.generic import ArrayObject
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from center_metrics import Instrumentation  # noqa: E402
+from center_pdf import ENGINES, TRANSFORM_MODES, center_pdf_bytes  # noqa: E402
+from corpus import generate_corpus  # noqa: E402
+
+
+def _center(data: bytes, engine: str, transform: str) -> Tuple[bytes, Dict[str, float]]:
+    stats = []
+    output = center_pdf_bytes(data, engine=engine, transform=transform,
+                              instrument=Instrumentation(stats.append))
+    return output, stats[0].stages
+
+
+def _render(data: bytes, dpi: float) -> List[np.ndarray]:
+    pdf = pdfium.PdfDocument(data)
+    try:
+        pages = []
+        for page in pdf:
+            bitmap = page.render(scale=dpi / 72.0)
+            pages.append(bitmap.to_numpy().copy())
+            bitmap.close()
+            page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+def _raw_contents(data: bytes) -> List[List[bytes]]:
+    """Return the raw (still encoded) bytes of every content stream, per page."""
+    pages = []
+    for page in PdfReader(io.BytesIO(data)).pages:
+        contents = page.raw_get("/Contents").get_object() if "/Contents" in page else []
+        streams = contents if isinstance(contents, ArrayObject) else [contents]
+        pages.append([s.get_object()._data for s in streams])
+    return pages
+
+
+def _snapped_diff(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Per-pixel max channel difference of *a* and *b*, allowing one device pixel of offset.
+
+    PDFium snaps image edges to the pixel grid, and a different page origin
+    can round an edge the other way, which moves a whole image row or column.
+    """
+    a = a.astype(np.int16)
+    b = b.astype(np.int16)
+    best = None
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            diff = np.abs(a - np.roll(b, (dy, dx), axis=(0, 1))).max(axis=2)
+            best = diff if best is None else np.minimum(best, diff)
+    return best[1:-1, 1:-1]
+
+
+def check_document(data: bytes, engine: str, dpi: float, tolerance: int) -> dict:
+    """Center *data* in every transform mode and compare the results."""
+    outputs, stages = {}, {}
+    for mode in TRANSFORM_MODES:
+        outputs[mode], stages[mode] = _center(data, engine, mode)
+
+    matrix_pages = _render(outputs["matrix"], dpi)
+    box_pages = _render(outputs["box"], dpi)
+    if len(matrix_pages) != len(box_pages):
+        raise AssertionError("page counts differ")
+    worst_diff, worst_pct = 0, 0.0
+    for a, b in zip(matrix_pages, box_pages):
+        if a.shape != b.shape:
+            raise AssertionError(f"rendered page sizes differ: {a.shape} vs {b.shape}")
+        diff = _snapped_diff(a, b)
+        worst_diff = max(worst_diff, int(diff.max()))
+        worst_pct = max(worst_pct, 100.0 * np.count_nonzero(diff > tolerance) / diff.size)
+
+    return {
+        "pages": len(box_pages),
+        "max_channel_diff": worst_diff,
+        "diff_pct": worst_pct,
+        "streams_identical": _raw_contents(outputs["box"]) == _raw_contents(data),
+        "stages": stages,
+        "bytes": {mode: len(out) for mode, out in outputs.items()},
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="matrix/box 이동 방식의 결과가 같은지 렌더링으로 비교")
+    parser.add_argument("pdfs", nargs="*", help="검사할 PDF (기본값: 합성 코퍼스)")
+    parser.add_argument("--scale", type=float, default=0.2, help="합성 코퍼스 크기 배율 (기본값: 0.2)")
+    parser.add_argument("--engine", choices=ENGINES, default="stream")
+    parser.add_argument("--dpi", type=float, default=150.0, help="비교 렌더링 해상도 (기본값: 150)")
+    parser.add_argument("--tolerance", type=int, default=8,
+                        help="픽셀이 다르다고 볼 채널 값 차이 (기본값: 8)")
+    parser.add_argument("--max-diff-pct", type=float, default=0.5,
+                        help="한 페이지에서 허용할 다른 픽셀 비율, %% (기본값: 0.5)")
+    args = parser.parse_args(argv)
+
+    failed = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(p) for p in args.pdfs] or generate_corpus(Path(tmp), args.scale)
+        print(f"{'document':<14} {'pages':>5} {'diff':>5} {'diff%':>6} {'streams':>8} "
+              f"{'matrix t+w':>11} {'box t+w':>9}")
+        for path in paths:
+            result = check_document(path.read_bytes(), args.engine, args.dpi, args.tolerance)
+            times = {mode: result["stages"][mode].get("transform", 0.0)
+                     + result["stages"][mode].get("write", 0.0) for mode in TRANSFORM_MODES}
+            print(f"{path.stem:<14} {result['pages']:>5} {result['max_channel_diff']:>5} "
+                  f"{result['diff_pct']:>5.2f}% {'same' if result['streams_identical'] else 'CHANGED':>8} "
+                  f"{times['matrix'] * 1000:>9.1f}ms {times['box'] * 1000:>7.1f}ms")
+            if result["diff_pct"] > args.max_diff_pct or not result["streams_identical"]:
+                failed.append(path.stem)
+
+    if failed:
+        print(f"box 방식의 결과가 다른 문서: {', '.join(failed)}")
+        return 1
+    print("모든 문서에서 box 방식의 결과가 matrix 방식과 같습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
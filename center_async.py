@@ -0,0 +1,309 @@
+"""center_async.py
+
+asyncio front end for ``center_pdf``.
+
+``center_pdf`` blocks and reports through stdout/stderr. The coroutines
+here run the same conversion on an executor owned by an
+:class:`AsyncCenterer` and never print: a file either yields a
+:class:`center_batch.CenterResult` or raises :class:`CenterError` (the
+original exception is its ``__cause__``). An ``asyncio.Semaphore`` bounds
+how many files are submitted at once, so thousands of pending jobs do not
+pile up in the executor queue.
+
+    result = await center_pdf_async("in.pdf", "out.pdf", engine="stream")
+    async for result in center_many_async(jobs, engine="stream"):
+        print(result)                      # completion order, failures included
+
+Without an explicit centerer both use a shared default with a process
+executor of one worker per core, created on first use; close it with
+:func:`shutdown_default`.
+"""
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple, Union
+
+from center_batch import CenterResult
+from center_metrics import NULL_RECORDER, FileRecorder, Instrumentation
+from center_pdf import ConversionCancelled, _center_cached, _check_option_dict, warm_up
+
+PathLike = Union[str, Path]
+
+EXECUTOR_KINDS = ("process", "thread")
+
+
+class CenterError(Exception):
+    """Centering one file failed; the original exception is ``__cause__``."""
+
+    def __init__(self, input_path: str, output_path: str, message: str):
+        super().__init__(f"{input_path}: {message}")
+        self.input_path = input_path
+        self.output_path = output_path
+
+
+def _center_job(job: Tuple[str, str, dict]) -> CenterResult:
+    """Executor task: center one file and return its result; errors propagate."""
+    input_path, output_path, options = job
+    options = dict(options)
+    recorder = FileRecorder(input_path, output_path) if options.pop("stats", False) else NULL_RECORDER
+    report = None
+    if options.get("dedupe"):
+        from resource_dedupe import DedupeReport
+
+        report = options["dedupe_report"] = DedupeReport()
+
+    start = time.perf_counter()
+    pages, cached = _center_cached(Path(input_path), Path(output_path), recorder=recorder, **options)
+    return CenterResult(input_path, output_path, True, pages, time.perf_counter() - start,
+                        cached=cached, stats=recorder.finish(),
+                        bytes_deduped=report.bytes_saved if report is not None else 0)
+
+
+def _validate(options: dict):
+    _check_option_dict(options)
+    for name in ("progress", "cancel", "memo", "dedupe_report"):
+        # 다른 프로세스나 스레드에서 실행되므로 호출한 쪽의 객체를 그대로 쓸 수 없음
+        if name in options:
+            raise ValueError(f"option {name!r} is not supported by the asyncio API")
+
+
+class AsyncCenterer:
+    """Executor and concurrency limit shared by the centering coroutines.
+
+    *executor* is "process" (default; CPU-bound work runs in parallel, and
+    workers import the heavy modules once at start) or "thread" (no extra
+    processes; conversions mostly serialize on the GIL, but a cancelled
+    task stops its conversion after the current page). At most
+    *max_concurrency* files (default: *max_workers*) are submitted at once
+    per event loop; the executor is created on first use and recreated if
+    a worker process dies.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        *,
+        executor: str = "process",
+        max_workers: Optional[int] = None,
+        context: str = "spawn",
+        instrument: Optional[Instrumentation] = None,
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 변환할 최대 파일 수. None이면 max_workers.
+            executor: "process"(기본값) 또는 "thread".
+            max_workers: 실행기의 워커 수. None이면 CPU 코어 수.
+            context: 프로세스 실행기의 multiprocessing 시작 방식 (기본값: "spawn").
+                "spawn"은 스레드를 쓰는 이벤트 루프 안에서도 안전합니다.
+            instrument: 지정하면 파일마다 단계 시간과 카운터를 훅으로 전달합니다
+                (이벤트 루프 스레드에서 호출).
+        """
+        if executor not in EXECUTOR_KINDS:
+            raise ValueError(f"unknown executor {executor!r}; expected one of {EXECUTOR_KINDS}")
+        self.kind = executor
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.max_concurrency = max(1, max_concurrency or self.max_workers)
+        self.instrument = instrument
+        self._context = context
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # asyncio.Semaphore는 처음 쓴 이벤트 루프에 묶이므로 루프마다 따로 둠
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "thread":
+                    self._executor = ThreadPoolExecutor(self.max_workers, "center-async")
+                else:
+                    self._executor = ProcessPoolExecutor(
+                        self.max_workers, mp_context=multiprocessing.get_context(self._context),
+                        initializer=warm_up)
+            return self._executor
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            for other in [old for old in self._semaphores if old.is_closed()]:
+                del self._semaphores[other]
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def center(self, input_path: PathLike, output_path: PathLike, **options) -> CenterResult:
+        """Center one file; see :func:`center_pdf_async`."""
+        _validate(options)
+        if self.instrument is not None:
+            options["stats"] = True
+        loop = asyncio.get_running_loop()
+        async with self._semaphore():
+            cancel = None
+            if self.kind == "thread":
+                cancel = options["cancel"] = threading.Event()
+            executor = self._get_executor()
+            future = loop.run_in_executor(
+                executor, _center_job, (str(input_path), str(output_path), options))
+            try:
+                result = await future
+            except asyncio.CancelledError:
+                if cancel is not None:
+                    cancel.set()
+                raise
+            except Exception as e:
+                if isinstance(e, BrokenExecutor):
+                    # 워커 프로세스가 죽은 실행기는 다시 쓸 수 없으므로 다음 호출에서 새로 만듦
+                    with self._lock:
+                        if self._executor is executor:
+                            self._executor = None
+                    executor.shutdown(wait=False)
+                raise CenterError(str(input_path), str(output_path), str(e) or type(e).__name__) from e
+        if self.instrument is not None:
+            self.instrument.emit(result.stats)
+        return result
+
+    async def _result(self, input_path: PathLike, output_path: PathLike, options: dict) -> CenterResult:
+        start = time.perf_counter()
+        try:
+            return await self.center(input_path, output_path, **options)
+        except CenterError as e:
+            cause = e.__cause__
+            return CenterResult(str(input_path), str(output_path), False,
+                                seconds=time.perf_counter() - start, error=str(cause or e),
+                                cancelled=isinstance(cause, ConversionCancelled))
+
+    async def center_many(
+        self, jobs: Iterable[Tuple[PathLike, PathLike]], **options
+    ) -> AsyncIterator[CenterResult]:
+        """Center every (input, output) pair; see :func:`center_many_async`."""
+        _validate(options)
+        jobs = iter(jobs)
+        pending = set()
+        exhausted = False
+        try:
+            while True:
+                # 작업 목록은 필요한 만큼만 읽으므로 생성기로 아주 많은 파일을 넘겨도 됨
+                while not exhausted and len(pending) < self.max_concurrency:
+                    try:
+                        input_path, output_path = next(jobs)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(
+                        self._result(input_path, output_path, dict(options))))
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def close(self, wait: bool = True):
+        """Shut the executor down; queued files that have not started are dropped."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def aclose(self):
+        """:meth:`close` without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self) -> "AsyncCenterer":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+        return False
+
+
+_default: Optional[AsyncCenterer] = None
+_default_lock = threading.Lock()
+
+
+def _default_centerer() -> AsyncCenterer:
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = AsyncCenterer()
+        return _default
+
+
+def shutdown_default(wait: bool = True):
+    """Shut down the shared centerer used when none is passed (a new one is made on next use)."""
+    global _default
+    with _default_lock:
+        centerer, _default = _default, None
+    if centerer is not None:
+        centerer.close(wait)
+
+
+async def center_pdf_async(
+    input_path: PathLike,
+    output_path: PathLike,
+    *,
+    centerer: Optional[AsyncCenterer] = None,
+    **options,
+) -> CenterResult:
+    """
+    PDF 파일 하나를 실행기에서 중앙 정렬합니다. 아무것도 출력하지 않습니다.
+
+    Args:
+        input_path: 원본 PDF 파일 경로.
+        output_path: 저장할 PDF 파일 경로.
+        centerer: 사용할 :class:`AsyncCenterer`. None이면 공유 기본값(프로세스 실행기).
+        **options: engine, outlier_pct, margin, threshold, reuse, streaming, incremental,
+            transform, dedupe, cache, raster_dpi, raster_tolerance 등 :func:`center_pdf.center_pdf`
+            의 키워드 인자. progress, cancel, memo, dedupe_report는 지원하지 않습니다.
+            취소는 이 코루틴을 담은 작업을 취소하세요.
+
+    Returns:
+        CenterResult: 쪽 수, 걸린 시간, 캐시 적중 여부 등.
+
+    Raises:
+        ValueError: 잘못된 옵션 (변환을 시작하기 전에 발생).
+        CenterError: 변환 실패. 원래 예외는 ``__cause__`` 에 있습니다.
+        asyncio.CancelledError: 작업이 취소된 경우. 아직 시작하지 않은 파일은 변환하지 않고,
+            thread 실행기에서는 진행 중인 변환도 현재 페이지 뒤에 멈춥니다.
+            process 실행기에서 이미 시작한 변환은 끝까지 실행됩니다.
+    """
+    centerer = centerer or _default_centerer()
+    return await centerer.center(input_path, output_path, **options)
+
+
+async def center_many_async(
+    jobs: Iterable[Tuple[PathLike, PathLike]],
+    *,
+    centerer: Optional[AsyncCenterer] = None,
+    **options,
+) -> AsyncIterator[CenterResult]:
+    """
+    여러 파일을 중앙 정렬하며 끝나는 순서대로 결과를 내놓는 비동기 반복자입니다.
+
+    Args:
+        jobs: (입력 경로, 출력 경로) 쌍. 동시 변환 수만큼씩만 미리 읽습니다.
+        centerer: 사용할 :class:`AsyncCenterer`. None이면 공유 기본값.
+        **options: :func:`center_pdf_async` 와 동일.
+
+    Yields:
+        CenterResult: 파일마다 하나. 실패한 파일도 예외 대신 ``ok=False`` 결과로 나옵니다.
+
+    Raises:
+        ValueError: 잘못된 옵션 (첫 결과를 기다릴 때 발생).
+
+    반복을 중간에 멈추면(break, 작업 취소) 진행 중인 파일은 취소됩니다.
+    """
+    centerer = centerer or _default_centerer()
+    # 반복을 멈추면 안쪽 생성기도 바로 닫아 진행 중인 파일을 취소함
+    async with contextlib.aclosing(centerer.center_many(jobs, **options)) as results:
+        async for result in results:
+            yield result
@@ -0,0 +1,629 @@
+"""center_batch.py
+
+Process-pool batch mode for ``center_pdf``.
+
+Each (input, output) job runs in a worker process; results are collected as
+:class:`CenterResult` records instead of being printed, and the batch ends
+with a :class:`BatchSummary` carrying files/s and pages/s throughput.
+
+:class:`WarmPool` keeps a pool alive across batches for interactive callers
+(the GUI): its workers import the heavy modules once at start, report page
+progress through a queue and share one cancellation event.
+"""
+
+import multiprocessing
+import multiprocessing.connection
+import contextlib
+import itertools
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from center_metrics import NULL_RECORDER, FileRecorder, FileStats, Instrumentation
+from center_pdf import ConversionCancelled, _center_cached, _check_option_dict
+from page_fingerprint import LayoutMemo
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class CenterResult:
+    """Outcome of centering one file."""
+
+    input_path: str
+    output_path: str
+    ok: bool
+    pages: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+    cached: bool = False
+    reused_pages: int = 0
+    stats: Optional[FileStats] = None  # instrument를 지정한 경우에만 채워짐
+    cancelled: bool = False
+    bytes_deduped: int = 0
+
+    def __str__(self) -> str:
+        if self.ok:
+            source = "캐시" if self.cached else f"{self.seconds:.2f}s"
+            if self.bytes_deduped:
+                source += f", 중복 제거 {self.bytes_deduped / 1024:.0f} KiB"
+            return f"[성공] {self.input_path} -> {self.output_path} ({self.pages}쪽, {source})"
+        if self.cancelled:
+            return f"[취소] {self.input_path}"
+        return f"[실패] {self.input_path}: {self.error}"
+
+
+@dataclass
+class BatchSummary:
+    """All per-file results of a batch plus wall-clock throughput."""
+
+    results: List[CenterResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    peak_rss: Optional[int] = None  # 바이트, 측정할 수 없으면 None
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if not r.ok and not r.cancelled)
+
+    @property
+    def cancelled(self) -> int:
+        return sum(1 for r in self.results if r.cancelled)
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(1 for r in self.results if r.cached)
+
+    @property
+    def reused_pages(self) -> int:
+        return sum(r.reused_pages for r in self.results)
+
+    @property
+    def pages(self) -> int:
+        return sum(r.pages for r in self.results)
+
+    @property
+    def bytes_deduped(self) -> int:
+        return sum(r.bytes_deduped for r in self.results)
+
+    @property
+    def files_per_s(self) -> float:
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def pages_per_s(self) -> float:
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        cancelled = f", 취소 {self.cancelled}개" if self.cancelled else ""
+        cached = f", 캐시 적중 {self.cache_hits}개" if self.cache_hits else ""
+        reused = f", 분석 생략 {self.reused_pages}쪽" if self.reused_pages else ""
+        if self.bytes_deduped:
+            reused += f", 중복 제거 {self.bytes_deduped / (1 << 20):.1f} MB"
+        memory = f", 최대 메모리 {self.peak_rss / (1 << 20):.0f} MB" if self.peak_rss else ""
+        return (
+            f"완료: 성공 {self.succeeded}개, 실패 {self.failed}개{cancelled}{cached}{reused} "
+            f"({self.elapsed:.2f}s, {self.files_per_s:.2f} files/s, "
+            f"{self.pages_per_s:.1f} pages/s{memory})"
+        )
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Return the peak resident set size of this process or any finished child, in bytes.
+
+    Returns None on platforms without ``resource`` (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss 단위: macOS는 바이트, Linux 등은 KB
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# 파일 사이에 공유하는 레이아웃 지문 메모 (워커 프로세스마다 하나)
+_process_memo: Optional[LayoutMemo] = None
+
+
+def center_one(job: Tuple[PathLike, PathLike, dict, bool]) -> CenterResult:
+    """Center one file and return its result; never raises.
+
+    With ``options["stats"]`` the result carries the file's :class:`FileStats`;
+    with ``options["dedupe"]`` it reports the bytes deduplication saved.
+    """
+    global _process_memo
+    input_path, output_path, options, share_memo = job
+    options = dict(options)
+    recorder = FileRecorder(input_path, output_path) if options.pop("stats", False) else NULL_RECORDER
+
+    memo = LayoutMemo()
+    if share_memo:
+        if _process_memo is None:
+            _process_memo = LayoutMemo()
+        memo = _process_memo
+    hits_before = memo.hits
+    report = None
+    if options.get("dedupe"):
+        from resource_dedupe import DedupeReport
+
+        report = options["dedupe_report"] = DedupeReport()
+
+    start = time.perf_counter()
+    try:
+        pages, cached = _center_cached(Path(input_path), Path(output_path), memo=memo,
+                                       recorder=recorder, **options)
+    except Exception as e:
+        if recorder.enabled:
+            recorder.stats.ok, recorder.stats.error = False, str(e) or type(e).__name__
+        return CenterResult(str(input_path), str(output_path), False,
+                            seconds=time.perf_counter() - start, error=str(e) or type(e).__name__,
+                            stats=recorder.finish(),
+                            cancelled=isinstance(e, ConversionCancelled))
+    return CenterResult(str(input_path), str(output_path), True, pages,
+                        time.perf_counter() - start, cached=cached,
+                        reused_pages=memo.hits - hits_before, stats=recorder.finish(),
+                        bytes_deduped=report.bytes_saved if report is not None else 0)
+
+
+def center_batch(
+    jobs: Iterable[Tuple[PathLike, PathLike]],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+    share_memo: bool = False,
+    on_result: Optional[Callable[[CenterResult], None]] = None,
+    instrument: Optional[Instrumentation] = None,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    **options,
+) -> BatchSummary:
+    """Center every (input, output) pair in *jobs* on a process pool.
+
+    Args:
+        jobs: (입력 경로, 출력 경로) 쌍.
+        workers: 프로세스 수. None이면 CPU 코어 수, 1이면 현재 프로세스에서 실행.
+        chunksize: 워커에 한 번에 넘길 작업 수. 작은 파일이 많을 때 키우면
+            프로세스 간 통신 비용이 줄어듭니다.
+        share_memo: reuse 옵션을 쓸 때 레이아웃 지문 메모를 파일 사이에서도
+            공유합니다 (워커 프로세스 단위).
+        on_result: 파일 하나가 끝날 때마다 (완료 순서대로) 호출됩니다.
+        instrument: 지정하면 워커에서 파일별 단계 시간과 카운터를 모아
+            현재 프로세스에서 훅으로 전달합니다.
+        timeout: 파일 하나에 허용할 시간(초). 지정하면 (memory_limit과 마찬가지로)
+            workers가 1이어도 파일마다 격리된 워커 프로세스(:class:`WarmPool`)에서
+            변환하고, 시간을 넘긴 파일은 워커를 종료해 실패로 기록합니다.
+        memory_limit: 워커 프로세스 하나의 주소 공간 한도(바이트, Windows 제외).
+            한도를 넘겨 실패하거나 죽은 워커는 새로 띄우고 파일은 실패로 기록합니다.
+        **options: engine, outlier_pct, streaming, cache 등 :func:`center_pdf.center_pdf` 의
+            키워드 인자. page_workers > 1 이면 페이지 단위 병렬화가 프로세스를
+            따로 띄우므로 파일은 현재 프로세스에서 하나씩 처리합니다.
+
+    Returns:
+        BatchSummary: 파일별 결과와 처리량.
+    """
+    # 잘못된 옵션은 풀을 띄우기 전에 거부함 (워커에서 파일마다 실패로 기록되지 않도록)
+    _check_option_dict(options)
+    isolated = timeout is not None or memory_limit is not None
+    if isolated and options.get("page_workers", 1) > 1:
+        raise ValueError("timeout and memory_limit cannot be combined with page_workers > 1")
+
+    if instrument is not None:
+        options = {**options, "stats": True}
+    # 작업 목록은 생성기일 수 있으므로 (입력 탐색 등) 한꺼번에 읽지 않고 워커에 넘기는 대로 읽음
+    tasks = ((str(src), str(dst), options, share_memo) for src, dst in jobs)
+    summary = BatchSummary()
+    start = time.perf_counter()
+
+    def collect(results: Iterable[CenterResult]):
+        for result in results:
+            summary.results.append(result)
+            if instrument is not None:
+                instrument.emit(result.stats)
+            if on_result is not None:
+                on_result(result)
+
+    if isolated:
+        # on_result가 예외를 던져도 풀을 바로 닫음 (종료 중 가비지 수집에 맡기면 멈출 수 있음)
+        with contextlib.closing(_isolated(tasks, workers, timeout, memory_limit)) as results:
+            collect(results)
+    # 데몬 풀 워커는 자식 프로세스를 만들 수 없으므로 페이지 병렬화와 함께 쓰지 않음
+    elif workers == 1 or options.get("page_workers", 1) > 1:
+        collect(map(center_one, tasks))
+    else:
+        head = list(itertools.islice(tasks, 2))
+        if len(head) <= 1:
+            collect(map(center_one, head))  # 파일 하나를 위해 프로세스 풀을 띄우지 않음
+        else:
+            with multiprocessing.Pool(processes=workers) as pool:
+                collect(pool.imap_unordered(center_one, itertools.chain(head, tasks),
+                                            chunksize=max(1, chunksize)))
+
+    summary.elapsed = time.perf_counter() - start
+    summary.peak_rss = peak_rss_bytes()
+    return summary
+
+
+def _isolated(tasks: Iterator[Tuple[str, str, dict, bool]], workers: Optional[int],
+              timeout: Optional[float], memory_limit: Optional[int]) -> Iterator[CenterResult]:
+    """Run *tasks* on a :class:`WarmPool` and yield the results in completion order.
+
+    *tasks* is read on a separate thread while results are yielded, so a
+    slow job source (a directory walk) does not hold up finished files.
+    """
+    # 파일 하나를 위해 워커를 여럿 띄우지 않도록 둘째 작업까지만 미리 읽음
+    head = list(itertools.islice(tasks, 2))
+    workers = (workers or os.cpu_count() or 1) if len(head) > 1 else 1
+    results = queue.Queue()
+    pool = WarmPool(workers, timeout=timeout, memory_limit=memory_limit)
+    stop = threading.Event()
+    submitted = 0
+    error = None
+
+    def feed():
+        nonlocal submitted, error
+        try:
+            for src, dst, options, share_memo in itertools.chain(head, tasks):
+                if stop.is_set():
+                    break
+                pool.submit(submitted, src, dst, results.put, share_memo=share_memo, **options)
+                submitted += 1
+        except Exception as e:
+            error = e
+        finally:
+            results.put(None)  # 더 넘길 작업이 없음
+
+    feeder = threading.Thread(target=feed, name="center-batch-feed", daemon=True)
+    feeder.start()
+    fed = False
+    received = 0
+    try:
+        while not fed or received < submitted:
+            try:
+                item = results.get(timeout=0.5)
+            except queue.Empty:
+                pool.progress()  # 아무도 읽지 않는 페이지 진행이 쌓이지 않도록 비움
+                continue
+            if item is None:
+                fed = True
+            else:
+                received += 1
+                yield item[1]
+        if error is not None:
+            raise error
+    finally:
+        stop.set()
+        feeder.join()
+        pool.close()
+
+
+# WarmPool 워커 프로세스의 취소 이벤트와 진행 큐 (워커 시작 시 설정)
+_warm_cancel = None
+_warm_progress = None
+
+# 워커가 진행 큐에 페이지 진행을 넣는 최소 간격(초)
+PROGRESS_INTERVAL = 0.1
+
+# WarmPool 관리 스레드가 새 작업과 명령을 확인하는 간격(초)
+_DISPATCH_INTERVAL = 0.05
+
+# 준비를 마치기 전에 죽은 워커를 다시 띄우기까지의 최대 대기 시간(초). 연속으로 실패할수록 두 배씩 늘림
+_MAX_RESPAWN_DELAY = 30.0
+
+# 워커가 이만큼 연속으로 시작에 실패하면 대기 중인 작업을 실패로 돌려줌 (메모리 한도가 너무 작은 경우 등)
+_MAX_STARTUP_FAILURES = 5
+
+
+def _limit_memory(limit: int):
+    """Cap this process's address space at *limit* bytes, where ``resource`` exists."""
+    try:
+        import resource
+    except ImportError:
+        return  # Windows: 제한하지 않음
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _init_warm_worker(cancel, progress, memory_limit: Optional[int] = None):
+    global _warm_cancel, _warm_progress
+    _warm_cancel, _warm_progress = cancel, progress
+    from center_pdf import warm_up
+
+    warm_up()
+    # 무거운 모듈을 불러온 뒤에 제한해야 한도가 변환에 쓰는 메모리에만 걸림
+    if memory_limit:
+        _limit_memory(memory_limit)
+
+
+def _run_warm_job(item: Tuple[int, Tuple[PathLike, PathLike, dict, bool]]) -> Tuple[int, CenterResult]:
+    job_id, (input_path, output_path, options, share_memo) = item
+    last = 0.0
+
+    def report(done: int, total: int):
+        nonlocal last
+        now = time.perf_counter()
+        if done == total or now - last >= PROGRESS_INTERVAL:
+            last = now
+            _warm_progress.put((job_id, done, total))
+
+    options = {**options, "progress": report, "cancel": _warm_cancel}
+    return job_id, center_one((input_path, output_path, options, share_memo))
+
+
+def _warm_worker(conn, cancel, progress, memory_limit: Optional[int]):
+    """Worker process: run the jobs received on *conn* one at a time, sending back each result."""
+    _init_warm_worker(cancel, progress, memory_limit)
+    try:
+        conn.send(None)  # 준비 완료: 시간 한도는 이때부터 받은 작업에만 적용
+        while True:
+            item = conn.recv()
+            if item is None:
+                return
+            job_id, result = _run_warm_job(item)
+            conn.send((job_id, result))
+            if not result.ok and not result.cancelled:
+                # 실패한 파일이 프로세스를 망가뜨렸을 수 있으므로 (MemoryError 등) 새 워커로 교체
+                return
+    except (EOFError, OSError):
+        return  # 부모 프로세스가 끝남
+
+
+class _WarmSlot:
+    """One worker process of a :class:`WarmPool` and the job it is running."""
+
+    __slots__ = ("process", "conn", "ready", "warmed", "job", "callback", "started", "respawn_at")
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.ready = False
+        self.warmed = False  # 한 번이라도 준비를 마쳤는지
+        self.job = None
+        self.callback = None
+        self.started = 0.0
+        self.respawn_at = 0.0  # 0이 아니면 시작에 실패한 워커: 이 시각에 새로 띄움
+
+
+class WarmPool:
+    """Isolated worker processes kept alive across batches, with page progress and cancellation.
+
+    Each worker is a process of *context* ("spawn" by default, which is safe
+    in a process that already runs GUI threads) that imports numpy,
+    pdfplumber and PyPDF2 once at start and then runs one job at a time.
+    Jobs are submitted one by one with :meth:`submit`; their results arrive
+    through the callback, on the pool's dispatcher thread, in completion order.
+
+    A job that runs longer than *timeout* seconds, or whose worker dies
+    (a crash, or an allocation beyond *memory_limit* bytes of address
+    space), gets a failed :class:`CenterResult` with the reason; the worker
+    is killed and replaced, and the other jobs carry on. A worker whose job
+    failed is replaced as well.
+
+    :meth:`cancel` sets an event every worker checks between pages, so
+    running jobs end with a cancelled :class:`CenterResult` within a page.
+    :meth:`terminate` kills the workers (for a job stuck inside one page)
+    and starts fresh ones. Jobs it (or :meth:`close`) stops, running or
+    still queued, get a cancelled result and their partial outputs are
+    removed. A worker that dies while starting up is respawned after a
+    growing delay; after repeated failures queued jobs fail with the reason.
+    """
+
+    def __init__(self, workers: Optional[int] = None, context: str = "spawn",
+                 timeout: Optional[float] = None, memory_limit: Optional[int] = None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self._ctx = multiprocessing.get_context(context)
+        self._cancel = self._ctx.Event()
+        self._progress = self._ctx.Queue()
+        # (작업 번호, 작업, 콜백)
+        self._jobs = queue.Queue()
+        # ("terminate" 또는 "close", 처리가 끝나면 설정할 이벤트)
+        self._commands = queue.Queue()
+        self._slots = [self._spawn() for _ in range(self.workers)]
+        self._startup_failures = 0
+        self._thread = threading.Thread(target=self._dispatch, name="warm-pool", daemon=True)
+        self._thread.start()
+
+    def _spawn(self) -> _WarmSlot:
+        conn, child = self._ctx.Pipe()
+        process = self._ctx.Process(target=_warm_worker, name="warm-pool-worker", daemon=True,
+                                    args=(child, self._cancel, self._progress, self.memory_limit))
+        process.start()
+        child.close()
+        return _WarmSlot(process, conn)
+
+    def submit(self, job_id: int, input_path: PathLike, output_path: PathLike,
+               callback: Callable[[Tuple[int, CenterResult]], None], share_memo: bool = False,
+               **options):
+        """Queue one file; *callback* gets (job_id, CenterResult) on the dispatcher thread when it is done."""
+        job = (job_id, (str(input_path), str(output_path), options, share_memo))
+        self._jobs.put((job_id, job, callback))
+
+    def progress(self) -> List[Tuple[int, int, int]]:
+        """Return the (job_id, pages done, total pages) reports received since the last call."""
+        events = []
+        while True:
+            try:
+                events.append(self._progress.get_nowait())
+            except queue.Empty:
+                return events
+
+    def cancel(self):
+        """Ask running jobs to stop after their current page."""
+        self._cancel.set()
+
+    def reset(self):
+        """Clear the cancellation and stale progress before a new batch."""
+        self._cancel.clear()
+        self.progress()
+
+    def terminate(self):
+        """Kill all workers at once, drop queued jobs and start a fresh (warming up) set."""
+        self._command("terminate")
+
+    def close(self):
+        self._command("close")
+        self._thread.join()
+
+    def _command(self, name: str):
+        done = threading.Event()
+        self._commands.put((name, done))
+        done.wait()
+
+    def _dispatch(self):
+        """Dispatcher thread: hand out jobs, collect results and replace dead or overdue workers."""
+        while True:
+            try:
+                name, done = self._commands.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                now = time.perf_counter()
+                reason = "워커 풀을 닫아 중단했습니다" if name == "close" else "취소되어 워커를 종료했습니다"
+                for slot in self._slots:
+                    self._kill(slot)
+                    if slot.job is not None:
+                        self._fail(slot, now, reason, cancelled=True)
+                self._drain_jobs(reason, cancelled=True)
+                self._startup_failures = 0
+                if name == "close":
+                    done.set()
+                    return
+                self._cancel.clear()
+                self._slots = [self._spawn() for _ in range(self.workers)]
+                done.set()
+
+            now = time.perf_counter()
+            for i, slot in enumerate(self._slots):
+                if slot.respawn_at and now >= slot.respawn_at:
+                    self._slots[i] = self._spawn()
+            for slot in self._slots:
+                if slot.ready and slot.job is None:
+                    self._start_job(slot)
+
+            alive = [slot for slot in self._slots if not slot.respawn_at]
+            wait_for = [slot.process.sentinel for slot in alive]
+            wait_for += [slot.conn for slot in alive if slot.job is not None or not slot.ready]
+            multiprocessing.connection.wait(wait_for, self._wait_time())
+
+            now = time.perf_counter()
+            for i, slot in enumerate(self._slots):
+                if slot.respawn_at:
+                    continue
+                if (slot.job is not None or not slot.ready) and slot.conn.poll():
+                    try:
+                        message = slot.conn.recv()
+                    except (EOFError, OSError):
+                        pass  # 결과를 보내기 전에 죽음: 아래에서 처리
+                    else:
+                        if message is None:
+                            slot.ready = slot.warmed = True
+                            self._startup_failures = 0
+                        else:
+                            result = message[1]
+                            if not result.ok and not result.cancelled:
+                                slot.ready = False  # 실패 뒤에는 워커가 스스로 종료하므로 새 작업을 주지 않음
+                            self._finish(slot, result)
+                if not slot.process.is_alive():
+                    slot.process.join()
+                    slot.conn.close()
+                    if slot.job is not None:
+                        self._fail(slot, now, _exit_reason(slot.process.exitcode, self.memory_limit))
+                    if slot.warmed:
+                        self._slots[i] = self._spawn()
+                    else:
+                        self._startup_failed(slot, now)
+                elif (slot.job is not None and self.timeout is not None
+                      and now - slot.started > self.timeout):
+                    self._kill(slot)
+                    self._fail(slot, now, f"시간 초과: {self.timeout:g}초 안에 끝나지 않아 중단했습니다")
+                    self._slots[i] = self._spawn()
+
+    def _start_job(self, slot: _WarmSlot):
+        try:
+            job_id, job, callback = self._jobs.get_nowait()
+        except queue.Empty:
+            return
+        slot.job, slot.callback, slot.started = job, callback, time.perf_counter()
+        try:
+            slot.conn.send(job)
+        except OSError:
+            pass  # 워커가 이미 죽음: 다음 확인에서 실패로 처리하고 교체
+
+    def _startup_failed(self, slot: _WarmSlot, now: float):
+        """Schedule a respawn for *slot*, whose worker died before it was ready."""
+        self._startup_failures += 1
+        slot.respawn_at = now + min(_MAX_RESPAWN_DELAY, _DISPATCH_INTERVAL * 2 ** self._startup_failures)
+        if self._startup_failures >= _MAX_STARTUP_FAILURES:
+            reason = _exit_reason(slot.process.exitcode, self.memory_limit)
+            self._drain_jobs(f"워커 프로세스를 시작하지 못했습니다 ({self._startup_failures}번 연속). {reason}")
+
+    def _wait_time(self) -> float:
+        wait = _DISPATCH_INTERVAL
+        now = time.perf_counter()
+        for slot in self._slots:
+            if slot.respawn_at:
+                wait = min(wait, max(0.0, slot.respawn_at - now))
+            elif slot.job is not None and self.timeout is not None:
+                wait = min(wait, max(0.0, slot.started + self.timeout - now))
+        return wait
+
+    def _finish(self, slot: _WarmSlot, result: CenterResult):
+        job, callback = slot.job, slot.callback
+        slot.job = slot.callback = None
+        callback((job[0], result))
+
+    def _fail(self, slot: _WarmSlot, now: float, reason: str, cancelled: bool = False):
+        """Finish the job of *slot*, whose worker was killed or died, and remove its partial output."""
+        from center_pdf import _partial_outputs
+
+        _, (input_path, output_path, _, _) = slot.job
+        for partial in _partial_outputs(Path(output_path)):
+            partial.unlink(missing_ok=True)
+        self._finish(slot, CenterResult(input_path, output_path, False, seconds=now - slot.started,
+                                        error=reason, cancelled=cancelled))
+
+    @staticmethod
+    def _kill(slot: _WarmSlot):
+        if slot.process.is_alive():
+            slot.process.kill()
+        slot.process.join()
+        slot.conn.close()
+
+    def _drain_jobs(self, reason: str, cancelled: bool = False):
+        """Drop the queued jobs, giving each callback a failed (or cancelled) result."""
+        while True:
+            try:
+                job_id, (_, (input_path, output_path, _, _)), callback = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            callback((job_id, CenterResult(input_path, output_path, False, error=reason,
+                                           cancelled=cancelled)))
+
+
+def _exit_reason(exitcode: Optional[int], memory_limit: Optional[int]) -> str:
+    """Describe why a worker process ended with *exitcode* while running a job."""
+    if exitcode is not None and exitcode < 0:
+        try:
+            code = signal.Signals(-exitcode).name
+        except ValueError:
+            code = str(exitcode)
+    else:
+        code = str(exitcode)
+    reason = f"워커 프로세스가 비정상 종료되었습니다 ({code})"
+    if memory_limit:
+        reason += f". 메모리 한도 {memory_limit / (1 << 20):.0f} MB를 넘었을 수 있습니다"
+    return reason
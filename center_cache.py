@@ -0,0 +1,182 @@
+"""center_cache.py
+
+Content-addressed on-disk cache of centered PDFs.
+
+Entries are keyed by SHA-256 of the input bytes plus the centering
+parameters (threshold, margin, engine, outlier_pct), so re-running the same
+folder skips parse, analysis and write for unchanged inputs. The cache
+directory is bounded by size; the least recently used entries are evicted
+first (an entry's mtime is bumped on every hit).
+
+Layout:
+    <root>/<key[:2]>/<key>.pdf    centered output
+    <root>/<key[:2]>/<key>.json   {"pages": n}
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Optional, Union
+
+# 캐시 저장 형식이 바뀔 때 올림. 센터링 알고리즘의 변경은 center_pdf.ALGORITHM_VERSION이
+# 캐시 키에 들어가므로 여기서 따로 올리지 않음
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 1 << 30  # 1 GiB
+
+_HASH_CHUNK = 1 << 20
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory for this platform."""
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "centerframe-pdf"
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """Return the hex SHA-256 of the file at *path*, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Size-bounded LRU cache of centered outputs, safe to share between processes."""
+
+    def __init__(
+        self,
+        root: Union[str, Path, None] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        link: bool = False,
+    ):
+        """
+        Args:
+            root: 캐시 폴더. None이면 :func:`default_cache_dir`.
+            max_bytes: 캐시 전체 크기 상한. 넘으면 오래 쓰지 않은 항목부터 삭제합니다.
+            link: True면 적중 시 복사 대신 하드링크를 만듭니다 (같은 파일시스템일 때).
+                출력 파일을 직접 수정하면 캐시 항목도 바뀌므로 주의하세요.
+        """
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, input_path: Union[str, Path], params: dict) -> str:
+        """Return the cache key for *input_path* centered with *params*."""
+        header = {"version": CACHE_VERSION, "input": file_sha256(input_path), **params}
+        return hashlib.sha256(json.dumps(header, sort_keys=True).encode()).hexdigest()
+
+    def _paths(self, key: str):
+        folder = self.root / key[:2]
+        return folder / f"{key}.pdf", folder / f"{key}.json"
+
+    def fetch(self, key: str, output_path: Union[str, Path]) -> Optional[int]:
+        """Materialize the cached output for *key* at *output_path*.
+
+        Returns the page count on a hit, None on a miss.
+        """
+        pdf_path, meta_path = self._paths(key)
+        try:
+            pages = json.loads(meta_path.read_text())["pages"]
+            output_p = Path(output_path)
+            output_p.parent.mkdir(parents=True, exist_ok=True)
+            self._materialize(pdf_path, output_p)
+            os.utime(pdf_path)  # LRU 순서 갱신
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pages
+
+    def _materialize(self, pdf_path: Path, output_p: Path):
+        """Put *pdf_path* at *output_p* through a temporary file, so an interruption
+        never leaves a truncated output that would later look complete."""
+        # center_pdf._open_sink와 같은 임시 파일 이름: 강제 종료된 워커가 남긴 파일도 함께 정리됨
+        tmp = output_p.with_name(f".{output_p.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            linked = False
+            if self.link:
+                try:
+                    os.link(pdf_path, tmp)
+                    linked = True
+                except OSError:
+                    pass  # 다른 파일시스템 등: 복사로 대체
+            if not linked:
+                shutil.copyfile(pdf_path, tmp)
+            os.replace(tmp, output_p)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def store(self, key: str, output_path: Union[str, Path], pages: int):
+        """Copy a freshly produced *output_path* into the cache under *key*."""
+        pdf_path, meta_path = self._paths(key)
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 다른 프로세스가 같은 항목을 동시에 쓰더라도 반쯤 쓴 파일이 보이지 않도록
+        # 임시 파일에 쓴 뒤 rename 하고, 메타데이터를 마지막에 기록
+        fd, tmp = tempfile.mkstemp(dir=pdf_path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(output_path, tmp)
+            os.replace(tmp, pdf_path)
+            fd, tmp = tempfile.mkstemp(dir=pdf_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"pages": pages}, f)
+            os.replace(tmp, meta_path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        self.evict()
+
+    def size(self) -> int:
+        """Return the total size in bytes of all cached outputs."""
+        return sum(p.stat().st_size for p in self.root.glob("*/*.pdf"))
+
+    def evict(self, max_bytes: Optional[int] = None):
+        """Delete least recently used entries until the cache fits *max_bytes*."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = []
+        for pdf_path in self.root.glob("*/*.pdf"):
+            try:
+                st = pdf_path.stat()
+            except FileNotFoundError:
+                continue  # 다른 프로세스가 먼저 삭제함
+            entries.append((st.st_mtime, st.st_size, pdf_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, pdf_path in sorted(entries):
+            if total <= limit:
+                break
+            for path in (pdf_path.with_suffix(".json"), pdf_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+    def clear(self):
+        """Remove every cached entry."""
+        self.evict(0)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters of this instance."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
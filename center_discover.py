@@ -0,0 +1,151 @@
+"""center_discover.py
+
+Input discovery for the ``center_pdf`` command line.
+
+:func:`discover` walks an input root with ``os.scandir`` and yields
+(input, output) pairs as it finds them, so the first conversion starts
+after one directory listing instead of the whole tree (which matters on
+network shares). Directory entries come with their file type, so the walk
+needs no ``stat`` per entry beyond the one that compares the input with
+its output.
+
+With an output root the relative directory structure is kept under it;
+without one each output is written next to its input with a prefix. An
+output that exists, is not empty and is no older than its input is
+considered up to date and skipped.
+"""
+
+import fnmatch
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+DEFAULT_INCLUDE = ("*.pdf",)
+
+# 출력 폴더를 따로 지정하지 않았을 때 입력 파일 옆에 저장하는 결과 파일의 접두사
+DEFAULT_PREFIX = "centered_"
+
+
+@dataclass
+class DiscoveryReport:
+    """What :func:`discover` found; filled in while its generator is consumed."""
+
+    found: int = 0
+    skipped: int = 0  # 출력이 최신이라 건너뛴 파일
+    errors: int = 0  # 읽지 못한 폴더
+
+    def __str__(self) -> str:
+        text = f"발견 {self.found}개, 최신이라 건너뜀 {self.skipped}개"
+        if self.errors:
+            text += f", 읽지 못한 폴더 {self.errors}개"
+        return text
+
+
+def _matches(relative: str, name: str, patterns: Iterable[str]) -> bool:
+    # "/"가 들어간 패턴은 입력 폴더 기준 상대 경로에, 나머지는 이름에 맞춰 봄
+    return any(fnmatch.fnmatch(relative if "/" in pattern else name, pattern) for pattern in patterns)
+
+
+def output_up_to_date(input_path: Union[PathLike, os.DirEntry], output_path: PathLike) -> bool:
+    """Return True if *output_path* exists, is not empty and is no older than *input_path*.
+
+    Outputs are written to a temporary file and renamed, so an output that
+    exists is complete; this is the check :func:`discover` skips files by.
+    *input_path* may be an ``os.DirEntry``, whose cached stat is reused.
+    """
+    try:
+        output = os.stat(output_path)
+        if output.st_size == 0:
+            return False
+        source = input_path.stat() if isinstance(input_path, os.DirEntry) else os.stat(input_path)
+        return output.st_mtime >= source.st_mtime
+    except OSError:
+        return False
+
+
+def discover(
+    input_root: PathLike,
+    output_root: Optional[PathLike] = None,
+    *,
+    include: Iterable[str] = DEFAULT_INCLUDE,
+    exclude: Iterable[str] = (),
+    recursive: bool = False,
+    prefix: str = DEFAULT_PREFIX,
+    skip_up_to_date: bool = True,
+    report: Optional[DiscoveryReport] = None,
+    on_error: Optional[Callable[[OSError], None]] = None,
+) -> Iterator[Tuple[Path, Path]]:
+    """
+    입력 폴더에서 변환할 PDF를 찾는 대로 (입력 경로, 출력 경로) 쌍을 내놓습니다.
+
+    Args:
+        input_root: PDF 파일이 있는 폴더.
+        output_root: 결과를 저장할 폴더. 입력 폴더 기준 상대 경로를 그대로 유지합니다.
+            None이면 입력 파일 옆에 prefix를 붙인 이름으로 저장하고, prefix로 시작하는
+            파일(이전 실행의 결과)은 입력으로 쓰지 않습니다.
+        include: 변환할 파일의 글롭 패턴. "/"가 들어간 패턴은 입력 폴더 기준 상대 경로
+            ("/" 구분)에, 나머지는 파일 이름에 맞춰 봅니다.
+        exclude: 제외할 파일이나 폴더의 글롭 패턴 (include와 같은 규칙).
+            패턴에 맞는 폴더는 하위 폴더까지 탐색하지 않습니다.
+        recursive: 하위 폴더까지 탐색합니다. 폴더 안에서는 이름 순서로, 파일을 먼저
+            내놓고 하위 폴더로 내려갑니다. 심볼릭 링크 폴더는 따라가지 않습니다.
+        prefix: output_root가 None일 때 결과 파일 이름의 접두사.
+        skip_up_to_date: 출력 파일이 있고 비어 있지 않으며 입력보다 오래되지 않았으면
+            건너뜁니다.
+        report: 지정하면 찾은 파일, 건너뛴 파일, 읽지 못한 폴더 수를 더합니다.
+        on_error: 폴더를 읽지 못했을 때 OSError와 함께 호출됩니다. 그 폴더는 건너뜁니다.
+
+    Yields:
+        (입력 경로, 출력 경로): 출력 폴더는 아직 없을 수 있습니다.
+    """
+    report = report if report is not None else DiscoveryReport()
+    include, exclude = tuple(include), tuple(exclude)
+    output_abs = os.path.abspath(output_root) if output_root is not None else None
+
+    # (폴더 경로, 입력 폴더 기준 상대 경로)
+    stack: List[Tuple[str, str]] = [(os.fspath(input_root), "")]
+    while stack:
+        directory, relative_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            report.errors += 1
+            if on_error is not None:
+                on_error(e)
+            continue
+
+        subdirs = []
+        for entry in entries:
+            relative = f"{relative_dir}{entry.name}"
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if is_dir:
+                # 출력 폴더가 입력 폴더 안에 있으면 결과를 다시 입력으로 쓰지 않도록 건너뜀
+                if (recursive and os.path.abspath(entry.path) != output_abs
+                        and not _matches(relative, entry.name, exclude)):
+                    subdirs.append((entry.path, f"{relative}/"))
+                continue
+            if not is_file or not _matches(relative, entry.name, include) or _matches(
+                    relative, entry.name, exclude):
+                continue
+            if output_root is None:
+                if entry.name.startswith(prefix):
+                    continue
+                output_path = os.path.join(directory, f"{prefix}{entry.name}")
+            else:
+                output_path = os.path.join(output_root, *relative.split("/"))
+
+            report.found += 1
+            if skip_up_to_date and output_up_to_date(entry, output_path):
+                report.skipped += 1
+                continue
+            yield Path(entry.path), Path(output_path)
+        # 스택이므로 거꾸로 넣어야 이름 순서대로 탐색함
+        stack.extend(reversed(subdirs))
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""center_jobs.py
+
+Resumable job queue for large batch runs, stored in one SQLite file.
+
+Every (input, output) pair is a row holding its state (pending, running,
+done, failed), number of attempts, the worker that claimed it, timings,
+page count, error and the SHA-256 of the written output. Runners claim
+jobs in a transaction (``BEGIN IMMEDIATE``), so several processes, or
+several machines sharing the database file, never take the same job. A
+claimed job carries a heartbeat that its runner refreshes; if the runner
+dies, the job is claimed again once the heartbeat is older than the lease.
+
+Adding the same input again is a no-op, so re-running a batch against the
+same database only converts jobs that are pending, failed (up to
+``max_attempts`` times in total) or abandoned by a dead runner.
+
+The database keeps SQLite's default rollback journal rather than WAL,
+which does not work on network filesystems. Relative paths are stored as
+given, so every runner must start from the same working directory.
+
+Usage:
+    uv run center_pdf.py --queue jobs.sqlite     # add pdfs/ and run the queue
+    uv run center_jobs.py jobs.sqlite run -j 8   # another runner on the same queue
+    uv run center_jobs.py jobs.sqlite status     # counts and failed files
+    uv run center_jobs.py jobs.sqlite retry      # failed jobs back to pending
+"""
+
+import argparse
+import itertools
+import os
+import queue
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from center_batch import BatchSummary, CenterResult, WarmPool, peak_rss_bytes
+from center_cache import file_sha256
+from center_metrics import Instrumentation
+from center_pdf import (DEFAULT_ENGINE, DEFAULT_TRANSFORM, ENGINES, RASTER_DPI, RASTER_TOLERANCE,
+                        SHIFT_THRESHOLD, TRANSFORM_MODES, _check_option_dict)
+from page_fingerprint import REUSE_MODES
+
+PathLike = Union[str, Path]
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+JOB_STATES = (PENDING, RUNNING, DONE, FAILED)
+
+_STATE_NAMES = {PENDING: "대기", RUNNING: "실행 중", DONE: "완료", FAILED: "실패"}
+
+# 러너가 하트비트를 갱신하지 않은 채 이 시간(초)이 지나면 죽은 것으로 보고 작업을 다시 나눔
+DEFAULT_LEASE = 120.0
+
+DEFAULT_MAX_ATTEMPTS = 3
+
+# 다른 프로세스가 쓰기 잠금을 쥐고 있을 때 기다리는 최대 시간(초)
+_BUSY_TIMEOUT = 60.0
+
+# 결과를 기다리며 대기열을 다시 확인하는 간격(초)
+_POLL_INTERVAL = 0.5
+
+# add()가 트랜잭션 하나에 넣는 최대 작업 수. 쓰기 잠금을 짧게 쥐어 다른 러너의 claim이 기다리지 않게 함
+_ADD_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    input_path TEXT NOT NULL UNIQUE,
+    output_path TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    added_at REAL NOT NULL,
+    started_at REAL,
+    heartbeat REAL,
+    finished_at REAL,
+    seconds REAL,
+    pages INTEGER,
+    output_sha256 TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, id);
+"""
+
+
+@dataclass
+class Job:
+    """One row of the queue."""
+
+    id: int
+    input_path: str
+    output_path: str
+    state: str
+    attempts: int
+    worker: Optional[str]
+    added_at: float
+    started_at: Optional[float]
+    heartbeat: Optional[float]
+    finished_at: Optional[float]
+    seconds: Optional[float]
+    pages: Optional[int]
+    output_sha256: Optional[str]
+    error: Optional[str]
+
+
+def default_worker_id() -> str:
+    """Return "host:pid", which tells runners on different machines apart."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """SQLite-backed queue of centering jobs; open one per process (or thread)."""
+
+    def __init__(self, path: PathLike, *, lease: float = DEFAULT_LEASE,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Args:
+            path: 데이터베이스 파일 경로. 없으면 새로 만듭니다.
+            lease: 러너의 하트비트가 이 시간(초)보다 오래되면 그 러너가 잡은 작업을
+                다른 러너가 다시 가져갑니다.
+            max_attempts: 작업 하나를 시도할 최대 횟수. 이만큼 실패한 작업은
+                :meth:`retry` 로 되돌리기 전까지 다시 시도하지 않습니다.
+        """
+        if lease <= 0:
+            raise ValueError("lease must be positive")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.path = Path(path)
+        self.lease = lease
+        self.max_attempts = max_attempts
+        # 트랜잭션은 직접 BEGIN으로 시작함 (자동 커밋 모드)
+        self._db = sqlite3.connect(str(self.path), timeout=_BUSY_TIMEOUT, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+
+    def add(self, jobs: Iterable[Tuple[PathLike, PathLike]], reset: bool = False) -> int:
+        """Add (input, output) pairs as pending jobs; return how many were new or reset.
+
+        An input already in the queue keeps its row, state and output path,
+        unless *reset* puts a done or failed one back to pending with the given
+        output path and its attempts cleared (running jobs are left alone).
+        *jobs* is read lazily and added in batches of at most ``_ADD_BATCH``,
+        each in its own transaction, so a long discovery never holds the write
+        lock and other runners can claim the jobs already added.
+        """
+        jobs = iter(jobs)
+        added = 0
+        while True:
+            batch = [(str(src), str(dst)) for src, dst in itertools.islice(jobs, _ADD_BATCH)]
+            if not batch:
+                return added
+            now = time.time()
+            with self._transaction():
+                before = self._db.total_changes
+                if reset:
+                    # 새 행을 넣기 전에 갱신해야 새로 넣은 행을 두 번 세지 않음
+                    self._db.executemany(
+                        "UPDATE jobs SET state = ?, output_path = ?, attempts = 0, worker = NULL, "
+                        "heartbeat = NULL, error = NULL WHERE input_path = ? AND state IN (?, ?)",
+                        ((PENDING, dst, src, DONE, FAILED) for src, dst in batch))
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO jobs (input_path, output_path, added_at) VALUES (?, ?, ?)",
+                    ((src, dst, now) for src, dst in batch))
+                added += self._db.total_changes - before
+
+    def claim(self, worker: str, limit: int = 1) -> List[Job]:
+        """Mark up to *limit* runnable jobs as running by *worker* and return them.
+
+        Runnable jobs are pending ones and running ones whose heartbeat is
+        older than the lease; the latter fail instead once they have used up
+        their attempts.
+        """
+        now = time.time()
+        with self._transaction():
+            self._db.execute(
+                "UPDATE jobs SET state = ?, finished_at = ?, error = ? "
+                "WHERE state = ? AND heartbeat < ? AND attempts >= ?",
+                (FAILED, now, "러너가 응답하지 않아 중단되었습니다", RUNNING, now - self.lease,
+                 self.max_attempts))
+            rows = self._db.execute(
+                "SELECT id FROM jobs WHERE state = ? OR (state = ? AND heartbeat < ?) "
+                "ORDER BY id LIMIT ?",
+                (PENDING, RUNNING, now - self.lease, max(0, limit))).fetchall()
+            ids = [row["id"] for row in rows]
+            self._db.executemany(
+                "UPDATE jobs SET state = ?, worker = ?, attempts = attempts + 1, started_at = ?, "
+                "heartbeat = ?, finished_at = NULL, error = NULL WHERE id = ?",
+                ((RUNNING, worker, now, now, job_id) for job_id in ids))
+            return [self._job(job_id) for job_id in ids]
+
+    def heartbeat(self, worker: str, job_ids: Iterable[int]):
+        """Tell other runners that *worker* is still converting *job_ids*."""
+        now = time.time()
+        with self._transaction():
+            self._db.executemany(
+                "UPDATE jobs SET heartbeat = ? WHERE id = ? AND state = ? AND worker = ?",
+                ((now, job_id, RUNNING, worker) for job_id in job_ids))
+
+    def finish(self, worker: str, job_id: int, result: CenterResult, output_sha256: Optional[str] = None):
+        """Record *result* for a job claimed by *worker*.
+
+        A cancelled job goes back to pending without using up an attempt.
+        Nothing is written if another runner has claimed the job since.
+        """
+        if result.cancelled:
+            self.release(worker, [job_id])
+            return
+        with self._transaction():
+            self._db.execute(
+                "UPDATE jobs SET state = ?, finished_at = ?, seconds = ?, pages = ?, "
+                "output_sha256 = ?, error = ? WHERE id = ? AND state = ? AND worker = ?",
+                (DONE if result.ok else FAILED, time.time(), result.seconds,
+                 result.pages if result.ok else None, output_sha256, result.error,
+                 job_id, RUNNING, worker))
+
+    def release(self, worker: str, job_ids: Iterable[int]):
+        """Put jobs claimed by *worker* back to pending, not counting the attempt."""
+        with self._transaction():
+            self._db.executemany(
+                "UPDATE jobs SET state = ?, attempts = attempts - 1, worker = NULL, heartbeat = NULL "
+                "WHERE id = ? AND state = ? AND worker = ?",
+                ((PENDING, job_id, RUNNING, worker) for job_id in job_ids))
+
+    def requeue_failed(self) -> int:
+        """Put failed jobs that have attempts left back to pending; return how many."""
+        with self._transaction():
+            return self._db.execute(
+                "UPDATE jobs SET state = ? WHERE state = ? AND attempts < ?",
+                (PENDING, FAILED, self.max_attempts)).rowcount
+
+    def retry(self) -> int:
+        """Put every failed job back to pending with its attempts reset; return how many."""
+        with self._transaction():
+            return self._db.execute(
+                "UPDATE jobs SET state = ?, attempts = 0 WHERE state = ?", (PENDING, FAILED)).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of jobs in each state."""
+        counts = dict.fromkeys(JOB_STATES, 0)
+        for row in self._db.execute("SELECT state, COUNT(*) AS n FROM jobs GROUP BY state"):
+            counts[row["state"]] = row["n"]
+        return counts
+
+    def summary(self) -> str:
+        """Return the job counts as one line."""
+        return ", ".join(f"{_STATE_NAMES[state]} {n}개" for state, n in self.counts().items())
+
+    def jobs(self, state: Optional[str] = None) -> Iterator[Job]:
+        """Yield the jobs (in *state*, if given) in the order they were added."""
+        if state is None:
+            rows = self._db.execute("SELECT * FROM jobs ORDER BY id")
+        else:
+            rows = self._db.execute("SELECT * FROM jobs WHERE state = ? ORDER BY id", (state,))
+        for row in rows:
+            yield Job(**row)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self) -> "JobQueue":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _job(self, job_id: int) -> Job:
+        return Job(**self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+
+    def _transaction(self):
+        return _Transaction(self._db)
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` (``ROLLBACK`` on error)."""
+
+    def __init__(self, db: sqlite3.Connection):
+        self._db = db
+
+    def __enter__(self):
+        # 읽기 전에 쓰기 잠금을 잡아, 두 러너가 같은 작업을 읽고 둘 다 가져가는 일이 없게 함
+        self._db.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, *exc):
+        self._db.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+        return False
+
+
+def run_queue(
+    job_queue: JobQueue,
+    jobs: Optional[Iterable[Tuple[PathLike, PathLike]]] = None,
+    *,
+    reset: bool = False,
+    workers: Optional[int] = None,
+    worker_id: Optional[str] = None,
+    share_memo: bool = False,
+    on_result: Optional[Callable[[CenterResult], None]] = None,
+    instrument: Optional[Instrumentation] = None,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    **options,
+) -> BatchSummary:
+    """
+    대기열에서 작업을 가져와 변환하고 결과를 기록합니다. 가져올 작업이 없으면 끝납니다.
+
+    Args:
+        job_queue: 작업을 가져올 :class:`JobQueue`.
+        jobs: 지정하면 별도 스레드에서 (입력, 출력) 쌍을 읽어 :meth:`JobQueue.add` 처럼
+            일정 개수씩 대기열에 추가하고, 추가된 작업부터 바로 변환합니다. 다 추가하기
+            전에는 가져올 작업이 없어도 끝나지 않습니다.
+        reset: jobs에 있는 입력 중 이미 완료되었거나 실패한 작업도 대기 상태로 되돌려
+            다시 변환합니다 (``--force``).
+        workers: 동시에 변환할 파일 수(워커 프로세스 수). None이면 CPU 코어 수.
+        worker_id: 이 러너의 이름. None이면 "호스트:pid".
+        share_memo: :func:`center_batch.center_batch` 와 동일.
+        on_result: 파일 하나가 끝날 때마다 (완료 순서대로) 호출됩니다.
+        instrument: 지정하면 파일별 단계 시간과 카운터를 훅으로 전달합니다.
+        timeout: 파일 하나에 허용할 시간(초). 넘기면 워커를 종료하고 실패로 기록합니다.
+        memory_limit: 워커 프로세스 하나의 주소 공간 한도(바이트).
+        **options: engine, outlier_pct, streaming, cache 등 :func:`center_pdf.center_pdf` 의
+            키워드 인자. page_workers는 지원하지 않습니다.
+
+    Returns:
+        BatchSummary: 이 러너가 처리한 파일별 결과와 처리량.
+
+    실행 도중 중단되면(KeyboardInterrupt 등) 진행 중이던 작업은 대기 상태로 되돌립니다.
+    """
+    _check_option_dict(options)
+    if options.get("page_workers", 1) > 1:
+        raise ValueError("page_workers > 1 is not supported by the job queue")
+    if instrument is not None:
+        options = {**options, "stats": True}
+    workers = max(1, workers or os.cpu_count() or 1)
+    worker_id = worker_id or default_worker_id()
+
+    job_queue.requeue_failed()
+    results = queue.Queue()
+    summary = BatchSummary()
+    start = time.perf_counter()
+    running: Dict[int, Job] = {}
+    last_beat = time.monotonic()
+    stop = threading.Event()
+    error = None
+
+    def feed():
+        nonlocal error
+        # SQLite 연결은 만든 스레드에서만 쓸 수 있으므로 같은 파일을 따로 엶
+        try:
+            with JobQueue(job_queue.path, lease=job_queue.lease,
+                          max_attempts=job_queue.max_attempts) as feed_queue:
+                it = iter(jobs)
+                while not stop.is_set():
+                    batch = list(itertools.islice(it, _ADD_BATCH))
+                    if not batch:
+                        break
+                    feed_queue.add(batch, reset=reset)
+        except Exception as e:
+            error = e
+
+    feeder = None
+    if jobs is not None:
+        feeder = threading.Thread(target=feed, name="center-jobs-feed", daemon=True)
+        feeder.start()
+    pool = WarmPool(workers, timeout=timeout, memory_limit=memory_limit)
+    try:
+        while True:
+            if error is not None:
+                raise error
+            # claim 전에 확인해야 마지막 묶음을 추가한 직후 끝내는 일이 없음
+            feeding = feeder is not None and feeder.is_alive()
+            if len(running) < workers:
+                for job in job_queue.claim(worker_id, workers - len(running)):
+                    running[job.id] = job
+                    pool.submit(job.id, job.input_path, job.output_path, results.put,
+                                share_memo=share_memo, **options)
+            if not running:
+                if not feeding:
+                    break
+                feeder.join(_POLL_INTERVAL)  # 다음 묶음을 기다림
+                continue
+
+            try:
+                job_id, result = results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                pool.progress()  # 아무도 읽지 않는 페이지 진행이 쌓이지 않도록 비움
+            else:
+                del running[job_id]
+                digest = None
+                if result.ok:
+                    try:
+                        digest = file_sha256(result.output_path)
+                    except OSError as e:
+                        result.ok, result.error = False, f"출력 파일을 읽을 수 없습니다: {e}"
+                job_queue.finish(worker_id, job_id, result, digest)
+                summary.results.append(result)
+                if instrument is not None:
+                    instrument.emit(result.stats)
+                if on_result is not None:
+                    on_result(result)
+
+            if running and time.monotonic() - last_beat > job_queue.lease / 4:
+                job_queue.heartbeat(worker_id, running)
+                last_beat = time.monotonic()
+    finally:
+        stop.set()
+        if feeder is not None:
+            feeder.join()
+        if running:
+            job_queue.release(worker_id, running)
+        pool.close()
+
+    summary.elapsed = time.perf_counter() - start
+    summary.peak_rss = peak_rss_bytes()
+    return summary
+
+
+def _print_status(job_queue: JobQueue):
+    print(job_queue.summary())
+    for job in job_queue.jobs(FAILED):
+        print(f"[실패] {job.input_path} ({job.attempts}회 시도): {job.error}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="SQLite 작업 대기열의 PDF를 중앙 정렬합니다.")
+    parser.add_argument("database", help="작업 대기열 데이터베이스 파일")
+    parser.add_argument("command", choices=("run", "status", "retry"),
+                        help="run: 남은 작업 처리, status: 상태별 개수와 실패 목록, "
+                             "retry: 실패한 작업을 시도 횟수와 함께 초기화")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="동시에 변환할 파일 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--lease", type=float, default=DEFAULT_LEASE,
+                        help="응답 없는 러너의 작업을 다시 가져가기까지의 시간, 초 (기본값: %(default)s)")
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help="작업 하나를 시도할 최대 횟수 (기본값: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=None, metavar="SEC",
+                        help="파일 하나에 허용할 시간. 넘기면 워커를 종료하고 실패로 기록")
+    parser.add_argument("--memory-limit", type=int, default=None, metavar="MB",
+                        help="워커 프로세스 하나의 메모리(주소 공간) 한도")
+    parser.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE)
+    parser.add_argument("--outlier-pct", type=float, default=0.0)
+    parser.add_argument("--raster-dpi", type=float, default=RASTER_DPI)
+    parser.add_argument("--raster-tolerance", type=int, default=RASTER_TOLERANCE)
+    parser.add_argument("--margin", type=float, default=0.0)
+    parser.add_argument("--threshold", type=float, default=SHIFT_THRESHOLD)
+    parser.add_argument("--reuse", choices=REUSE_MODES, default="off")
+    parser.add_argument("--streaming", action="store_true")
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--transform", choices=TRANSFORM_MODES, default=DEFAULT_TRANSFORM)
+    parser.add_argument("--dedupe", action="store_true")
+    args = parser.parse_args(argv)
+    if args.dedupe and (args.streaming or args.incremental):
+        parser.error("--dedupe는 --streaming, --incremental과 함께 쓸 수 없습니다.")
+
+    if args.command != "run" and not Path(args.database).is_file():
+        print(f"오류: '{args.database}' 파일을 찾을 수 없습니다.", file=sys.stderr)
+        return 1
+    try:
+        job_queue = JobQueue(args.database, lease=args.lease, max_attempts=args.max_attempts)
+    except (sqlite3.Error, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+    with job_queue:
+        if args.command == "status":
+            _print_status(job_queue)
+            return 0
+        if args.command == "retry":
+            print(f"실패한 작업 {job_queue.retry()}개를 대기 상태로 되돌렸습니다.")
+            return 0
+
+        print(f"'{args.database}': {job_queue.summary()}")
+        summary = run_queue(
+            job_queue, workers=args.workers, engine=args.engine, outlier_pct=args.outlier_pct,
+            margin=args.margin, threshold=args.threshold, raster_dpi=args.raster_dpi,
+            raster_tolerance=args.raster_tolerance, reuse=args.reuse, streaming=args.streaming,
+            incremental=args.incremental, transform=args.transform, dedupe=args.dedupe,
+            timeout=args.timeout,
+            memory_limit=args.memory_limit << 20 if args.memory_limit else None,
+            on_result=print)
+        print(summary)
+        print(f"'{args.database}': {job_queue.summary()}")
+        return 0 if summary.failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
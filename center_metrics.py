@@ -0,0 +1,309 @@
+"""center_metrics.py
+
+Optional structured instrumentation for ``center_pdf``.
+
+A :class:`FileRecorder` collects, for one input file, wall time per stage
+(``open``, ``pdfplumber_open``, ``extract``, ``bbox``, ``transform``,
+``write``, ...), per-page timings and object counts by type, bytes read and
+written, and whether each page's transform was applied. When the file is
+done the resulting :class:`FileStats` is handed to every hook of an
+:class:`Instrumentation`:
+
+    callback              any callable taking a FileStats
+    JsonLinesHook         one JSON object per file, appended to a stream or path
+    PrometheusHook        running totals rendered as Prometheus text (or written
+                          to a node_exporter textfile)
+
+Instrumentation is off unless asked for: the centering code then uses
+:data:`NULL_RECORDER`, whose ``enabled`` flag short-circuits the per-page
+bookkeeping and whose ``stage()`` returns a shared no-op context manager.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, TextIO, Union
+
+
+@dataclass
+class PageStats:
+    """Timings and counters of one page."""
+
+    index: int
+    stages: Dict[str, float] = field(default_factory=dict)
+    objects: Dict[str, int] = field(default_factory=dict)
+    applied: bool = False
+    tx: float = 0.0
+    ty: float = 0.0
+    reused: bool = False
+
+
+@dataclass
+class FileStats:
+    """Timings and counters of one input file."""
+
+    input_path: str
+    output_path: str
+    ok: bool = True
+    error: Optional[str] = None
+    cached: bool = False
+    pages: int = 0
+    transforms_applied: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    bytes_deduped: int = 0  # dedupe로 줄어든 출력 바이트 수
+    stages: Dict[str, float] = field(default_factory=dict)
+    objects: Dict[str, int] = field(default_factory=dict)
+    page_stats: List[PageStats] = field(default_factory=list)
+
+    @property
+    def seconds(self) -> float:
+        return sum(self.stages.values())
+
+    def summary(self) -> str:
+        """One-line human-readable digest, e.g. for a status bar."""
+        stages = " · ".join(f"{name} {sec:.2f}s" for name, sec in self.stages.items() if sec >= 0.005)
+        return (f"{self.pages}쪽, 이동 {self.transforms_applied}쪽, "
+                f"{self.bytes_read / 1024:.0f}→{self.bytes_written / 1024:.0f} KiB"
+                + (f" ({stages})" if stages else ""))
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class _Timer:
+    __slots__ = ("_target", "_name", "_start")
+
+    def __init__(self, target: Dict[str, float], name: str):
+        self._target = target
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._start
+        self._target[self._name] = self._target.get(self._name, 0.0) + elapsed
+        return False
+
+
+class _NullContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+class FileRecorder:
+    """Collects the stats of one file while it is being centered."""
+
+    enabled = True
+
+    def __init__(self, input_path: str = "", output_path: str = ""):
+        self.stats = FileStats(str(input_path), str(output_path))
+        self._pages: Dict[int, PageStats] = {}
+
+    def stage(self, name: str):
+        """Context manager adding the wall time of its body to file stage *name*."""
+        return _Timer(self.stats.stages, name)
+
+    def page(self, index: int) -> PageStats:
+        page = self._pages.get(index)
+        if page is None:
+            page = self._pages[index] = PageStats(index)
+        return page
+
+    def page_stage(self, index: int, name: str):
+        """Time page *index* stage *name*; the time is also added to the file stage."""
+        return _PageTimer(self.stats.stages, self.page(index).stages, name)
+
+    def count_objects(self, index: int, counts: Dict[str, int]):
+        self.page(index).objects.update(counts)
+        for kind, n in counts.items():
+            self.stats.objects[kind] = self.stats.objects.get(kind, 0) + n
+
+    def finish(self) -> FileStats:
+        self.stats.page_stats = [self._pages[i] for i in sorted(self._pages)]
+        self.stats.transforms_applied = sum(1 for p in self.stats.page_stats if p.applied)
+        return self.stats
+
+
+class _PageTimer:
+    __slots__ = ("_file", "_page", "_name", "_start")
+
+    def __init__(self, file_stages: Dict[str, float], page_stages: Dict[str, float], name: str):
+        self._file = file_stages
+        self._page = page_stages
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._start
+        self._page[self._name] = self._page.get(self._name, 0.0) + elapsed
+        self._file[self._name] = self._file.get(self._name, 0.0) + elapsed
+        return False
+
+
+class _NullRecorder:
+    """Recorder used when instrumentation is off; every call is a no-op."""
+
+    enabled = False
+    stats = None
+
+    def stage(self, name: str):
+        return _NULL_CONTEXT
+
+    def page_stage(self, index: int, name: str):
+        return _NULL_CONTEXT
+
+    def page(self, index: int):
+        return None
+
+    def count_objects(self, index: int, counts: Dict[str, int]):
+        pass
+
+    def finish(self):
+        return None
+
+
+NULL_RECORDER = _NullRecorder()
+
+Hook = Callable[[FileStats], None]
+
+
+class Instrumentation:
+    """Fan-out of finished :class:`FileStats` to hooks."""
+
+    def __init__(self, *hooks: Hook):
+        self.hooks: List[Hook] = list(hooks)
+
+    @contextmanager
+    def file(self, input_path, output_path):
+        """Yield a :class:`FileRecorder` and emit its stats when the block ends, even on error."""
+        recorder = FileRecorder(str(input_path), str(output_path))
+        try:
+            yield recorder
+        except Exception as e:
+            recorder.stats.ok = False
+            recorder.stats.error = str(e)
+            raise
+        finally:
+            self.emit(recorder.finish())
+
+    def emit(self, stats: Optional[FileStats]):
+        if stats is None:
+            return
+        for hook in self.hooks:
+            hook(stats)
+
+
+@contextmanager
+def recording(instrument: Optional[Instrumentation], input_path, output_path):
+    """``instrument.file(...)``, or :data:`NULL_RECORDER` when *instrument* is None."""
+    if instrument is None:
+        yield NULL_RECORDER
+        return
+    with instrument.file(input_path, output_path) as recorder:
+        yield recorder
+
+
+class JsonLinesHook:
+    """Append each file's stats as one JSON line to *target* (a path or text stream)."""
+
+    def __init__(self, target: Union[str, os.PathLike, TextIO], pages: bool = True):
+        """
+        Args:
+            target: 파일 경로 또는 텍스트 스트림.
+            pages: False면 페이지별 항목을 생략해 줄 길이를 줄입니다.
+        """
+        self._target = target
+        self._pages = pages
+        self._lock = threading.Lock()
+
+    def __call__(self, stats: FileStats):
+        data = stats.to_dict()
+        if not self._pages:
+            del data["page_stats"]
+        line = json.dumps(data, ensure_ascii=False) + "\n"
+        with self._lock:
+            if hasattr(self._target, "write"):
+                self._target.write(line)
+                self._target.flush()
+            else:
+                with open(self._target, "a", encoding="utf-8") as f:
+                    f.write(line)
+
+
+class PrometheusHook:
+    """Aggregate stats into counters exposed in the Prometheus text format."""
+
+    def __init__(self, prefix: str = "centerframe"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.files: Dict[str, int] = {}
+        self.stage_seconds: Dict[str, float] = {}
+        self.objects: Dict[str, int] = {}
+        self.pages = 0
+        self.transforms = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.bytes_deduped = 0
+
+    def __call__(self, stats: FileStats):
+        status = "cached" if stats.cached else ("ok" if stats.ok else "error")
+        with self._lock:
+            self.files[status] = self.files.get(status, 0) + 1
+            for name, sec in stats.stages.items():
+                self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + sec
+            for kind, n in stats.objects.items():
+                self.objects[kind] = self.objects.get(kind, 0) + n
+            self.pages += stats.pages
+            self.transforms += stats.transforms_applied
+            self.bytes_read += stats.bytes_read
+            self.bytes_written += stats.bytes_written
+            self.bytes_deduped += stats.bytes_deduped
+
+    def render(self) -> str:
+        p = self.prefix
+        with self._lock:
+            lines = [f"# TYPE {p}_files_total counter"]
+            lines += [f'{p}_files_total{{status="{k}"}} {v}' for k, v in sorted(self.files.items())]
+            lines.append(f"# TYPE {p}_stage_seconds_total counter")
+            lines += [f'{p}_stage_seconds_total{{stage="{k}"}} {v}'
+                      for k, v in sorted(self.stage_seconds.items())]
+            lines.append(f"# TYPE {p}_objects_total counter")
+            lines += [f'{p}_objects_total{{type="{k}"}} {v}' for k, v in sorted(self.objects.items())]
+            for name, value in (("pages_total", self.pages),
+                                ("transforms_applied_total", self.transforms),
+                                ("bytes_read_total", self.bytes_read),
+                                ("bytes_written_total", self.bytes_written),
+                                ("bytes_deduped_total", self.bytes_deduped)):
+                lines += [f"# TYPE {p}_{name} counter", f"{p}_{name} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Union[str, os.PathLike]):
+        """Atomically write :meth:`render` to *path* (node_exporter textfile collector)."""
+        import tempfile
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.render())
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
@@ -5,47 +5,180 @@ Horizontally **and** vertically center visible content of each page while
 avoiding accidental clipping. Works by examining all graphical objects
 (text, lines, rects, curves, images).
 
+Three bbox engines are available:
+    pdfplumber  pdfminer layout analysis (default, most battle-tested)
+    stream      single PyPDF2 pass over each content stream (see stream_bbox.py);
+                skips the second parse and the char-level extraction
+    raster      low-DPI PDFium render, bounds pixels that differ from the
+                background (see raster_bbox.py); for scans, pages with huge
+                numbers of tiny paths, and opaque full-page backgrounds
+
 Usage:
-    uv run center_pdf.py
+    uv run center_pdf.py [-j WORKERS] [--chunksize N] [--engine stream]
+    uv run center_pdf.py --page-workers 8     # one huge file, pages in parallel
 
 Dependencies:
-    pip install pdfplumber PyPDF2
+    pip install pdfplumber PyPDF2 numpy pypdfium2
+
+numpy, pdfplumber (pdfminer) and PyPDF2 are imported on first use, not at
+module load, so ``--help``, an empty folder or a GUI window come up without
+paying for them; :func:`warm_up` loads them ahead of time.
 """
 
+from __future__ import annotations
+
+import argparse
+import glob
+import io
+import mmap
+import os
 import sys
+from contextlib import ExitStack, contextmanager
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable, Tuple, Union
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable, Iterator, List, Tuple, Union
+
+from center_metrics import NULL_RECORDER, recording
+from page_fingerprint import FINGERPRINT_VERSION, REUSE_MODES, LayoutMemo
+
+if TYPE_CHECKING:
+    import numpy as np
+    from PyPDF2 import PdfReader
+
+    from resource_dedupe import DedupeReport
+
+# 첫 변환 때 불러오는 무거운 모듈 (warm_up이 미리 불러옴)
+HEAVY_MODULES = ("numpy", "pdfplumber", "PyPDF2", "stream_bbox", "raster_bbox", "stream_writer",
+                 "incremental_writer", "resource_dedupe")
+
+ENGINES = ("pdfplumber", "stream", "raster")
+DEFAULT_ENGINE = "pdfplumber"
+
+# raster 엔진의 렌더링 해상도와 배경색 허용 오차 (채널 값 0-255)
+RASTER_DPI = 36.0
+RASTER_TOLERANCE = 16
+
+# 페이지 병렬 분석 시 샤드 하나의 최소 페이지 수 (이보다 작으면 프로세스 비용이 더 큼)
+MIN_SHARD_PAGES = 16
+
+# 이 값(pt)보다 작은 이동은 적용하지 않음
+SHIFT_THRESHOLD = 0.5
+
+# 같은 옵션으로도 출력이 달라지게 알고리즘을 바꿀 때 올림. 캐시 키와 감시 폴더 상태에 들어가므로
+# 예전 알고리즘의 결과를 다시 쓰지 않음 (2: MediaBox가 원점에서 시작하지 않는 페이지의 x 보정)
+ALGORITHM_VERSION = 2
+
+# matrix: 콘텐츠 스트림을 q cm ... Q로 감쌈, box: 페이지 상자를 반대로 옮김 (스트림은 그대로)
+TRANSFORM_MODES = ("matrix", "box")
+DEFAULT_TRANSFORM = "matrix"
+
+# box 방식에서 함께 옮기는 페이지 상자 (없는 상자는 기본값을 따르므로 건드리지 않음)
+_PAGE_BOXES = ("/MediaBox", "/CropBox", "/BleedBox", "/TrimBox", "/ArtBox")
+
+# (bbox 또는 None, 페이지 너비, 페이지 높이)
+PageGeometry = Tuple[Union[Tuple[float, float, float, float], None], float, float]
+
+# 파일 경로, 메모리 버퍼 또는 바이너리 파일 객체
+PdfSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
 
-import pdfplumber
-from PyPDF2 import PdfReader, PdfWriter, Transformation
+# 페이지마다 (처리한 페이지 수, 전체 페이지 수)로 호출되는 진행 콜백
+ProgressCallback = Callable[[int, int], None]
+
+
+class ConversionCancelled(Exception):
+    """Raised when the *cancel* token passed to a conversion is set; no output is left behind."""
+
+
+_OBJECT_ATTRS = ("chars", "lines", "rects", "curves", "images")
+_COORD_KEYS = itemgetter("x0", "x1", "y0", "y1")
+
+
+def warm_up():
+    """
+    분석과 쓰기에 필요한 무거운 모듈(numpy, pdfplumber, PyPDF2)을 미리 불러옵니다.
+
+    GUI처럼 창을 먼저 띄운 뒤 백그라운드 스레드에서 호출하면 첫 변환이 빨라집니다.
+    이미 불러온 모듈은 다시 불러오지 않으므로 여러 번 호출해도 됩니다.
+    """
+    import importlib
+
+    for name in HEAVY_MODULES:
+        importlib.import_module(name)
 
 
 def _iter_objects(page) -> Iterable[dict]:
     """Yield every drawable object on *page* that has bbox keys x0, x1, y0, y1."""
-    for attr in ("chars", "lines", "rects", "curves", "images"):
+    for attr in _OBJECT_ATTRS:
         # getattr의 세 번째 인자로 빈 리스트를 제공하여 해당 속성이 없을 때 오류 방지
         for obj in getattr(page, attr, []):
             if obj is not None and all(k in obj for k in ("x0", "x1", "y0", "y1")):
                 yield obj
 
 
-def _page_bbox(page) -> Union[Tuple[float, float, float, float], None]:
-    """Return overall bbox (min_x, max_x, min_y, max_y) across all objects.
-    If no objects, returns None.
-    """
-    xs0, xs1, ys0, ys1 = [], [], [], []
-    for obj in _iter_objects(page):
+def _object_coords(page) -> np.ndarray:
+    """Return an (N, 4) float array of (x0, x1, y0, y1) for every object on *page*."""
+    import numpy as np
+
+    chunks = []
+    for attr in _OBJECT_ATTRS:
+        objs = getattr(page, attr, [])
+        if not objs:
+            continue
+        try:
+            flat = chain.from_iterable(map(_COORD_KEYS, objs))
+            chunks.append(np.fromiter(flat, dtype=np.float64, count=4 * len(objs)))
+        except (KeyError, ValueError, TypeError):
+            # None 객체, 좌표 키 누락, 숫자가 아닌 좌표가 섞인 목록은 하나씩 걸러냅니다.
+            chunks.append(_filtered_coords(objs))
+    if not chunks:
+        return np.empty((0, 4))
+    return np.concatenate(chunks).reshape(-1, 4)
+
+
+def _filtered_coords(objs) -> np.ndarray:
+    """Slow path of :func:`_object_coords`: keep only objects with numeric bbox keys."""
+    import numpy as np
+
+    flat = []
+    for obj in objs:
+        if obj is None or not all(k in obj for k in ("x0", "x1", "y0", "y1")):
+            continue
         try:
-            # 좌표값이 숫자가 아닐 경우를 대비한 오류 처리
-            xs0.append(float(obj["x0"]))
-            xs1.append(float(obj["x1"]))
-            ys0.append(float(obj["y0"]))
-            ys1.append(float(obj["y1"]))
+            flat.extend([float(v) for v in _COORD_KEYS(obj)])
         except (ValueError, TypeError):
             continue  # 변환할 수 없는 좌표는 건너뜁니다.
-    if not xs0:
+    return np.array(flat, dtype=np.float64)
+
+
+def _bbox_from_coords(
+    coords: np.ndarray, outlier_pct: float = 0.0
+) -> Union[Tuple[float, float, float, float], None]:
+    """Reduce an (N, 4) array of (x0, x1, y0, y1) rows to one overall bbox.
+
+    With *outlier_pct* > 0 the bbox spans the [pct, 100 - pct] percentile
+    range of object edges instead of the absolute min/max, so a stray speck
+    or crop mark does not stretch it. If *coords* is empty, returns None.
+    """
+    if coords.shape[0] == 0:
         return None
-    return min(xs0), max(xs1), min(ys0), max(ys1)
+    if outlier_pct <= 0:
+        mins = coords.min(axis=0)
+        maxs = coords.max(axis=0)
+        return float(mins[0]), float(maxs[1]), float(mins[2]), float(maxs[3])
+
+    import numpy as np
+
+    lo = np.percentile(coords[:, [0, 2]], outlier_pct, axis=0, method="lower")
+    hi = np.percentile(coords[:, [1, 3]], 100.0 - outlier_pct, axis=0, method="higher")
+    return float(lo[0]), float(hi[0]), float(lo[1]), float(hi[1])
+
+
+def _page_bbox(page, outlier_pct: float = 0.0) -> Union[Tuple[float, float, float, float], None]:
+    """Return overall bbox (min_x, max_x, min_y, max_y) across all objects.
+    If no objects, returns None.
+    """
+    return _bbox_from_coords(_object_coords(page), outlier_pct)
 
 
 def _clamped_shift(min_val, max_val, target_min, page_min, page_max, margin=0.0):
@@ -56,9 +189,8 @@ def _clamped_shift(min_val, max_val, target_min, page_min, page_max, margin=0.0)
     return max(lower_bound, min(ideal, upper_bound))
 
 
-def _compute_shift(page):
-    """Return (tx, ty) needed to center all content on *page* without clipping."""
-    bbox = _page_bbox(page)
+def _shift_for_bbox(bbox, page_w, page_h, margin: float = 0.0):
+    """Return (tx, ty) that centers *bbox* on a page_w × page_h page without clipping."""
     if bbox is None:
         return 0.0, 0.0
 
@@ -66,83 +198,1191 @@ def _compute_shift(page):
     content_w = max_x - min_x
     content_h = max_y - min_y
 
-    page_w, page_h = float(page.width), float(page.height)
-
     target_left = (page_w - content_w) / 2
     target_bottom = (page_h - content_h) / 2
 
-    tx = _clamped_shift(min_x, max_x, target_left, 0, page_w)
-    ty = _clamped_shift(min_y, max_y, target_bottom, 0, page_h)
+    tx = _clamped_shift(min_x, max_x, target_left, 0, page_w, margin)
+    ty = _clamped_shift(min_y, max_y, target_bottom, 0, page_h, margin)
 
     return tx, ty
 
 
-def center_pdf(input_path: Union[str, Path], output_path: Union[str, Path]) -> bool:
+def _page_geometry(page, outlier_pct: float = 0.0) -> PageGeometry:
+    """Return (bbox, width, height) of a pdfplumber *page*, relative to its MediaBox lower-left."""
+    bbox = _page_bbox(page, outlier_pct)
+    left = float(page.bbox[0])
+    if bbox is not None and left:
+        # pdfplumber의 x 좌표에는 MediaBox 왼쪽 끝이 더해져 있음 (y 좌표는 아래쪽 기준)
+        bbox = (bbox[0] - left, bbox[1] - left, bbox[2], bbox[3])
+    return bbox, float(page.width), float(page.height)
+
+
+def _stream_page_geometry(page, outlier_pct: float = 0.0) -> PageGeometry:
+    """Same as :func:`_page_geometry` for a PyPDF2 page, using the stream engine."""
+    import stream_bbox
+
+    page_w, page_h = stream_bbox.page_size(page)
+    return _bbox_from_coords(stream_bbox.page_boxes(page), outlier_pct), page_w, page_h
+
+
+def _recorded_page_geometry(page, index: int, outlier_pct: float, recorder) -> PageGeometry:
+    """:func:`_page_geometry` with object extraction and the bbox reduction timed separately."""
+    with recorder.page_stage(index, "extract"):
+        page.objects  # pdfplumber가 페이지를 파싱해 객체를 만드는 단계
+    recorder.count_objects(index, {attr: len(getattr(page, attr, [])) for attr in _OBJECT_ATTRS})
+    with recorder.page_stage(index, "bbox"):
+        return _page_geometry(page, outlier_pct)
+
+
+def _recorded_stream_geometry(page, index: int, outlier_pct: float, recorder) -> PageGeometry:
+    # stream 엔진은 객체 종류를 구분하지 않으므로 bbox 개수만 기록
+    import stream_bbox
+
+    with recorder.page_stage(index, "bbox"):
+        page_w, page_h = stream_bbox.page_size(page)
+        boxes = stream_bbox.page_boxes(page)
+        bbox = _bbox_from_coords(boxes, outlier_pct)
+    recorder.count_objects(index, {"boxes": len(boxes)})
+    return bbox, page_w, page_h
+
+
+def _raster_page_geometry(page, outlier_pct: float, dpi: float, tolerance: int) -> PageGeometry:
+    """Same as :func:`_page_geometry` for a PDFium page, using the raster engine."""
+    import raster_bbox
+
+    return raster_bbox.page_geometry(page, dpi, tolerance, outlier_pct)[:3]
+
+
+def _recorded_raster_geometry(page, index: int, outlier_pct: float, dpi: float, tolerance: int,
+                              recorder) -> PageGeometry:
+    # 렌더링과 비트맵 처리를 나누어 기록하고, 객체 대신 잉크 픽셀 수를 셈
+    import raster_bbox
+
+    with recorder.page_stage(index, "render"):
+        pixels, page_w, page_h = raster_bbox.render_page(page, dpi)
+    with recorder.page_stage(index, "bbox"):
+        mask = raster_bbox.ink_mask(pixels, tolerance)
+        bbox = raster_bbox.mask_bbox(mask, page_w, page_h, outlier_pct)
+    recorder.count_objects(index, {"ink_pixels": int(mask.sum())})
+    return bbox, page_w, page_h
+
+
+def _compute_shift(page, outlier_pct: float = 0.0, margin: float = 0.0):
+    """Return (tx, ty) needed to center all content on *page* without clipping."""
+    return _shift_for_bbox(*_page_geometry(page, outlier_pct), margin)
+
+
+def _iter_geometry(
+    input_p: Union[Path, memoryview],
+    reader: PdfReader,
+    engine: str,
+    outlier_pct: float = 0.0,
+    start: int = 0,
+    stop: Union[int, None] = None,
+    reuse: str = "off",
+    memo: Union[LayoutMemo, None] = None,
+    pdf=None,
+    release: bool = False,
+    recorder=NULL_RECORDER,
+    raster_dpi: float = RASTER_DPI,
+    raster_tolerance: int = RASTER_TOLERANCE,
+) -> Iterator[PageGeometry]:
+    """Yield (bbox, width, height) for pages [start, stop) of *reader*, using *engine*.
+
+    With *reuse* other than "off", pages whose layout fingerprint was already
+    analyzed reuse that result through *memo* (see ``page_fingerprint``).
+    *input_p* is a file path or an in-memory view of the file. *pdf* is an
+    already open pdfplumber document (PDFium document for the raster engine)
+    to analyze instead of opening *input_p* again. With *release*, pdfminer's
+    document-level object cache is also dropped after every page to bound
+    memory. *recorder* (see ``center_metrics``) receives per-page timings and
+    object counts. *raster_dpi* and *raster_tolerance* only apply to the
+    raster engine.
+    """
+    stop = len(reader.pages) if stop is None else min(stop, len(reader.pages))
+    with ExitStack() as stack:
+        if engine == "stream":
+            def analyze(i):
+                if recorder.enabled:
+                    return _recorded_stream_geometry(reader.pages[i], i, outlier_pct, recorder)
+                return _stream_page_geometry(reader.pages[i], outlier_pct)
+        elif engine == "raster":
+            if pdf is None:
+                import raster_bbox
+
+                source = _BufferReader(input_p) if isinstance(input_p, memoryview) else input_p
+                with recorder.stage("raster_open"):
+                    pdf = raster_bbox.open_document(source)
+                stack.callback(pdf.close)
+            stop = min(len(pdf), stop)
+
+            def analyze(i):
+                page = pdf[i]
+                try:
+                    if recorder.enabled:
+                        return _recorded_raster_geometry(page, i, outlier_pct, raster_dpi,
+                                                         raster_tolerance, recorder)
+                    return _raster_page_geometry(page, outlier_pct, raster_dpi, raster_tolerance)
+                finally:
+                    page.close()
+        else:
+            if pdf is None:
+                import pdfplumber
+
+                source = _BufferReader(input_p) if isinstance(input_p, memoryview) else input_p
+                with recorder.stage("pdfplumber_open"):
+                    pdf = stack.enter_context(pdfplumber.open(source))
+            # pdfplumber와 PyPDF2가 인식하는 페이지 수가 다를 경우를 대비
+            stop = min(len(pdf.pages), stop)
+
+            def analyze(i):
+                page = pdf.pages[i]
+                try:
+                    if recorder.enabled:
+                        return _recorded_page_geometry(page, i, outlier_pct, recorder)
+                    return _page_geometry(page, outlier_pct)
+                finally:
+                    page.close()  # 분석이 끝난 페이지의 객체 캐시를 해제
+                    if release:
+                        _release_pdfminer_cache(pdf)
+
+        if reuse == "off":
+            for i in range(start, stop):
+                yield analyze(i)
+            return
+
+        memo = LayoutMemo() if memo is None else memo
+        params, verify = _memo_params(engine, outlier_pct, raster_dpi, raster_tolerance), reuse == "verify"
+        for i in range(start, stop):
+            hits = memo.hits
+            yield memo.geometry(reader.pages[i], params, lambda: analyze(i), verify)
+            if recorder.enabled and memo.hits > hits:
+                recorder.page(i).reused = True
+
+
+def _memo_params(engine: str, outlier_pct: float, raster_dpi: float, raster_tolerance: int) -> tuple:
+    """Analysis options a memoized page geometry depends on."""
+    if engine == "raster":
+        return engine, outlier_pct, raster_dpi, raster_tolerance
+    return engine, outlier_pct
+
+
+def _release_pdfminer_cache(pdf):
+    """Drop the parsed-object caches pdfminer keeps for the whole document."""
+    doc = getattr(pdf, "doc", None)
+    for attr in ("_cached_objs", "_parsed_objs"):
+        cache = getattr(doc, attr, None)
+        if cache is not None:
+            cache.clear()
+
+
+# 페이지 병렬 분석 워커 프로세스마다 한 번만 연 문서를 재사용 (샤드마다 다시 파싱하지 않도록)
+_shard_docs: dict = {}
+
+
+def _shard_geometry(shard) -> List[PageGeometry]:
+    """Worker body for :func:`_parallel_geometry`: analyze one page range of the file."""
+    import pdfplumber
+    from PyPDF2 import PdfReader
+
+    input_p, start, stop, engine, outlier_pct, reuse, raster_dpi, raster_tolerance = shard
+    docs = _shard_docs.get(input_p)
+    if docs is None:
+        if engine == "raster":
+            import raster_bbox
+
+            pdf = raster_bbox.open_document(input_p)
+        else:
+            pdf = pdfplumber.open(input_p) if engine != "stream" else None
+        docs = _shard_docs[input_p] = (PdfReader(input_p), pdf, LayoutMemo())
+    reader, pdf, memo = docs
+    return list(_iter_geometry(input_p, reader, engine, outlier_pct, start, stop,
+                               reuse, memo, pdf, raster_dpi=raster_dpi,
+                               raster_tolerance=raster_tolerance))
+
+
+def _parallel_geometry(
+    input_p: Path,
+    num_pages: int,
+    engine: str,
+    outlier_pct: float,
+    page_workers: int,
+    reuse: str = "off",
+    raster_dpi: float = RASTER_DPI,
+    raster_tolerance: int = RASTER_TOLERANCE,
+) -> List[PageGeometry]:
+    """Analyze all pages by splitting the range across worker processes.
+
+    Each worker opens the file on its own (and keeps its own layout memo);
+    shards are returned in page order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    # 워커당 여러 샤드를 두어 페이지마다 분석 비용이 달라도 부하가 고르게 나뉘도록 함
+    shard_size = max(MIN_SHARD_PAGES, -(-num_pages // (page_workers * 4)))
+    shards = [
+        (input_p, start, min(start + shard_size, num_pages), engine, outlier_pct, reuse,
+         raster_dpi, raster_tolerance)
+        for start in range(0, num_pages, shard_size)
+    ]
+    with ProcessPoolExecutor(max_workers=min(page_workers, len(shards))) as pool:
+        return [geom for shard in pool.map(_shard_geometry, shards) for geom in shard]
+
+
+def _analyze(
+    input_p: Union[Path, memoryview],
+    reader: PdfReader,
+    engine: str = DEFAULT_ENGINE,
+    outlier_pct: float = 0.0,
+    page_workers: int = 1,
+    reuse: str = "off",
+    memo: Union[LayoutMemo, None] = None,
+    release: bool = False,
+    recorder=NULL_RECORDER,
+    raster_dpi: float = RASTER_DPI,
+    raster_tolerance: int = RASTER_TOLERANCE,
+) -> Iterable[PageGeometry]:
+    """Return (bbox, width, height) for every page, serially or page-parallel.
+
+    Page-parallel analysis reopens the file in each worker, so in-memory
+    inputs are always analyzed serially. It is recorded as a single
+    ``analyze`` stage without per-page timings.
+    """
+    num_pages = len(reader.pages)
+    if page_workers > 1 and isinstance(input_p, Path) and num_pages >= 2 * MIN_SHARD_PAGES:
+        with recorder.stage("analyze"):
+            return _parallel_geometry(input_p, num_pages, engine, outlier_pct, page_workers, reuse,
+                                      raster_dpi, raster_tolerance)
+    return _iter_geometry(input_p, reader, engine, outlier_pct, reuse=reuse, memo=memo,
+                          release=release, recorder=recorder, raster_dpi=raster_dpi,
+                          raster_tolerance=raster_tolerance)
+
+
+def _needs_shift(tx: float, ty: float, threshold: float) -> bool:
+    # 이동 거리가 미미한 경우는 변환을 적용하지 않음
+    return abs(tx) > threshold or abs(ty) > threshold
+
+
+def _shift_boxes(pd_page, tx: float, ty: float):
+    """Move the page boxes of *pd_page* by (-tx, -ty), which displays its content shifted by (tx, ty).
+
+    The content streams are left untouched. Boxes inherited from the page
+    tree are already copied onto the page by PyPDF2 when the reader builds
+    its page list, so they are moved too.
+    """
+    from PyPDF2.generic import FloatObject, NameObject, RectangleObject
+
+    for key in _PAGE_BOXES:
+        if key not in pd_page:
+            continue
+        box = pd_page[key]
+        # float를 그대로 넘기면 이진 전개가 전부 기록되므로 소수 넷째 자리까지만 씀
+        pd_page[NameObject(key)] = RectangleObject(
+            [FloatObject(f"{float(v) - (tx if j % 2 == 0 else ty):.4f}") for j, v in enumerate(box)])
+
+
+def _shift_page(pd_page, tx: float, ty: float, threshold: float,
+                transform: str = DEFAULT_TRANSFORM) -> bool:
+    """Translate *pd_page* by (tx, ty) unless the shift is below *threshold*; return whether applied."""
+    if not _needs_shift(tx, ty, threshold):
+        return False
+    if transform == "box":
+        _shift_boxes(pd_page, tx, ty)
+        return True
+
+    from PyPDF2 import Transformation
+
+    transformation = Transformation().translate(tx=tx, ty=ty)
+    pd_page.add_transformation(transformation)
+    return True
+
+
+def _tracked(shifts: Iterable[Tuple[float, float]], total: int,
+             progress: Union[ProgressCallback, None], cancel) -> Iterator[Tuple[float, float]]:
+    """Pass *shifts* through, reporting each page to *progress* and stopping once *cancel* is set.
+
+    Analysis runs lazily as shifts are consumed, so the check between pages
+    also interrupts the analysis of a long document.
+    """
+    if cancel is not None and cancel.is_set():
+        raise ConversionCancelled("conversion cancelled")
+    for done, shift in enumerate(shifts, 1):
+        if progress is not None:
+            progress(done, total)
+        yield shift
+        if cancel is not None and cancel.is_set():
+            raise ConversionCancelled(f"conversion cancelled after page {done} of {total}")
+
+
+def _record_shift(recorder, index: int, tx: float, ty: float, applied: bool):
+    page = recorder.page(index)
+    page.tx, page.ty, page.applied = tx, ty, applied
+
+
+def _write_shifted(
+    reader: PdfReader,
+    shifts: Iterable[Tuple[float, float]],
+    output: Union[Path, BinaryIO],
+    threshold: float = SHIFT_THRESHOLD,
+    streaming: bool = False,
+    recorder=NULL_RECORDER,
+    original: Union[memoryview, None] = None,
+    transform: str = DEFAULT_TRANSFORM,
+    dedupe: bool = False,
+    dedupe_report: Union[DedupeReport, None] = None,
+) -> int:
+    """Translate each page of *reader* by its (tx, ty), write *output*, return page count.
+
+    *output* is a path or a writable binary stream. With *streaming*, each
+    page is written as soon as it is shifted and the reader's object cache is
+    dropped, so memory does not grow with page count. With *original* (the
+    bytes *reader* was opened on), the output is those bytes plus an
+    incremental update that redefines only the shifted pages (see
+    ``incremental_writer``); encrypted or damaged files, which cannot be
+    updated that way, are rewritten as usual. *transform* is one of
+    :data:`TRANSFORM_MODES`: "matrix" wraps the content in a translation,
+    "box" moves the page boxes instead and copies content streams as is.
+    With *dedupe*, identical images, fonts and form XObjects are written
+    once (see ``resource_dedupe``) and counted into *dedupe_report*.
+    """
+    if original is not None:
+        from incremental_writer import IncrementalUpdate, IncrementalUpdateError
+
+        try:
+            update = IncrementalUpdate(reader, original)
+        except IncrementalUpdateError:
+            pass
+        else:
+            return _write_incremental(update, reader, shifts, output, threshold, recorder, transform)
+
+    if streaming:
+        return _write_shifted_streaming(reader, shifts, output, threshold, recorder, transform)
+
+    from PyPDF2 import PdfWriter
+
+    writer = PdfWriter()
+
+    for i, (tx, ty) in enumerate(shifts):
+        pd_page = reader.pages[i]
+        with recorder.page_stage(i, "transform"):
+            applied = _shift_page(pd_page, tx, ty, threshold, transform)
+        if recorder.enabled:
+            _record_shift(recorder, i, tx, ty, applied)
+        writer.add_page(pd_page)
+
+    if dedupe:
+        _dedupe(writer, dedupe_report, recorder)
+
+    with _open_sink(output) as f, recorder.stage("write"):
+        writer.write(f)
+    if recorder.enabled:
+        recorder.stats.bytes_written = f.tell()
+        recorder.stats.pages = len(writer.pages)
+
+    return len(writer.pages)
+
+
+def _dedupe(writer, report: Union[DedupeReport, None], recorder=NULL_RECORDER):
+    from resource_dedupe import DedupeReport, dedupe_writer
+
+    report = report if report is not None else DedupeReport()
+    before = report.bytes_saved
+    with recorder.stage("dedupe"):
+        dedupe_writer(writer, report)
+    if recorder.enabled:
+        recorder.stats.bytes_deduped += report.bytes_saved - before
+
+
+def _write_shifted_streaming(
+    reader: PdfReader,
+    shifts: Iterable[Tuple[float, float]],
+    output: Union[Path, BinaryIO],
+    threshold: float,
+    recorder=NULL_RECORDER,
+    transform: str = DEFAULT_TRANSFORM,
+) -> int:
+    from stream_writer import StreamingPdfWriter
+
+    with _open_sink(output) as f:
+        header = reader.pdf_header
+        writer = StreamingPdfWriter(f, header.encode() if isinstance(header, str) else header)
+        writer.reserve_pages(reader.pages)
+
+        for i, (tx, ty) in enumerate(shifts):
+            pd_page = reader.pages[i]
+            with recorder.page_stage(i, "transform"):
+                applied = _shift_page(pd_page, tx, ty, threshold, transform)
+            if recorder.enabled:
+                _record_shift(recorder, i, tx, ty, applied)
+            with recorder.page_stage(i, "write"):
+                writer.add_page(pd_page)
+
+            # 이미 쓴 페이지의 콘텐츠와 리더가 캐시한 객체(이미지, 폰트 등)를 해제
+            pd_page.pop("/Contents", None)
+            reader.resolved_objects.clear()
+
+        with recorder.stage("write"):
+            writer.close()
+    if recorder.enabled:
+        recorder.stats.bytes_written = f.tell()
+        recorder.stats.pages = writer.page_count
+    return writer.page_count
+
+
+def _write_incremental(
+    update,
+    reader: PdfReader,
+    shifts: Iterable[Tuple[float, float]],
+    output: Union[Path, BinaryIO],
+    threshold: float,
+    recorder=NULL_RECORDER,
+    transform: str = DEFAULT_TRANSFORM,
+) -> int:
+    pages = 0
+    for i, (tx, ty) in enumerate(shifts):
+        with recorder.page_stage(i, "transform"):
+            applied = _needs_shift(tx, ty, threshold)
+            if applied and transform == "box":
+                pd_page = reader.pages[i]
+                _shift_boxes(pd_page, tx, ty)
+                applied = update.redefine_page(pd_page)
+            elif applied:
+                applied = update.shift_page(reader.pages[i], tx, ty)
+        if recorder.enabled:
+            _record_shift(recorder, i, tx, ty, applied)
+        pages += 1
+
+    with _open_sink(output) as f, recorder.stage("write"):
+        update.write(f)
+    if recorder.enabled:
+        recorder.stats.bytes_written = f.tell()
+        recorder.stats.pages = pages
+    return pages
+
+
+class _BufferReader(io.RawIOBase):
+    """Seekable read-only file over a memoryview; reads copy only the requested range."""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos:end].tobytes() if end > self._pos else b""
+        self._pos = max(self._pos, end)
+        return data
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+class _OffsetWriter:
+    """Write-only wrapper that counts bytes, so PDF writers can ``tell()`` on pipes and sockets.
+
+    Offsets are relative to where the PDF starts, even if *stream* already
+    holds other data.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._pos = 0
+
+    def write(self, data) -> int:
+        self._stream.write(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self):
+        flush = getattr(self._stream, "flush", None)
+        if flush is not None:
+            flush()
+
+
+@contextmanager
+def _open_sink(output: Union[Path, BinaryIO]):
+    """Yield a tell()-able writer for a path or a caller's stream.
+
+    A path is written through a temporary file next to it that replaces it
+    only when the block succeeds, so an error or cancellation never leaves
+    a truncated PDF (or destroys an existing one).
+    """
+    if hasattr(output, "write"):
+        yield _OffsetWriter(output)
+        return
+    import uuid
+
+    output_p = Path(output)
+    tmp = output_p.with_name(f".{output_p.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        # mkstemp와 달리 umask에 따른 보통 권한으로 만들어짐
+        with tmp.open("xb") as f:
+            yield _OffsetWriter(f)
+        os.replace(tmp, output_p)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _partial_outputs(output_p: Path) -> List[Path]:
+    """Return the temporary files :func:`_open_sink` left for *output_p* in a process that was killed."""
+    return list(output_p.parent.glob(f".{glob.escape(output_p.name)}.*.tmp"))
+
+
+def _release_view(view: memoryview, stack: ExitStack) -> memoryview:
+    stack.callback(view.release)
+    return view
+
+
+def _map_file(f: BinaryIO, stack: ExitStack, offset: int = 0) -> memoryview:
+    """Memory-map the open file *f* read-only and return a view starting at *offset*."""
+    if os.fstat(f.fileno()).st_size == 0:
+        return memoryview(b"")  # 빈 파일은 매핑할 수 없음 (PdfReader가 오류를 냄)
+    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    stack.callback(mapped.close)
+    view = _release_view(memoryview(mapped), stack)
+    return _release_view(view[offset:], stack) if offset else view
+
+
+def _source_view(source: PdfSource, stack: ExitStack) -> memoryview:
+    """Return a read-only byte view of *source* without copying it where possible.
+
+    Paths and real files are memory-mapped, in-memory buffers are viewed in
+    place; only other file-like objects (pipes, sockets) are read into memory.
+    Views are released when *stack* closes.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:  # 매핑은 파일을 닫아도 유지됨
+            return _map_file(f, stack)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return _release_view(memoryview(source).cast("B"), stack)
+    if not hasattr(source, "read"):
+        raise TypeError(f"expected a path, bytes-like or binary file object, got {type(source).__name__}")
+
+    start = source.tell() if source.seekable() else 0
+    if hasattr(source, "getbuffer"):
+        # BytesIO: 내부 버퍼를 복사하지 않고 그대로 봄
+        buffer = _release_view(source.getbuffer(), stack)
+        return _release_view(buffer[start:], stack)
+    try:
+        fileno = source.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fileno = None
+    if fileno is not None and source.seekable():
+        return _map_file(source, stack, start)
+    return memoryview(source.read())
+
+
+def _center_io(
+    source: PdfSource,
+    output: Union[Path, BinaryIO],
+    *,
+    engine: str = DEFAULT_ENGINE,
+    outlier_pct: float = 0.0,
+    margin: float = 0.0,
+    threshold: float = SHIFT_THRESHOLD,
+    page_workers: int = 1,
+    reuse: str = "off",
+    memo: Union[LayoutMemo, None] = None,
+    streaming: bool = False,
+    recorder=NULL_RECORDER,
+    raster_dpi: float = RASTER_DPI,
+    raster_tolerance: int = RASTER_TOLERANCE,
+    incremental: bool = False,
+    transform: str = DEFAULT_TRANSFORM,
+    progress: Union[ProgressCallback, None] = None,
+    cancel=None,
+    dedupe: bool = False,
+    dedupe_report: Union[DedupeReport, None] = None,
+) -> int:
+    """Center *source* into *output* (a path or binary stream) and return the page count."""
+    from PyPDF2 import PdfReader
+
+    input_p = Path(source) if isinstance(source, (str, os.PathLike)) else None
+    view = None
+    with ExitStack() as stack:
+        with recorder.stage("open"):
+            # 증분 업데이트는 원본 바이트를 그대로 복사하므로 항상 매핑한 뷰가 필요
+            if input_p is not None and streaming and not incremental:
+                # 매핑한 페이지도 RSS로 잡히므로 스트리밍 모드에서는 파일 핸들로 필요한 부분만 읽음
+                f = stack.enter_context(input_p.open("rb"))
+                size = os.fstat(f.fileno()).st_size
+                reader = PdfReader(f)
+            else:
+                view = _source_view(source, stack)
+                size = len(view)
+                reader = PdfReader(_BufferReader(view))
+                if input_p is None:
+                    input_p = view
+        if recorder.enabled:
+            recorder.stats.bytes_read = size
+        geometry = _analyze(input_p, reader, engine, outlier_pct, page_workers, reuse, memo,
+                            release=streaming, recorder=recorder, raster_dpi=raster_dpi,
+                            raster_tolerance=raster_tolerance)
+        shifts = (_shift_for_bbox(bbox, w, h, margin) for bbox, w, h in geometry)
+        if progress is not None or cancel is not None:
+            shifts = _tracked(shifts, len(reader.pages), progress, cancel)
+        return _write_shifted(reader, shifts, output, threshold, streaming, recorder,
+                              original=view if incremental else None, transform=transform,
+                              dedupe=dedupe, dedupe_report=dedupe_report)
+
+
+def _center(
+    input_p: Path,
+    output_p: Path,
+    *,
+    engine: str = DEFAULT_ENGINE,
+    outlier_pct: float = 0.0,
+    margin: float = 0.0,
+    threshold: float = SHIFT_THRESHOLD,
+    page_workers: int = 1,
+    reuse: str = "off",
+    memo: Union[LayoutMemo, None] = None,
+    streaming: bool = False,
+    recorder=NULL_RECORDER,
+    raster_dpi: float = RASTER_DPI,
+    raster_tolerance: int = RASTER_TOLERANCE,
+    incremental: bool = False,
+    transform: str = DEFAULT_TRANSFORM,
+    progress: Union[ProgressCallback, None] = None,
+    cancel=None,
+    dedupe: bool = False,
+    dedupe_report: Union[DedupeReport, None] = None,
+) -> int:
+    """Center *input_p* into *output_p* and return the number of pages written.
+
+    Unlike :func:`center_pdf`, errors propagate to the caller.
+    """
+    # 출력 폴더가 없으면 생성
+    output_p.parent.mkdir(parents=True, exist_ok=True)
+
+    source = input_p
+    if output_p.exists() and os.path.samefile(input_p, output_p):
+        # 제자리 변환: 출력 파일을 여는 순간 입력이 잘리므로 먼저 메모리로 읽어 둠
+        source = input_p.read_bytes()
+
+    return _center_io(source, output_p, engine=engine, outlier_pct=outlier_pct, margin=margin,
+                      threshold=threshold, page_workers=page_workers, reuse=reuse, memo=memo,
+                      streaming=streaming, recorder=recorder, raster_dpi=raster_dpi,
+                      raster_tolerance=raster_tolerance, incremental=incremental,
+                      transform=transform, progress=progress, cancel=cancel, dedupe=dedupe,
+                      dedupe_report=dedupe_report)
+
+
+def _cache_params(options: dict) -> dict:
+    """Return the centering options that determine output bytes, for cache keys."""
+    params = {
+        "engine": options.get("engine", DEFAULT_ENGINE),
+        "outlier_pct": float(options.get("outlier_pct", 0.0)),
+        "margin": float(options.get("margin", 0.0)),
+        "threshold": float(options.get("threshold", SHIFT_THRESHOLD)),
+        "reuse": options.get("reuse", "off"),
+        "algorithm": ALGORITHM_VERSION,
+    }
+    # 재사용 결과는 지문 방식에 따라 달라지므로 구분 (재사용을 끈 캐시 키는 유지)
+    if params["reuse"] != "off":
+        params["fingerprint"] = FINGERPRINT_VERSION
+    # 스트리밍 출력은 객체 번호 등 바이트가 다르므로 구분 (기존 캐시 키는 유지)
+    if options.get("streaming"):
+        params["streaming"] = True
+    if options.get("incremental"):
+        params["incremental"] = True
+    if options.get("transform", DEFAULT_TRANSFORM) != DEFAULT_TRANSFORM:
+        params["transform"] = options["transform"]
+    if options.get("dedupe"):
+        params["dedupe"] = True
+    if params["engine"] == "raster":
+        params["raster_dpi"] = float(options.get("raster_dpi", RASTER_DPI))
+        params["raster_tolerance"] = int(options.get("raster_tolerance", RASTER_TOLERANCE))
+    return params
+
+
+def _center_cached(
+    input_p: Path,
+    output_p: Path,
+    cache=None,
+    recorder=NULL_RECORDER,
+    **options,
+) -> Tuple[int, bool]:
+    """Run :func:`_center` through *cache* (a ``center_cache.ResultCache``).
+
+    Returns (pages, cache_hit).
+    """
+    if cache is None:
+        return _center(input_p, output_p, recorder=recorder, **options), False
+
+    with recorder.stage("cache"):
+        key = cache.key(input_p, _cache_params(options))
+        pages = cache.fetch(key, output_p)
+    if pages is not None:
+        if recorder.enabled:
+            recorder.stats.cached = True
+            recorder.stats.pages = pages
+        return pages, True
+
+    pages = _center(input_p, output_p, recorder=recorder, **options)
+    with recorder.stage("cache"):
+        cache.store(key, output_p, pages)
+    return pages, False
+
+
+def _check_options(engine: str, reuse: str, raster_dpi: float = RASTER_DPI,
+                   raster_tolerance: int = RASTER_TOLERANCE, transform: str = DEFAULT_TRANSFORM,
+                   dedupe: bool = False, streaming: bool = False, incremental: bool = False):
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}; expected one of {ENGINES}")
+    if transform not in TRANSFORM_MODES:
+        raise ValueError(f"unknown transform {transform!r}; expected one of {TRANSFORM_MODES}")
+    if reuse not in REUSE_MODES:
+        raise ValueError(f"unknown reuse mode {reuse!r}; expected one of {REUSE_MODES}")
+    if raster_dpi <= 0:
+        raise ValueError(f"raster_dpi must be positive, got {raster_dpi!r}")
+    if not 0 <= raster_tolerance <= 255:
+        raise ValueError(f"raster_tolerance must be between 0 and 255, got {raster_tolerance!r}")
+    if dedupe and (streaming or incremental):
+        # 스트리밍·증분 출력은 쓴 객체를 다시 보지 않으므로 합칠 수 없음
+        raise ValueError("dedupe cannot be combined with streaming or incremental output")
+
+
+def _check_option_dict(options: dict):
+    """Run :func:`_check_options` on keyword *options* meant for :func:`center_pdf`."""
+    _check_options(options.get("engine", DEFAULT_ENGINE), options.get("reuse", "off"),
+                   options.get("raster_dpi", RASTER_DPI),
+                   options.get("raster_tolerance", RASTER_TOLERANCE),
+                   options.get("transform", DEFAULT_TRANSFORM), options.get("dedupe", False),
+                   options.get("streaming", False), options.get("incremental", False))
+
+
+def center_pdf(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    *,
+    engine: str = DEFAULT_ENGINE,
+    outlier_pct: float = 0.0,
+    margin: float = 0.0,
+    threshold: float = SHIFT_THRESHOLD,
+    page_workers: int = 1,
+    reuse: str = "off",
+    memo: Union[LayoutMemo, None] = None,
+    streaming: bool = False,
+    cache=None,
+    instrument=None,
+    raster_dpi: float = RASTER_DPI,
+    raster_tolerance: int = RASTER_TOLERANCE,
+    incremental: bool = False,
+    transform: str = DEFAULT_TRANSFORM,
+    progress: Union[ProgressCallback, None] = None,
+    cancel=None,
+    dedupe: bool = False,
+    dedupe_report: Union[DedupeReport, None] = None,
+) -> bool:
     """
     PDF 파일의 콘텐츠를 중앙 정렬합니다.
 
     Args:
         input_path (Union[str, Path]): 원본 PDF 파일 경로.
         output_path (Union[str, Path]): 저장할 PDF 파일 경로.
+        engine (str): bbox 계산 엔진. "pdfplumber"(기본값), "stream" 또는 "raster".
+        outlier_pct (float): 0보다 크면 객체 좌표의 상·하위 백분위를 잘라내어
+            외딴 점이나 재단선 때문에 bbox가 늘어나지 않도록 합니다.
+        margin (float): 이동 후 콘텐츠와 페이지 가장자리 사이에 남길 최소 여백(pt).
+        threshold (float): 이보다 작은 이동(pt)은 적용하지 않습니다.
+        page_workers (int): 1보다 크면 페이지 범위를 나누어 여러 프로세스에서
+            분석합니다. 수천 쪽짜리 단일 파일에 유용합니다.
+        reuse (str): "off"(기본값), "verify", "trust". 같은 템플릿에서 만들어진
+            페이지(레이아웃 지문이 같은 페이지)의 분석 결과를 재사용합니다.
+            "verify"는 가벼운 stream 엔진 검사로 bbox가 같은지 확인한 뒤 재사용합니다.
+        memo (page_fingerprint.LayoutMemo | None): 여러 파일에 걸쳐 공유할 지문 메모.
+            None이면 문서마다 새로 만듭니다.
+        streaming (bool): True면 페이지마다 분석 캐시를 해제하고 출력을 바로
+            기록하여, 페이지 수와 관계없이 메모리 사용량을 거의 일정하게 유지합니다.
+        cache (center_cache.ResultCache | None): 지정하면 입력 내용과 옵션이 같은
+            이전 결과를 재사용하고, 새 결과를 캐시에 저장합니다.
+        instrument (center_metrics.Instrumentation | None): 지정하면 단계별 시간,
+            객체 수, 읽고 쓴 바이트 수 등을 파일마다 훅으로 전달합니다.
+        raster_dpi (float): raster 엔진의 렌더링 해상도(dpi). 높을수록 정확하지만 느립니다.
+        raster_tolerance (int): raster 엔진에서 배경색과의 채널 값 차이(0-255)가
+            이보다 커야 잉크로 봅니다. 스캔 잡음이 많으면 높이세요.
+        incremental (bool): True면 문서를 다시 쓰지 않고 원본 바이트 뒤에 이동한
+            페이지만 다시 정의하는 증분 업데이트를 덧붙입니다. 이미지와 폰트를
+            다시 직렬화하지 않으므로 이미지가 많은 파일에서 쓰기가 훨씬 빠르고,
+            목차·양식 등 문서 구조도 그대로 유지됩니다. 암호화되었거나 상호 참조가
+            손상된 파일은 평소처럼 다시 씁니다.
+        transform (str): 이동 방식. "matrix"(기본값)는 콘텐츠 스트림을 이동 행렬로
+            감싸고, "box"는 MediaBox·CropBox 등 페이지 상자를 반대 방향으로 옮겨
+            콘텐츠 스트림을 그대로 복사합니다. 결과 화면은 같으며, "box"에서는
+            링크 등 주석도 콘텐츠와 함께 움직입니다.
+        progress (Callable[[int, int], None] | None): 페이지를 처리할 때마다
+            (처리한 페이지 수, 전체 페이지 수)로 호출됩니다. 변환을 수행하는 스레드에서
+            호출되므로 가볍게 유지하세요.
+        cancel (threading.Event | None): ``is_set()`` 이 있는 취소 토큰. 페이지마다
+            확인하여 설정되어 있으면 출력 파일을 남기지 않고
+            :class:`ConversionCancelled` 를 발생시킵니다.
+        dedupe (bool): True면 내용이 같은 이미지·폰트·폼 XObject 등을 한 번만
+            기록합니다. 템플릿 생성기가 페이지마다 같은 배경 이미지를 따로 넣은
+            문서에서 출력 크기가 크게 줄어듭니다. streaming, incremental과 함께 쓸 수 없습니다.
+        dedupe_report (resource_dedupe.DedupeReport | None): 지정하면 합친 객체 수와
+            줄어든 바이트 수를 누적합니다.
 
     Returns:
         bool: 성공 시 True, 실패 시 False.
+
+    Raises:
+        ConversionCancelled: cancel이 설정되어 변환을 중단한 경우 (오류로 출력하지 않음).
     """
+    _check_options(engine, reuse, raster_dpi, raster_tolerance, transform, dedupe, streaming,
+                   incremental)
+
     try:
         # 입력 경로를 Path 객체로 변환하여 안정성 확보
-        input_p = Path(input_path)
         output_p = Path(output_path)
+        with recording(instrument, input_path, output_p) as recorder:
+            _, cache_hit = _center_cached(
+                Path(input_path), output_p, cache, recorder, engine=engine,
+                outlier_pct=outlier_pct, margin=margin, threshold=threshold,
+                page_workers=page_workers, reuse=reuse, memo=memo, streaming=streaming,
+                raster_dpi=raster_dpi, raster_tolerance=raster_tolerance, incremental=incremental,
+                transform=transform, progress=progress, cancel=cancel, dedupe=dedupe,
+                dedupe_report=dedupe_report)
 
-        # 출력 폴더가 없으면 생성
-        output_p.parent.mkdir(parents=True, exist_ok=True)
+        if cache_hit:
+            print(f"캐시된 결과를 '{output_p}'에 저장했습니다.")
+        else:
+            print(f"성공적으로 변환되어 '{output_p}'에 저장되었습니다.")
+        return True
 
-        reader = PdfReader(input_p)
-        writer = PdfWriter()
+    except ConversionCancelled:
+        raise
+    except Exception as e:
+        # 모든 종류의 오류를 포괄적으로 처리
+        print(f"'{input_path}' 파일 변환 중 오류 발생: {e}", file=sys.stderr)
+        return False
 
-        with pdfplumber.open(input_p) as pdf:
-            # pdfplumber와 PyPDF2가 인식하는 페이지 수가 다를 경우를 대비
-            num_pages = min(len(pdf.pages), len(reader.pages))
 
-            for i in range(num_pages):
-                pl_page = pdf.pages[i]
-                pd_page = reader.pages[i]
+def center_pdf_bytes(
+    source: PdfSource,
+    output: Union[BinaryIO, None] = None,
+    *,
+    engine: str = DEFAULT_ENGINE,
+    outlier_pct: float = 0.0,
+    margin: float = 0.0,
+    threshold: float = SHIFT_THRESHOLD,
+    reuse: str = "off",
+    memo: Union[LayoutMemo, None] = None,
+    streaming: bool = False,
+    instrument=None,
+    raster_dpi: float = RASTER_DPI,
+    raster_tolerance: int = RASTER_TOLERANCE,
+    incremental: bool = False,
+    transform: str = DEFAULT_TRANSFORM,
+    progress: Union[ProgressCallback, None] = None,
+    cancel=None,
+    dedupe: bool = False,
+    dedupe_report: Union[DedupeReport, None] = None,
+) -> Union[bytes, int]:
+    """
+    메모리 버퍼나 파일 객체의 PDF를 중앙 정렬합니다. 임시 파일을 만들지 않습니다.
+
+    Args:
+        source: PDF 내용. bytes, bytearray, memoryview, 바이너리 파일 객체 또는
+            파일 경로. 경로와 실제 파일은 메모리 매핑으로 읽고, 메모리 버퍼는
+            복사하지 않고 그대로 읽습니다.
+        output: 결과를 쓸 바이너리 스트림. None이면 결과를 bytes로 반환합니다.
+            tell()이 없는 파이프나 소켓에도 쓸 수 있습니다.
+        engine, outlier_pct, margin, threshold, reuse, memo, streaming, instrument,
+        raster_dpi, raster_tolerance, incremental, transform, progress, cancel, dedupe,
+        dedupe_report:
+            :func:`center_pdf` 와 동일. output 스트림에는 취소 전까지 쓴 내용이 남을 수 있습니다.
+
+    Returns:
+        bytes | int: output이 None이면 변환된 PDF 내용, 아니면 기록한 페이지 수.
+
+    Raises:
+        ValueError: 알 수 없는 engine, reuse 또는 transform 값, 또는 dedupe를
+            streaming·incremental과 함께 지정한 경우.
+        TypeError: 지원하지 않는 source 형식.
+        PyPDF2.errors.PdfReadError: 손상되었거나 PDF가 아닌 입력.
+        ConversionCancelled: cancel이 설정되어 변환을 중단한 경우.
+
+    :func:`center_pdf` 와 달리 오류를 출력하지 않고 그대로 발생시킵니다.
+    """
+    _check_options(engine, reuse, raster_dpi, raster_tolerance, transform, dedupe, streaming,
+                   incremental)
+    options = dict(engine=engine, outlier_pct=outlier_pct, margin=margin, threshold=threshold,
+                   reuse=reuse, memo=memo, streaming=streaming, raster_dpi=raster_dpi,
+                   raster_tolerance=raster_tolerance, incremental=incremental, transform=transform,
+                   progress=progress, cancel=cancel, dedupe=dedupe, dedupe_report=dedupe_report)
+    label = source if isinstance(source, (str, os.PathLike)) else f"<{type(source).__name__}>"
+    with recording(instrument, label, "<stream>" if output is not None else "<bytes>") as recorder:
+        if output is not None:
+            return _center_io(source, output, recorder=recorder, **options)
+
+        buffer = io.BytesIO()
+        _center_io(source, buffer, recorder=recorder, **options)
+        return buffer.getvalue()
+
+
+def center_pdf_combined(
+    input_paths: Iterable[Union[str, Path]],
+    output_path: Union[str, Path],
+    *,
+    engine: str = DEFAULT_ENGINE,
+    outlier_pct: float = 0.0,
+    margin: float = 0.0,
+    threshold: float = SHIFT_THRESHOLD,
+    reuse: str = "off",
+    raster_dpi: float = RASTER_DPI,
+    raster_tolerance: int = RASTER_TOLERANCE,
+    transform: str = DEFAULT_TRANSFORM,
+    dedupe: bool = True,
+    dedupe_report: Union[DedupeReport, None] = None,
+) -> int:
+    """
+    여러 PDF를 각각 중앙 정렬하여 하나의 PDF로 합칩니다.
+
+    Args:
+        input_paths: 합칠 PDF 파일 경로. 이 순서대로 페이지를 이어 붙입니다.
+        output_path: 저장할 PDF 파일 경로.
+        engine, outlier_pct, margin, threshold, reuse, raster_dpi, raster_tolerance, transform:
+            :func:`center_pdf` 와 동일. reuse를 켜면 레이아웃 지문 메모를 파일 사이에서도
+            공유합니다.
+        dedupe (bool): True(기본값)면 파일과 페이지에 걸쳐 내용이 같은 이미지·폰트·
+            폼 XObject를 한 번만 기록합니다. 같은 템플릿으로 만든 파일을 합칠 때
+            배경 이미지와 폰트가 파일 수만큼 중복되지 않습니다.
+        dedupe_report (resource_dedupe.DedupeReport | None): 지정하면 합친 객체 수와
+            줄어든 바이트 수를 누적합니다.
 
-                tx, ty = _compute_shift(pl_page)
+    Returns:
+        int: 기록한 전체 페이지 수.
 
-                # 이동 거리가 미미한 경우는 변환을 적용하지 않음
-                if abs(tx) > 0.5 or abs(ty) > 0.5:
-                    transformation = Transformation().translate(tx=tx, ty=ty)
-                    pd_page.add_transformation(transformation)
+    Raises:
+        ValueError: 알 수 없는 engine, reuse 또는 transform 값.
+        OSError, PyPDF2.errors.PdfReadError: 입력을 읽을 수 없는 경우. 출력 파일은 남기지 않습니다.
+    """
+    _check_options(engine, reuse, raster_dpi, raster_tolerance, transform)
+    from PyPDF2 import PdfReader, PdfWriter
 
+    writer = PdfWriter()
+    memo = LayoutMemo()
+    with ExitStack() as stack:
+        # 페이지는 add_page에서 복제되지만, 쓰기 전까지 원본을 참조할 수 있으므로 모두 열어 둠
+        for input_path in input_paths:
+            input_p = Path(input_path)
+            reader = PdfReader(_BufferReader(_source_view(input_p, stack)))
+            geometry = _analyze(input_p, reader, engine, outlier_pct, reuse=reuse, memo=memo,
+                                raster_dpi=raster_dpi, raster_tolerance=raster_tolerance)
+            for pd_page, (bbox, w, h) in zip(reader.pages, geometry):
+                tx, ty = _shift_for_bbox(bbox, w, h, margin)
+                _shift_page(pd_page, tx, ty, threshold, transform)
                 writer.add_page(pd_page)
 
-        with output_p.open("wb") as f:
+        if dedupe:
+            _dedupe(writer, dedupe_report)
+        output_p = Path(output_path)
+        output_p.parent.mkdir(parents=True, exist_ok=True)
+        with _open_sink(output_p) as f:
             writer.write(f)
+    return len(writer.pages)
 
-        print(f"성공적으로 변환되어 '{output_p}'에 저장되었습니다.")
-        return True
 
+def main(argv=None) -> int:
+    """CLI entry point: center every PDF found under the input folder (default ``pdfs``)."""
+    parser = argparse.ArgumentParser(
+        description="입력 폴더의 PDF를 중앙 정렬합니다. 출력 폴더를 지정하지 않으면 "
+                    "입력 파일 옆에 centered_ 접두사로 저장합니다.")
+    parser.add_argument("input", nargs="?", default="pdfs",
+                        help="PDF 파일이 있는 폴더 (기본값: pdfs)")
+    parser.add_argument("-o", "--output", default=None, metavar="DIR",
+                        help="결과를 저장할 폴더. 입력 폴더 기준 상대 경로를 그대로 유지합니다.")
+    parser.add_argument("-r", "--recursive", action="store_true", help="하위 폴더까지 탐색")
+    parser.add_argument("--include", action="append", default=None, metavar="GLOB",
+                        help="변환할 파일 패턴, 여러 번 지정 가능 (기본값: *.pdf). "
+                             "'/'가 들어간 패턴은 입력 폴더 기준 상대 경로에 맞춰 봅니다.")
+    parser.add_argument("--exclude", action="append", default=[], metavar="GLOB",
+                        help="제외할 파일이나 폴더 패턴, 여러 번 지정 가능")
+    parser.add_argument("--force", action="store_true",
+                        help="입력보다 새 출력이 이미 있는 파일도 다시 변환 "
+                             "(--queue와 함께 쓰면 대기열에서 완료·실패한 작업도 되돌림)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="동시에 실행할 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--chunksize", type=int, default=1,
+                        help="프로세스마다 한 번에 넘길 파일 수 (기본값: 1)")
+    parser.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE,
+                        help=f"bbox 계산 엔진 (기본값: {DEFAULT_ENGINE})")
+    parser.add_argument("--raster-dpi", type=float, default=RASTER_DPI,
+                        help=f"raster 엔진의 렌더링 해상도 (기본값: {RASTER_DPI:g})")
+    parser.add_argument("--raster-tolerance", type=int, default=RASTER_TOLERANCE,
+                        help=f"raster 엔진의 배경색 허용 오차, 0-255 (기본값: {RASTER_TOLERANCE})")
+    parser.add_argument("--outlier-pct", type=float, default=0.0,
+                        help="bbox 계산 시 잘라낼 상·하위 백분위 (기본값: 0)")
+    parser.add_argument("--margin", type=float, default=0.0,
+                        help="이동 후 콘텐츠와 페이지 가장자리 사이 최소 여백, pt (기본값: 0)")
+    parser.add_argument("--cache", nargs="?", const="", default=None, metavar="DIR",
+                        help="변환 결과 캐시 사용. DIR을 생략하면 사용자 캐시 폴더를 사용합니다.")
+    parser.add_argument("--cache-size", type=int, default=1024, metavar="MB",
+                        help="캐시 크기 상한, MB (기본값: 1024)")
+    parser.add_argument("--reuse", choices=REUSE_MODES, default="off",
+                        help="같은 템플릿 페이지의 분석 결과 재사용 (기본값: off)")
+    parser.add_argument("--reuse-across-files", action="store_true",
+                        help="지문 메모를 파일 사이에서도 공유 (워커 프로세스 단위)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="페이지 단위로 읽고 바로 기록하여 메모리 사용량을 일정하게 유지")
+    parser.add_argument("--incremental", action="store_true",
+                        help="문서를 다시 쓰지 않고 이동한 페이지만 증분 업데이트로 덧붙임")
+    parser.add_argument("--transform", choices=TRANSFORM_MODES, default=DEFAULT_TRANSFORM,
+                        help="이동 방식: matrix는 콘텐츠를 이동 행렬로 감싸고, box는 페이지 상자를 "
+                             f"옮겨 콘텐츠 스트림을 그대로 둠 (기본값: {DEFAULT_TRANSFORM})")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="내용이 같은 이미지·폰트·폼 XObject를 한 번만 기록하고 줄어든 크기를 보고")
+    parser.add_argument("--combine", metavar="FILE", default=None,
+                        help="모든 결과를 FILE 하나로 합쳐 저장 (중복 리소스는 항상 한 번만 기록)")
+    parser.add_argument("--timeout", type=float, default=None, metavar="SEC",
+                        help="파일 하나에 허용할 시간. 넘기면 워커를 종료하고 실패로 기록")
+    parser.add_argument("--memory-limit", type=int, default=None, metavar="MB",
+                        help="워커 프로세스 하나의 메모리(주소 공간) 한도. 넘기면 실패로 기록")
+    parser.add_argument("--queue", metavar="DB", default=None,
+                        help="SQLite 작업 대기열에 파일을 추가하고 남은 작업만 처리. "
+                             "중단된 실행을 이어서 하거나 여러 프로세스·컴퓨터가 나눠 처리할 때 사용")
+    parser.add_argument("--stats-jsonl", metavar="FILE", default=None,
+                        help="파일별 단계 시간과 카운터를 JSON Lines로 FILE에 추가 기록")
+    parser.add_argument("--stats-prom", metavar="FILE", default=None,
+                        help="누적 단계 시간과 카운터를 Prometheus 텍스트 형식으로 FILE에 기록")
+    parser.add_argument("--page-workers", type=int, default=1,
+                        help="파일 하나의 페이지를 나누어 분석할 프로세스 수. "
+                             "1보다 크면 파일은 하나씩 순서대로 처리합니다. (기본값: 1)")
+    args = parser.parse_args(argv)
+    if args.dedupe and (args.streaming or args.incremental):
+        parser.error("--dedupe는 --streaming, --incremental과 함께 쓸 수 없습니다.")
+    if (args.timeout is not None or args.memory_limit is not None) and args.page_workers > 1:
+        parser.error("--timeout, --memory-limit은 --page-workers와 함께 쓸 수 없습니다.")
+    if args.queue is not None and args.page_workers > 1:
+        parser.error("--queue는 --page-workers와 함께 쓸 수 없습니다.")
+
+    if args.combine is not None and args.output is not None:
+        parser.error("--combine은 -o/--output과 함께 쓸 수 없습니다.")
+
+    from center_discover import DEFAULT_INCLUDE, DiscoveryReport, discover
+
+    if not Path(args.input).is_dir():
+        print(f"오류: '{args.input}' 폴더를 찾을 수 없습니다.", file=sys.stderr)
+        return 1
+    if args.output is not None and Path(args.output).resolve() == Path(args.input).resolve():
+        parser.error("출력 폴더는 입력 폴더와 달라야 합니다.")
+
+    discovery = DiscoveryReport()
+    jobs = discover(
+        args.input, args.output, include=args.include or DEFAULT_INCLUDE, exclude=args.exclude,
+        recursive=args.recursive, skip_up_to_date=not args.force and args.combine is None,
+        report=discovery, on_error=lambda e: print(f"경고: 폴더를 읽을 수 없습니다: {e}", file=sys.stderr))
+    # 첫 파일을 찾자마자 변환을 시작하고, 변환할 파일이 없으면 무거운 모듈을 불러오지 않고 끝냄
+    first = next(jobs, None)
+    if first is None:
+        if discovery.skipped:
+            print(f"모든 출력이 최신 상태입니다 ({discovery}).")
+            return 0
+        print(f"'{args.input}' 폴더에 PDF 파일이 없습니다.", file=sys.stderr)
+        return 1
+    jobs = chain([first], jobs)
+
+    if args.combine is not None:
+        return _combine_main([src for src, _ in jobs], Path(args.combine), args)
+
+    from center_batch import center_batch
+
+    cache = None
+    if args.cache is not None:
+        from center_cache import ResultCache
+
+        cache = ResultCache(args.cache or None, max_bytes=args.cache_size << 20)
+
+    instrument = prometheus = None
+    if args.stats_jsonl or args.stats_prom:
+        from center_metrics import Instrumentation, JsonLinesHook, PrometheusHook
+
+        instrument = Instrumentation()
+        if args.stats_jsonl:
+            instrument.hooks.append(JsonLinesHook(args.stats_jsonl))
+        if args.stats_prom:
+            prometheus = PrometheusHook()
+            instrument.hooks.append(prometheus)
+
+    options = dict(
+        workers=args.workers,
+        engine=args.engine,
+        outlier_pct=args.outlier_pct,
+        margin=args.margin,
+        raster_dpi=args.raster_dpi,
+        raster_tolerance=args.raster_tolerance,
+        reuse=args.reuse,
+        share_memo=args.reuse_across_files,
+        streaming=args.streaming,
+        incremental=args.incremental,
+        transform=args.transform,
+        dedupe=args.dedupe,
+        timeout=args.timeout,
+        memory_limit=args.memory_limit << 20 if args.memory_limit else None,
+        cache=cache,
+        instrument=instrument,
+        on_result=print,
+    )
+    if args.queue is not None:
+        from center_jobs import JobQueue, run_queue
+
+        # 이미 대기열에 있는 파일은 상태를 유지하므로, 다시 실행하면 남은 작업과 실패한 작업만 처리함.
+        # 찾은 파일은 일정 개수씩 추가하며 탐색이 끝나기 전부터 변환함
+        with JobQueue(args.queue) as job_queue:
+            print(f"'{args.input}' 폴더의 PDF 파일을 작업 대기열 '{args.queue}'에 추가하며 변환합니다...")
+            summary = run_queue(job_queue, jobs, reset=args.force, **options)
+            print(f"작업 대기열 '{args.queue}': {job_queue.summary()}")
+    else:
+        print(f"'{args.input}' 폴더의 PDF 파일을 변환합니다...")
+        summary = center_batch(jobs, chunksize=args.chunksize, page_workers=args.page_workers,
+                               **options)
+    if prometheus is not None:
+        prometheus.write(args.stats_prom)
+    print(summary)
+    print(f"입력 탐색: {discovery}")
+    return 0 if summary.failed == 0 else 1
+
+
+def _combine_main(pdfs: List[Path], output_p: Path, args) -> int:
+    """``--combine``: center *pdfs* into the single file *output_p*."""
+    from resource_dedupe import DedupeReport
+
+    # 이전 실행에서 만든 합본은 다시 합치지 않음
+    pdfs = sorted(p for p in pdfs if not (output_p.exists() and os.path.samefile(p, output_p)))
+    print(f"총 {len(pdfs)}개의 PDF 파일을 '{output_p}' 하나로 합칩니다...")
+    report = DedupeReport()
+    try:
+        pages = center_pdf_combined(
+            pdfs, output_p, engine=args.engine, outlier_pct=args.outlier_pct, margin=args.margin,
+            reuse=args.reuse, raster_dpi=args.raster_dpi, raster_tolerance=args.raster_tolerance,
+            transform=args.transform, dedupe_report=report)
     except Exception as e:
-        # 모든 종류의 오류를 포괄적으로 처리
-        print(f"'{input_path}' 파일 변환 중 오류 발생: {e}", file=sys.stderr)
-        return False
+        print(f"합치는 중 오류 발생: {e}", file=sys.stderr)
+        return 1
+    print(f"완료: {pages}쪽, {output_p.stat().st_size / (1 << 20):.1f} MB ({report})")
+    return 0
 
 
 if __name__ == "__main__":
-    pdfs_path = "pdfs"  # PDF 파일이 있는 폴더 경로
-    prefix = "centered_"  # 변환된 PDF 파일의 접두사
-
-    pdfs_dir = Path(pdfs_path)
-    if not pdfs_dir.is_dir():
-        print(f"오류: '{pdfs_path}' 폴더를 찾을 수 없습니다.", file=sys.stderr)
-        sys.exit(1)
-
-    pdfs = list(pdfs_dir.glob("*.pdf"))
-    if not pdfs:
-        print(f"'{pdfs_path}' 폴더에 PDF 파일이 없습니다.", file=sys.stderr)
-        sys.exit(1)
-
-    print(f"총 {len(pdfs)}개의 PDF 파일을 변환합니다...")
-    for pdf_path in pdfs:
-        output_pdf = pdf_path.with_name(f"{prefix}{pdf_path.name}")
-        center_pdf(pdf_path, output_pdf)
+    sys.exit(main())
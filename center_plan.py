@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""center_plan.py
+
+Analyze-only "plan" mode: split centering into an expensive analysis step
+and a cheap apply step.
+
+``analyze`` runs the bbox engine over every page and records, per page, the
+content bbox, the computed (tx, ty) and whether the shift is large enough to
+be applied. No output PDF is written. ``apply`` reads such a plan and only
+performs the PyPDF2 transform and write; pdfplumber is never opened, so a
+plan reviewed on one machine can be applied cheaply on another.
+
+Plans are stored as JSON (``.json``, human-reviewable) or a compact binary
+format (any other suffix, conventionally ``.cfplan``):
+
+    header  b"CFPL" | u16 version | u32 page count | 32-byte input SHA-256
+            | u32 options length | options as UTF-8 JSON
+    page    u8 flags (1: has bbox, 2: applied) | 6 × f64 (bbox[4], tx, ty)
+
+Usage:
+    uv run center_plan.py analyze input.pdf -o input.cfplan [--engine stream]
+    uv run center_plan.py apply input.pdf input.cfplan -o centered.pdf
+"""
+
+import argparse
+import json
+import struct
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from PyPDF2 import PdfReader
+
+from center_cache import file_sha256
+from center_pdf import (DEFAULT_ENGINE, DEFAULT_TRANSFORM, ENGINES, RASTER_DPI, RASTER_TOLERANCE,
+                        SHIFT_THRESHOLD, TRANSFORM_MODES, _analyze, _cache_params, _shift_for_bbox,
+                        _write_shifted)
+
+PLAN_VERSION = 1
+
+_MAGIC = b"CFPL"
+_HEADER = struct.Struct("<4sHI32sI")
+_PAGE = struct.Struct("<B6d")
+_HAS_BBOX, _APPLIED = 1, 2
+
+
+class PlanMismatchError(ValueError):
+    """The plan was made for a different input file."""
+
+
+@dataclass
+class PagePlan:
+    """Analysis result of one page."""
+
+    bbox: Optional[Tuple[float, float, float, float]]
+    tx: float
+    ty: float
+    applied: bool
+
+
+@dataclass
+class CenterPlan:
+    """Per-page shifts of one input file, plus what they were computed with."""
+
+    input_sha256: str
+    options: dict
+    pages: List[PagePlan] = field(default_factory=list)
+
+    @property
+    def applied_pages(self) -> int:
+        return sum(1 for p in self.pages if p.applied)
+
+
+def analyze_pdf(input_path: Union[str, Path], **options) -> CenterPlan:
+    """Analyze *input_path* and return its plan without writing any PDF.
+
+    Args:
+        input_path: 원본 PDF 파일 경로.
+        **options: engine, outlier_pct, margin, threshold, page_workers, raster_dpi,
+            raster_tolerance (:func:`center_pdf.center_pdf` 와 동일).
+    """
+    input_p = Path(input_path)
+    params = _cache_params(options)
+    if params["engine"] not in ENGINES:
+        raise ValueError(f"unknown engine {params['engine']!r}; expected one of {ENGINES}")
+    reader = PdfReader(input_p)
+    raster = {k: params[k] for k in ("raster_dpi", "raster_tolerance") if k in params}
+    geometry = _analyze(input_p, reader, params["engine"], params["outlier_pct"],
+                        options.get("page_workers", 1), **raster)
+
+    plan = CenterPlan(file_sha256(input_p), params)
+    for bbox, page_w, page_h in geometry:
+        tx, ty = _shift_for_bbox(bbox, page_w, page_h, params["margin"])
+        applied = abs(tx) > params["threshold"] or abs(ty) > params["threshold"]
+        plan.pages.append(PagePlan(bbox, tx, ty, applied))
+    return plan
+
+
+def apply_plan(
+    plan: CenterPlan,
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    verify: bool = True,
+    transform: str = DEFAULT_TRANSFORM,
+) -> int:
+    """Write *input_path* translated per *plan* to *output_path*; return page count.
+
+    With *verify* (the default) the input's SHA-256 must match the plan.
+    The page count must match even without it, since each shift belongs to
+    one page. *transform* is a ``center_pdf.TRANSFORM_MODES`` entry; the plan
+    does not depend on it, so one plan can be applied either way.
+    """
+    input_p, output_p = Path(input_path), Path(output_path)
+    if verify and file_sha256(input_p) != plan.input_sha256:
+        raise PlanMismatchError(f"'{input_p}' does not match the plan's input hash")
+
+    reader = PdfReader(input_p)
+    if len(reader.pages) != len(plan.pages):
+        raise PlanMismatchError(
+            f"'{input_p}' has {len(reader.pages)} pages but the plan has {len(plan.pages)}")
+    output_p.parent.mkdir(parents=True, exist_ok=True)
+    # 적용하지 않기로 한 페이지는 (0, 0)으로 넘겨 임계값 판단을 계획에 맡김
+    shifts = [(p.tx, p.ty) if p.applied else (0.0, 0.0) for p in plan.pages]
+    return _write_shifted(reader, shifts, output_p, threshold=0.0, transform=transform)
+
+
+def save_plan(plan: CenterPlan, path: Union[str, Path]):
+    """Write *plan* as JSON if *path* ends in ``.json``, else in the binary format."""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        data = {"version": PLAN_VERSION, **asdict(plan)}
+        path.write_text(json.dumps(data, indent=1))
+        return
+
+    options = json.dumps(plan.options, sort_keys=True).encode()
+    chunks = [_HEADER.pack(_MAGIC, PLAN_VERSION, len(plan.pages),
+                           bytes.fromhex(plan.input_sha256), len(options)), options]
+    for page in plan.pages:
+        flags = (_HAS_BBOX if page.bbox is not None else 0) | (_APPLIED if page.applied else 0)
+        chunks.append(_PAGE.pack(flags, *(page.bbox or (0.0, 0.0, 0.0, 0.0)), page.tx, page.ty))
+    path.write_bytes(b"".join(chunks))
+
+
+def load_plan(path: Union[str, Path]) -> CenterPlan:
+    """Read a plan written by :func:`save_plan` (format detected from content)."""
+    data = Path(path).read_bytes()
+    if not data.startswith(_MAGIC):
+        raw = json.loads(data)
+        if raw.get("version") != PLAN_VERSION:
+            raise ValueError(f"unsupported plan version {raw.get('version')!r}")
+        pages = [PagePlan(tuple(p["bbox"]) if p["bbox"] else None, p["tx"], p["ty"], p["applied"])
+                 for p in raw["pages"]]
+        return CenterPlan(raw["input_sha256"], raw["options"], pages)
+
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated plan file")
+    _, version, count, digest, options_len = _HEADER.unpack_from(data)
+    if version != PLAN_VERSION:
+        raise ValueError(f"unsupported plan version {version!r}")
+    offset = _HEADER.size
+    options = json.loads(data[offset:offset + options_len])
+    offset += options_len
+
+    # unpack은 길이가 모자라면 struct.error를 내므로 먼저 검사
+    if len(data) < offset + count * _PAGE.size:
+        raise ValueError("truncated plan file")
+    pages = []
+    for flags, x0, x1, y0, y1, tx, ty in _PAGE.iter_unpack(data[offset:offset + count * _PAGE.size]):
+        bbox = (x0, x1, y0, y1) if flags & _HAS_BBOX else None
+        pages.append(PagePlan(bbox, tx, ty, bool(flags & _APPLIED)))
+    return CenterPlan(digest.hex(), options, pages)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="PDF 중앙 정렬을 분석(plan)과 적용(apply) 단계로 나누어 실행합니다.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_analyze = sub.add_parser("analyze", help="페이지별 이동량을 계산해 계획 파일로 저장")
+    p_analyze.add_argument("input")
+    p_analyze.add_argument("-o", "--output", help="계획 파일 경로 (.json 또는 .cfplan, 기본값: <input>.cfplan)")
+    p_analyze.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE)
+    p_analyze.add_argument("--outlier-pct", type=float, default=0.0)
+    p_analyze.add_argument("--margin", type=float, default=0.0)
+    p_analyze.add_argument("--threshold", type=float, default=SHIFT_THRESHOLD)
+    p_analyze.add_argument("--page-workers", type=int, default=1)
+    p_analyze.add_argument("--raster-dpi", type=float, default=RASTER_DPI)
+    p_analyze.add_argument("--raster-tolerance", type=int, default=RASTER_TOLERANCE)
+
+    p_apply = sub.add_parser("apply", help="계획 파일대로 변환만 수행 (pdfplumber 불필요)")
+    p_apply.add_argument("input")
+    p_apply.add_argument("plan")
+    p_apply.add_argument("-o", "--output", required=True)
+    p_apply.add_argument("--no-verify", action="store_true", help="입력 파일 해시 검사를 건너뜀")
+    p_apply.add_argument("--transform", choices=TRANSFORM_MODES, default=DEFAULT_TRANSFORM,
+                         help="이동 방식 (기본값: %(default)s)")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "analyze":
+            plan = analyze_pdf(args.input, engine=args.engine, outlier_pct=args.outlier_pct,
+                               margin=args.margin, threshold=args.threshold,
+                               page_workers=args.page_workers, raster_dpi=args.raster_dpi,
+                               raster_tolerance=args.raster_tolerance)
+            output = args.output or str(Path(args.input).with_suffix(".cfplan"))
+            save_plan(plan, output)
+            print(f"{len(plan.pages)}쪽 중 {plan.applied_pages}쪽에 이동이 필요합니다. "
+                  f"계획을 '{output}'에 저장했습니다.")
+        else:
+            pages = apply_plan(load_plan(args.plan), args.input, args.output,
+                               verify=not args.no_verify, transform=args.transform)
+            print(f"{pages}쪽을 변환하여 '{args.output}'에 저장했습니다.")
+    except Exception as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
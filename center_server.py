@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""center_server.py
+
+Long-running local HTTP service for ``center_pdf``.
+
+Worker processes are started (and pdfplumber/PyPDF2 imported) once, so a
+request only pays for the centering itself instead of a Python start-up per
+job. Admission is bounded: at most ``workers + queue_size`` requests are
+accepted at a time and the rest get ``503 Service Unavailable`` with a
+``Retry-After`` header, so a burst cannot pile up unbounded work. A
+request takes its slot before its body is read, so refused requests are
+never buffered.
+
+Endpoints:
+    POST /center     body: PDF bytes → centered PDF (``X-Pages`` header)
+                     query: engine, outlier_pct, margin, threshold, reuse, streaming,
+                            incremental, transform, dedupe, raster_dpi, raster_tolerance
+    GET  /metrics    Prometheus text format: request/centering latency
+                     histograms, status counters, queue depth, in-flight jobs
+    GET  /healthz    "ok"
+
+Usage:
+    uv run center_server.py [--host 127.0.0.1] [--port 8765] [-j 4] [--queue-size 16]
+    curl --data-binary @in.pdf -o out.pdf "http://127.0.0.1:8765/center?engine=stream"
+
+``--port 0`` binds a free port and prints it, which is convenient for
+scripted checks against localhost.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from PyPDF2.errors import PdfReadError
+
+from center_pdf import _check_option_dict, center_pdf_bytes, warm_up
+
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SIZE = 16
+DEFAULT_MAX_BODY = 256 << 20  # 256 MiB
+
+# 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_FLOAT_OPTIONS = ("outlier_pct", "margin", "threshold", "raster_dpi")
+
+
+class QueueFull(Exception):
+    """Every worker is busy and the request queue is at capacity."""
+
+
+def _warm_up() -> int:
+    """No-op task that makes the executor start a worker (whose initializer imports the modules)."""
+    return os.getpid()
+
+
+def _center_job(data: bytes, options: dict) -> Tuple[bytes, int, float]:
+    """Worker body: return (centered PDF, page count, seconds spent centering)."""
+    start = time.perf_counter()
+    output = io.BytesIO()
+    pages = center_pdf_bytes(data, output, **options)
+    return output.getvalue(), pages, time.perf_counter() - start
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram, safe to observe from several threads."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    def render(self, name: str, help_text: str) -> str:
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+        cumulative += counts[-1]
+        lines.append(f'{name}_bucket{{le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum {total}")
+        lines.append(f"{name}_count {cumulative}")
+        return "\n".join(lines)
+
+
+class CenterService:
+    """Warm process pool with bounded admission; the HTTP layer only translates requests."""
+
+    def __init__(self, workers: Optional[int] = None, queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Args:
+            workers: 워커 프로세스 수. None이면 CPU 코어 수.
+            queue_size: 모든 워커가 바쁠 때 대기시킬 수 있는 요청 수.
+                이를 넘는 요청은 :class:`QueueFull` 로 거절됩니다.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.capacity = self.workers + max(0, queue_size)
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.in_flight = 0
+        self.pages = 0
+        self.statuses: Dict[int, int] = {}
+        self.request_seconds = Histogram()
+        self.center_seconds = Histogram()
+
+    def start(self):
+        """Start the worker processes and wait until each has imported its modules."""
+        self._pool = self._new_pool()
+        # 워커마다 하나씩 넉넉히 보내 모든 프로세스가 미리 뜨도록 함
+        for future in [self._pool.submit(_warm_up) for _ in range(self.workers * 2)]:
+            future.result()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # 무거운 모듈은 처음 쓸 때 불러오므로, 워커가 시작할 때 미리 불러 첫 요청이 기다리지 않게 함
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=warm_up)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    @contextlib.contextmanager
+    def admit(self) -> Iterator[None]:
+        """Hold one of the service's slots for the block.
+
+        Raises :class:`QueueFull` without waiting when the service is at
+        capacity, so a caller can refuse a request before reading its body.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise QueueFull()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def center(self, data: bytes, options: dict) -> Tuple[bytes, int]:
+        """Center *data* on a worker and return (PDF bytes, pages).
+
+        Raises :class:`QueueFull` without waiting when the service is at capacity.
+        """
+        with self.admit():
+            return self.center_admitted(data, options)
+
+    def center_admitted(self, data: bytes, options: dict) -> Tuple[bytes, int]:
+        """:meth:`center` for a caller already inside :meth:`admit`."""
+        with self._lock:
+            pool = self._pool
+        try:
+            output, pages, seconds = pool.submit(_center_job, data, options).result()
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되면 풀을 새로 만들어 이후 요청은 계속 처리
+            self._replace_pool(pool)
+            raise
+        self.center_seconds.observe(seconds)
+        with self._lock:
+            self.pages += pages
+        return output, pages
+
+    def _replace_pool(self, broken: ProcessPoolExecutor):
+        with self._lock:
+            if self._pool is not broken:
+                return  # 다른 요청이 이미 교체함
+            self._pool = self._new_pool()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def record(self, status: int, seconds: float):
+        self.request_seconds.observe(seconds)
+        with self._lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def metrics(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            statuses = sorted(self.statuses.items())
+            in_flight, pages = self.in_flight, self.pages
+        lines = [
+            "# HELP centerframe_requests_total Finished /center requests by HTTP status.",
+            "# TYPE centerframe_requests_total counter",
+        ]
+        lines += [f'centerframe_requests_total{{status="{code}"}} {count}' for code, count in statuses]
+        lines += [
+            self.request_seconds.render(
+                "centerframe_request_seconds", "Wall time of /center requests, including queueing."),
+            self.center_seconds.render(
+                "centerframe_center_seconds", "Time spent centering inside a worker."),
+            "# HELP centerframe_pages_total Pages centered.",
+            "# TYPE centerframe_pages_total counter",
+            f"centerframe_pages_total {pages}",
+            "# HELP centerframe_in_flight Accepted requests, queued or running.",
+            "# TYPE centerframe_in_flight gauge",
+            f"centerframe_in_flight {in_flight}",
+            "# HELP centerframe_queue_depth Accepted requests waiting for a worker.",
+            "# TYPE centerframe_queue_depth gauge",
+            f"centerframe_queue_depth {max(0, in_flight - self.workers)}",
+            "# HELP centerframe_queue_capacity Maximum accepted requests before 503.",
+            "# TYPE centerframe_queue_capacity gauge",
+            f"centerframe_queue_capacity {self.capacity}",
+            "# HELP centerframe_workers Worker processes.",
+            "# TYPE centerframe_workers gauge",
+            f"centerframe_workers {self.workers}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def parse_options(query: str) -> dict:
+    """Turn a /center query string into ``center_pdf_bytes`` keyword arguments.
+
+    Raises ValueError for unknown names, invalid values or combinations
+    ``center_pdf_bytes`` would reject (e.g. dedupe with streaming).
+    """
+    options = {}
+    for name, values in parse_qs(query, strict_parsing=False).items():
+        value = values[-1]
+        if name in ("engine", "reuse", "transform"):
+            options[name] = value
+        elif name in _FLOAT_OPTIONS:
+            options[name] = float(value)
+        elif name == "raster_tolerance":
+            options[name] = int(value)
+        elif name in ("streaming", "incremental", "dedupe"):
+            options[name] = value.lower() in ("1", "true", "yes", "on")
+        else:
+            raise ValueError(f"unknown option {name!r}")
+    # 워커에서 실패해 500이 되지 않도록 center_pdf_bytes와 같은 검사를 여기서 함
+    _check_option_dict(options)
+    return options
+
+
+class CenterRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end of a :class:`CenterService` (set as ``server.service``)."""
+
+    server_version = "centerframe-pdf"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> CenterService:
+        return self.server.service
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/metrics":
+            self._send(200, self.service.metrics().encode(), "text/plain; version=0.0.4")
+        elif path == "/healthz":
+            self._send(200, b"ok\n", "text/plain")
+        else:
+            self._send(404, b"not found\n", "text/plain")
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/center":
+            self._send(404, b"not found\n", "text/plain")
+            return
+
+        start = time.perf_counter()
+        status = self._handle_center(url.query)
+        self.service.record(status, time.perf_counter() - start)
+
+    def _handle_center(self, query: str) -> int:
+        try:
+            options = parse_options(query)
+        except ValueError as e:
+            return self._error(400, str(e))
+
+        # 아래의 거절 응답은 모두 본문을 읽기 전에 보내므로 연결을 재사용할 수 없음
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.close_connection = True
+            return self._error(411, "Content-Length required")
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            return self._error(400, "invalid Content-Length")
+        if length > self.server.max_body:
+            self.close_connection = True
+            return self._error(413, f"request body exceeds {self.server.max_body} bytes")
+
+        try:
+            # 자리를 먼저 잡아, 과부하일 때는 본문을 버퍼에 올리지 않고 바로 거절함
+            with self.service.admit():
+                data = self.rfile.read(length)
+                if len(data) < length:
+                    self.close_connection = True
+                    return self._error(400, "request body shorter than Content-Length")
+                output, pages = self.service.center_admitted(data, options)
+        except QueueFull:
+            self.close_connection = True
+            return self._error(503, "server busy, retry later", {"Retry-After": "1"})
+        except PdfReadError as e:
+            return self._error(400, f"invalid PDF: {e}")
+        except ValueError as e:
+            # 옵션 검사를 통과했더라도 워커에서 잘못된 값으로 판명된 요청
+            return self._error(400, str(e))
+        except Exception as e:
+            return self._error(500, str(e))
+
+        self._send(200, output, "application/pdf", {"X-Pages": str(pages)})
+        return 200
+
+    def _error(self, status: int, message: str, headers: Optional[dict] = None) -> int:
+        self._send(status, (message + "\n").encode(), "text/plain; charset=utf-8", headers)
+        return status
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[dict] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.close_connection:
+            # 읽지 않은 본문이 남은 연결을 클라이언트가 다시 쓰지 않도록 알림
+            self.send_header("Connection", "close")
+        try:
+            self.end_headers()
+            self.wfile.write(body)
+        except ConnectionError:
+            self.close_connection = True  # 클라이언트가 응답을 받기 전에 연결을 끊음
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(
+    service: CenterService,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    max_body: int = DEFAULT_MAX_BODY,
+    quiet: bool = False,
+) -> ThreadingHTTPServer:
+    """Bind an HTTP server for *service*; port 0 picks a free port (see ``server_address``)."""
+    server = ThreadingHTTPServer((host, port), CenterRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.max_body = max_body
+    server.quiet = quiet
+    return server
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="PDF 중앙 정렬 HTTP 서버를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드할 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"포트. 0이면 빈 포트를 골라 출력합니다. (기본값: {DEFAULT_PORT})")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="워커 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="워커가 모두 바쁠 때 대기시킬 요청 수. 넘으면 503 (기본값: %(default)s)")
+    parser.add_argument("--max-body-mb", type=int, default=DEFAULT_MAX_BODY >> 20,
+                        help="요청 본문 크기 상한, MB (기본값: %(default)s)")
+    parser.add_argument("--quiet", action="store_true", help="요청 로그를 출력하지 않음")
+    args = parser.parse_args(argv)
+
+    service = CenterService(args.workers, args.queue_size)
+    service.start()
+    server = make_server(service, args.host, args.port, args.max_body_mb << 20, args.quiet)
+    host, port = server.server_address[:2]
+    print(f"http://{host}:{port} 에서 대기 중 (워커 {service.workers}개, 대기열 {args.queue_size})",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""center_watch.py
+
+Watch-folder daemon: center PDFs as they arrive in an input directory.
+
+New or replaced ``*.pdf`` files are picked up through inotify on Linux (a
+polling scan elsewhere, or when inotify is unavailable). A file is only
+dispatched once it is complete: immediately after the writer closes it or
+moves it into place (inotify), otherwise once its size and mtime have been
+unchanged for ``--settle`` seconds. Files are centered on a
+``center_batch.WarmPool`` and written under the same name to a separate
+output directory, so outputs are never picked up again as inputs. A worker
+that crashes is replaced; only the file it was converting is recorded as
+failed.
+
+A JSON state file (default ``<output>/.centerframe-watch.json``) records
+the size, mtime and result of every processed input together with the
+centering options. After a restart only files that are new, changed since,
+or whose output went missing are processed again; changing the options
+reprocesses everything.
+
+Usage:
+    uv run center_watch.py INPUT_DIR OUTPUT_DIR [-j 4] [--engine stream]
+    uv run center_watch.py INPUT_DIR OUTPUT_DIR --once     # process backlog and exit
+"""
+
+import argparse
+import ctypes
+import json
+import os
+import queue
+import select
+import signal
+import struct
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from center_batch import CenterResult, WarmPool
+from center_pdf import (DEFAULT_ENGINE, DEFAULT_TRANSFORM, ENGINES, RASTER_DPI, RASTER_TOLERANCE,
+                        SHIFT_THRESHOLD, TRANSFORM_MODES, _cache_params)
+from page_fingerprint import REUSE_MODES
+
+STATE_VERSION = 1
+STATE_NAME = ".centerframe-watch.json"
+
+# 파일 크기와 수정 시각이 이 시간(초) 동안 그대로면 쓰기가 끝난 것으로 봄
+DEFAULT_SETTLE = 1.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+# inotify (linux/inotify.h)
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_Q_OVERFLOW = 0x4000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+_EVENT = struct.Struct("iIII")
+
+
+def _is_candidate(name: str) -> bool:
+    # 숨김 파일과 다운로드/편집 중인 임시 파일은 제외
+    return name.lower().endswith(".pdf") and not name.startswith((".", "~"))
+
+
+class _InotifyWatcher:
+    """Directory watcher on raw inotify through ctypes (Linux only)."""
+
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_MODIFY
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for '{directory}'")
+
+    def wait(self, timeout: float) -> Optional[List[Tuple[str, bool]]]:
+        """Return (name, complete) events, or None if events were lost and a rescan is needed.
+
+        *complete* is True when the writer closed the file or moved it into place.
+        """
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events, offset = [], 0
+        while offset < len(data):
+            _, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            if name:
+                events.append((name, bool(mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO))))
+        return events
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _PollingWatcher:
+    """Fallback watcher: reports every entry on each scan; stability is checked by the caller."""
+
+    def __init__(self, directory: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.directory = directory
+        self.interval = interval
+        self._last_scan = time.monotonic()
+
+    def wait(self, timeout: float) -> Optional[List[Tuple[str, bool]]]:
+        remaining = self._last_scan + self.interval - time.monotonic()
+        if remaining > timeout:
+            time.sleep(timeout)
+            return []
+        time.sleep(max(0.0, remaining))
+        self._last_scan = time.monotonic()
+        return None  # 전체 재검사
+
+    def close(self):
+        pass
+
+
+def open_watcher(directory: Path, use_inotify: bool = True, poll_interval: float = DEFAULT_POLL_INTERVAL):
+    """Return an inotify watcher for *directory* when possible, else a polling one."""
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass  # inotify 한도 초과, 지원하지 않는 파일시스템 등
+    return _PollingWatcher(directory, poll_interval)
+
+
+class WatchState:
+    """Persistent record of processed inputs, keyed by file name."""
+
+    def __init__(self, path: Path, params: dict):
+        self.path = path
+        self.params = params
+        self.files: Dict[str, dict] = {}
+        try:
+            raw = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+        # 옵션이 바뀌면 이전 결과는 모두 다시 처리
+        if raw.get("version") == STATE_VERSION and raw.get("params") == params:
+            self.files = raw.get("files", {})
+
+    def is_done(self, name: str, st: os.stat_result, output_p: Path) -> bool:
+        entry = self.files.get(name)
+        if entry is None or entry["size"] != st.st_size or entry["mtime_ns"] != st.st_mtime_ns:
+            return False
+        # 실패한 파일은 바뀌기 전까지 다시 시도하지 않음; 성공한 파일은 출력이 남아 있어야 함
+        return not entry["ok"] or output_p.exists()
+
+    def record(self, name: str, st: os.stat_result, result: CenterResult):
+        self.files[name] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "ok": result.ok,
+            "pages": result.pages,
+            "error": result.error,
+        }
+
+    def save(self):
+        data = {"version": STATE_VERSION, "params": self.params, "files": self.files}
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+
+class FolderWatcher:
+    """Center every PDF that appears in *input_dir* into *output_dir*."""
+
+    def __init__(
+        self,
+        input_dir,
+        output_dir,
+        *,
+        state_path=None,
+        workers: Optional[int] = None,
+        settle: float = DEFAULT_SETTLE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_inotify: bool = True,
+        on_result: Optional[Callable[[CenterResult], None]] = None,
+        **options,
+    ):
+        """
+        Args:
+            input_dir: 감시할 폴더.
+            output_dir: 결과를 저장할 폴더. 입력 폴더와 달라야 합니다.
+            state_path: 상태 파일 경로. None이면 출력 폴더의 ``.centerframe-watch.json``.
+            workers: 워커 프로세스 수. None이면 CPU 코어 수.
+            settle: 폴링 모드에서 파일 크기와 수정 시각이 이 시간(초) 동안 그대로여야
+                쓰기가 끝난 것으로 봅니다.
+            poll_interval: 폴링 모드의 검사 간격(초).
+            use_inotify: False면 Linux에서도 폴링을 사용합니다.
+            on_result: 파일 하나가 끝날 때마다 호출됩니다.
+            **options: engine, outlier_pct, margin 등 :func:`center_pdf.center_pdf` 의 키워드 인자.
+        """
+        self.input_dir = Path(input_dir).resolve()
+        self.output_dir = Path(output_dir).resolve()
+        if self.input_dir == self.output_dir:
+            raise ValueError("output directory must differ from the input directory")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.state = WatchState(Path(state_path) if state_path else self.output_dir / STATE_NAME,
+                                _cache_params(options))
+        self.workers = workers
+        self.settle = settle
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.on_result = on_result
+        self.options = options
+        self._stop = threading.Event()
+        # 이름 -> (크기, 수정 시각, 처음 본 시각, 닫힘 이벤트 수신 여부)
+        self._pending: Dict[str, Tuple[int, int, float, bool]] = {}
+        # 작업 번호 -> (이름, 제출할 때의 상태)
+        self._running: Dict[int, Tuple[str, os.stat_result]] = {}
+        self._results = queue.Queue()
+        self._next_job = 0
+
+    def stop(self):
+        """Ask :meth:`run` to finish in-flight files and return (safe from signal handlers)."""
+        self._stop.set()
+
+    def _scan(self) -> Iterator[str]:
+        with os.scandir(self.input_dir) as it:
+            for entry in it:
+                if entry.is_file() and _is_candidate(entry.name):
+                    yield entry.name
+
+    def _note(self, name: str, complete: bool = False):
+        if not _is_candidate(name):
+            return
+        try:
+            st = os.stat(self.input_dir / name)
+        except FileNotFoundError:
+            self._pending.pop(name, None)
+            return
+        previous = self._pending.get(name)
+        if previous is not None and previous[:2] == (st.st_size, st.st_mtime_ns):
+            if complete and not previous[3]:
+                self._pending[name] = previous[:3] + (True,)
+            return
+        self._pending[name] = (st.st_size, st.st_mtime_ns, time.monotonic(), complete)
+
+    def _ready(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield pending files whose writes have finished, removing them from the pending set."""
+        now = time.monotonic()
+        busy = {name for name, _ in self._running.values()}
+        for name, (size, mtime_ns, since, complete) in list(self._pending.items()):
+            if name in busy:
+                continue  # 변환 중인 파일은 끝난 뒤 다시 확인
+            try:
+                st = os.stat(self.input_dir / name)
+            except FileNotFoundError:
+                del self._pending[name]
+                continue
+            if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+                self._pending[name] = (st.st_size, st.st_mtime_ns, now, False)
+                continue
+            # 닫힘/이동 이벤트를 받았거나, 크기와 수정 시각이 settle초 동안 그대로인 파일만 처리
+            # (감시 시작 전에 이미 있던 파일은 수정 시각으로 판단)
+            settled = now - since >= self.settle or time.time() - st.st_mtime >= self.settle
+            if not (complete or settled):
+                continue
+            del self._pending[name]
+            if not self.state.is_done(name, st, self.output_dir / name):
+                yield name, st
+
+    def _collect(self, pool: WarmPool, block: bool = False) -> int:
+        """Record finished files (with *block*, wait for all running ones); return how many finished."""
+        finished = 0
+        while self._running:
+            try:
+                job_id, result = self._results.get(timeout=0.5) if block else self._results.get_nowait()
+            except queue.Empty:
+                if not block:
+                    break
+                pool.progress()  # 아무도 읽지 않는 페이지 진행이 쌓이지 않도록 비움
+                continue
+            finished += 1
+            # 워커가 죽거나 시간을 넘긴 경우에도 WarmPool이 그 파일만 실패로 돌려주고
+            # 워커를 교체하므로, 같이 변환 중이던 다른 파일은 영향을 받지 않음
+            name, st = self._running.pop(job_id)
+            self.state.record(name, st, result)
+            if self.on_result is not None:
+                self.on_result(result)
+            # 변환 중에 파일이 바뀌었을 수 있으므로 다시 확인 대상으로
+            self._note(name)
+        if finished:
+            self.state.save()
+        return finished
+
+    def run(self, once: bool = False):
+        """Process existing files, then watch for new ones until :meth:`stop`.
+
+        With *once*, return after the files present at start have been processed.
+        """
+        watcher = open_watcher(self.input_dir, self.use_inotify, self.poll_interval)
+        try:
+            pool = WarmPool(self.workers)
+            try:
+                for name in self._scan():
+                    self._note(name)
+                self._loop(pool, watcher, once)
+                self._collect(pool, block=True)
+            finally:
+                pool.close()
+        finally:
+            watcher.close()
+
+    def _loop(self, pool: WarmPool, watcher, once: bool):
+        while not self._stop.is_set():
+            for name, st in self._ready():
+                src, dst = self.input_dir / name, self.output_dir / name
+                self._next_job += 1
+                self._running[self._next_job] = (name, st)
+                pool.submit(self._next_job, src, dst, self._results.put, **self.options)
+
+            self._collect(pool)
+            pool.progress()
+            if once and not self._pending and not self._running:
+                return
+
+            # 변환 중이거나 안정화를 기다리는 파일이 있으면 짧게 깨어나 확인
+            if self._running:
+                timeout = 0.05
+            elif self._pending:
+                timeout = self.settle / 4
+            else:
+                timeout = 1.0
+            events = watcher.wait(timeout)
+            if events is None:
+                for name in self._scan():
+                    self._note(name)
+            else:
+                for name, complete in events:
+                    self._note(name, complete)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="폴더를 감시하며 새로 들어온 PDF를 중앙 정렬합니다.")
+    parser.add_argument("input_dir", help="감시할 폴더")
+    parser.add_argument("output_dir", help="결과를 저장할 폴더 (입력 폴더와 달라야 함)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="워커 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--state", default=None,
+                        help=f"상태 파일 경로 (기본값: OUTPUT_DIR/{STATE_NAME})")
+    parser.add_argument("--settle", type=float, default=DEFAULT_SETTLE,
+                        help="폴링 모드에서 쓰기가 끝났다고 볼 때까지 기다릴 시간, 초 (기본값: %(default)s)")
+    parser.add_argument("--poll", action="store_true", help="inotify 대신 폴링으로 감시")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help="폴링 간격, 초 (기본값: %(default)s)")
+    parser.add_argument("--once", action="store_true", help="현재 있는 파일만 처리하고 종료")
+    parser.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE)
+    parser.add_argument("--outlier-pct", type=float, default=0.0)
+    parser.add_argument("--raster-dpi", type=float, default=RASTER_DPI)
+    parser.add_argument("--raster-tolerance", type=int, default=RASTER_TOLERANCE)
+    parser.add_argument("--margin", type=float, default=0.0)
+    parser.add_argument("--threshold", type=float, default=SHIFT_THRESHOLD)
+    parser.add_argument("--reuse", choices=REUSE_MODES, default="off")
+    parser.add_argument("--streaming", action="store_true")
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--transform", choices=TRANSFORM_MODES, default=DEFAULT_TRANSFORM)
+    parser.add_argument("--dedupe", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        watcher = FolderWatcher(
+            args.input_dir, args.output_dir, state_path=args.state, workers=args.workers,
+            settle=args.settle, poll_interval=args.poll_interval, use_inotify=not args.poll,
+            on_result=lambda r: print(r, flush=True), engine=args.engine,
+            outlier_pct=args.outlier_pct, margin=args.margin, threshold=args.threshold,
+            reuse=args.reuse, streaming=args.streaming, incremental=args.incremental,
+            transform=args.transform, dedupe=args.dedupe, raster_dpi=args.raster_dpi,
+            raster_tolerance=args.raster_tolerance)
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: watcher.stop())
+    if not args.once:
+        print(f"'{watcher.input_dir}' 폴더를 감시합니다. 종료하려면 Ctrl+C를 누르세요.", flush=True)
+    watcher.run(once=args.once)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""incremental_writer.py
+
+Incremental-update output for ``center_pdf``.
+
+Instead of re-serializing the whole document, the original bytes are copied
+verbatim and an incremental update (ISO 32000-1, 7.5.6) is appended that
+redefines only the pages that move. Each moved page keeps its object number;
+its /Contents becomes ``[prefix, original streams..., suffix]`` where the
+prefix is a small ``q 1 0 0 1 tx ty cm`` stream and the suffix a ``Q`` stream
+shared by all pages, the same ``q cm ... Q`` wrapping that
+``PageObject.add_transformation`` produces. Images, fonts and unchanged
+pages are neither decoded nor rewritten, so write time and memory hardly
+depend on the file size, and document-level structure (outlines, forms,
+metadata) is kept as is. With the "box" transform of ``center_pdf`` the
+page dict is redefined with moved page boxes and no new streams at all.
+
+The update's cross-reference section follows the original file: a classic
+xref table and trailer when the last section is a table, an xref stream
+otherwise, each linked to the previous section through /Prev.
+"""
+
+import io
+import re
+import zlib
+from typing import BinaryIO, Dict, List, Tuple
+
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)")
+_OBJ_HEADER = re.compile(rb"\s*\d+\s+\d+\s+obj\b")
+
+# 원본 끝부분에서 startxref를 찾을 범위 (바이트)
+_TAIL_SIZE = 4096
+
+
+class IncrementalUpdateError(ValueError):
+    """The source cannot be updated incrementally (encrypted or damaged xref)."""
+
+
+def _number(value: float) -> str:
+    text = f"{value:.4f}".rstrip("0").rstrip(".")
+    return "0" if text in ("", "-0") else text
+
+
+def _find_startxref(data: memoryview) -> int:
+    tail = bytes(data[max(0, len(data) - _TAIL_SIZE):])
+    matches = list(_STARTXREF.finditer(tail))
+    if not matches:
+        raise IncrementalUpdateError("startxref not found")
+    offset = int(matches[-1].group(1))
+    head = bytes(data[offset:offset + 32]) if offset < len(data) else b""
+    if not head.startswith(b"xref") and not _OBJ_HEADER.match(head):
+        raise IncrementalUpdateError(f"startxref {offset} does not point at a cross-reference section")
+    return offset
+
+
+def _stream_object(num: int, data: bytes, extra: str = "") -> bytes:
+    return (f"{num} 0 obj\n<< /Length {len(data)}{extra} >>\nstream\n".encode()
+            + data + b"\nendstream\nendobj\n")
+
+
+class IncrementalUpdate:
+    """Collect page translations for *reader* and write them as an update of *original*.
+
+    *original* is the exact byte content *reader* was opened on.
+    """
+
+    def __init__(self, reader, original: memoryview):
+        if reader.is_encrypted:
+            # 새 스트림도 암호화해야 하므로 지원하지 않음
+            raise IncrementalUpdateError("encrypted documents cannot be updated incrementally")
+        self.reader = reader
+        self.original = original
+        self._prev = _find_startxref(original)
+        self._xref_stream = bytes(original[self._prev:self._prev + 4]) != b"xref"
+
+        known = [num for gen in reader.xref.values() for num in gen]
+        known += list(getattr(reader, "xref_objStm", {}))
+        self._next_num = max([int(reader.trailer.get("/Size", 0)), *(n + 1 for n in known)])
+        # 새로 쓸 객체: 번호 -> (세대 번호, 직렬화된 "N G obj ... endobj")
+        self._objects: Dict[int, Tuple[int, bytes]] = {}
+        self._suffix = None
+        self.changed_pages = 0
+
+    def _allocate(self) -> int:
+        num = self._next_num
+        self._next_num += 1
+        return num
+
+    def _add(self, num: int, generation: int, body: bytes):
+        self._objects[num] = (generation, body)
+
+    def shift_page(self, page, tx: float, ty: float) -> bool:
+        """Redefine *page* so its content is translated by (tx, ty); return False if it has none."""
+        ref = page.indirect_reference
+        contents = page.raw_get("/Contents") if "/Contents" in page else None
+        if ref is None or contents is None:
+            return False
+        resolved = contents.get_object()
+        refs = list(resolved) if isinstance(resolved, ArrayObject) else [contents]
+
+        if self._suffix is None:
+            self._suffix = self._allocate()
+            self._add(self._suffix, 0, _stream_object(self._suffix, b"Q"))
+        prefix = self._allocate()
+        self._add(prefix, 0, _stream_object(
+            prefix, f"q\n1 0 0 1 {_number(tx)} {_number(ty)} cm\n".encode()))
+
+        contents = ArrayObject(
+            [IndirectObject(prefix, 0, None), *refs, IndirectObject(self._suffix, 0, None)])
+        return self.redefine_page(page, {NameObject("/Contents"): contents})
+
+    def redefine_page(self, page, changes: Dict = None) -> bool:
+        """Write the current entries of *page* (plus *changes*) under its own object number.
+
+        Used as is for pages whose boxes were moved in memory. Returns False
+        for a page that is not an indirect object.
+        """
+        ref = page.indirect_reference
+        if ref is None:
+            return False
+        page_dict = DictionaryObject({k: page.raw_get(k) for k in page})
+        page_dict.update(changes or {})
+        body = io.BytesIO()
+        body.write(f"{ref.idnum} {ref.generation} obj\n".encode())
+        page_dict.write_to_stream(body, None)
+        body.write(b"\nendobj\n")
+        self._add(ref.idnum, ref.generation, body.getvalue())
+        self.changed_pages += 1
+        return True
+
+    def _trailer_entries(self) -> str:
+        out = io.BytesIO()
+        for key in ("/Root", "/Info", "/ID"):
+            if key in self.reader.trailer:
+                out.write(f" {key} ".encode())
+                self.reader.trailer.raw_get(key).write_to_stream(out, None)
+        return out.getvalue().decode("latin-1")
+
+    def write(self, stream: BinaryIO):
+        """Write the original bytes followed by the update to *stream* (which must ``tell()``)."""
+        stream.write(self.original)
+        if not self._objects:
+            return
+        if bytes(self.original[-1:]) not in (b"\n", b"\r"):
+            stream.write(b"\n")
+
+        offsets: Dict[int, Tuple[int, int]] = {}
+        for num in sorted(self._objects):
+            generation, body = self._objects[num]
+            offsets[num] = (stream.tell(), generation)
+            stream.write(body)
+
+        if self._xref_stream:
+            self._write_xref_stream(stream, offsets)
+        else:
+            self._write_xref_table(stream, offsets)
+
+    def _write_xref_table(self, stream: BinaryIO, offsets: Dict[int, Tuple[int, int]]):
+        xref_pos = stream.tell()
+        lines = [b"xref\n"]
+        for start, nums in _runs(sorted(offsets)):
+            lines.append(f"{start} {len(nums)}\n".encode())
+            lines += [f"{offsets[n][0]:010d} {offsets[n][1]:05d} n \n".encode() for n in nums]
+        stream.write(b"".join(lines))
+        stream.write(f"trailer\n<< /Size {self._next_num} /Prev {self._prev}"
+                     f"{self._trailer_entries()} >>\nstartxref\n{xref_pos}\n%%EOF\n".encode())
+
+    def _write_xref_stream(self, stream: BinaryIO, offsets: Dict[int, Tuple[int, int]]):
+        num = self._allocate()
+        xref_pos = stream.tell()
+        offsets = {**offsets, num: (xref_pos, 0)}
+        width = max(4, (xref_pos.bit_length() + 7) // 8)
+        rows: List[bytes] = []
+        index: List[str] = []
+        for start, nums in _runs(sorted(offsets)):
+            index.append(f"{start} {len(nums)}")
+            rows += [b"\x01" + offsets[n][0].to_bytes(width, "big") + offsets[n][1].to_bytes(2, "big")
+                     for n in nums]
+        data = zlib.compress(b"".join(rows))
+        stream.write(_stream_object(
+            num, data, f" /Type /XRef /Size {self._next_num} /W [1 {width} 2]"
+                       f" /Index [{' '.join(index)}] /Prev {self._prev} /Filter /FlateDecode"
+                       f"{self._trailer_entries()}"))
+        stream.write(f"startxref\n{xref_pos}\n%%EOF\n".encode())
+
+
+def _runs(nums: List[int]):
+    """Yield (first, [nums...]) for every run of consecutive numbers in sorted *nums*."""
+    run: List[int] = []
+    for n in nums:
+        if run and n != run[-1] + 1:
+            yield run[0], run
+            run = []
+        run.append(n)
+    if run:
+        yield run[0], run
+
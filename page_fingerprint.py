@@ -0,0 +1,183 @@
+"""page_fingerprint.py
+
+Layout fingerprints so pages generated from one template share a single
+shift computation.
+
+A fingerprint hashes a page's box, its content streams with the text
+strings removed (string operands and TJ arrays) and a digest of every named
+resource (fonts, XObjects, ...). Certificate pages that differ only in the
+recipient's name therefore fingerprint the same, while any change to paths,
+images, transforms, fonts or text positions (Td, TD, Tm, Tf operands)
+produces a new fingerprint.
+
+:class:`LayoutMemo` maps fingerprints to computed page geometry. With
+``verify=True`` a hit is only reused after a cheap stream-engine pass
+confirms the content bbox is unchanged (e.g. a longer name did not widen
+it); otherwise the hit is trusted outright.
+"""
+
+import hashlib
+import re
+from typing import Callable, Dict, Tuple
+
+REUSE_MODES = ("off", "verify", "trust")
+
+# 지문에 넣는 내용이 바뀔 때 올림. 재사용을 켠 캐시 결과는 이 값으로 구분됨
+FINGERPRINT_VERSION = 2
+
+# 검증 시 bbox가 같다고 볼 허용 오차 (pt)
+_VERIFY_TOLERANCE = 0.01
+
+_LITERAL_STRING = re.compile(rb"\((?:\\.|[^\\()])*\)", re.S)
+_HEX_STRING = re.compile(rb"<[0-9A-Fa-f\s]*>")
+_TJ_ARRAY = re.compile(rb"\[[^\]]*\]\s*TJ")
+
+_RESOURCE_KEYS = ("/Font", "/XObject", "/ExtGState", "/ColorSpace", "/Pattern",
+                  "/Shading", "/Properties")
+
+
+def _normalize_contents(data: bytes) -> bytes:
+    """Strip the parts of a content stream that vary between templated pages."""
+    # 중첩 괄호 문자열은 안쪽부터 한 겹씩 제거
+    while True:
+        data, count = _LITERAL_STRING.subn(b"\x00", data)
+        if not count:
+            break
+    data = _HEX_STRING.sub(b"\x00", data)
+    # 문자열만 지우고 위치(Td, TD, Tm)·글꼴(Tf) 연산자의 피연산자는 남김: 배치가 다른
+    # 페이지가 같은 지문을 받으면 trust 모드에서 다른 페이지의 이동량을 쓰게 됨
+    return _TJ_ARRAY.sub(b"[]TJ", data)
+
+
+def _contents_data(page) -> bytes:
+    """Return the decoded content of *page*, joining the streams of an array /Contents."""
+    contents = page.get_contents()
+    if contents is None:
+        return b""
+    # PyPDF2 3.0은 /Contents가 배열이면 스트림 배열(ArrayObject)을 그대로 돌려줌
+    streams = contents if isinstance(contents, list) else [contents]
+    return b"\n".join(stream.get_object().get_data() for stream in streams)
+
+
+def _object_digest(obj, seen: Dict[int, bytes]) -> bytes:
+    """Return a file-independent digest of a resource object."""
+    obj = obj.get_object()
+    key = id(obj)
+    if key in seen:
+        return seen[key]
+
+    seen[key] = b""  # 순환 참조 대비
+    h = hashlib.sha1()
+    data = getattr(obj, "_data", None)
+    if data is not None:
+        # 스트림(이미지, 폼, 임베디드 폰트 등)은 인코딩된 원본 바이트로 비교
+        h.update(data if isinstance(data, bytes) else str(data).encode())
+    if hasattr(obj, "items"):
+        for name, value in sorted(obj.items()):
+            if name in ("/Length", "/Parent"):
+                continue
+            h.update(str(name).encode())
+            value = value.get_object()
+            if hasattr(value, "items") or getattr(value, "_data", None) is not None:
+                h.update(_object_digest(value, seen))
+            else:
+                h.update(repr(value).encode())
+    else:
+        h.update(repr(obj).encode())
+
+    seen[key] = digest = h.digest()
+    return digest
+
+
+def page_fingerprint(page, seen: Dict[int, bytes] = None) -> str:
+    """Return the layout fingerprint of a PyPDF2 *page*.
+
+    *seen* caches resource digests by object identity; it must only be
+    shared between pages of the same open document.
+    """
+    seen = {} if seen is None else seen
+    h = hashlib.sha1()
+    h.update(repr([float(v) for v in page.mediabox]).encode())
+    h.update(str(page.get("/Rotate", 0)).encode())
+
+    h.update(_normalize_contents(_contents_data(page)))
+
+    resources = page.get("/Resources")
+    resources = resources.get_object() if resources is not None else {}
+    for category in _RESOURCE_KEYS:
+        entries = resources.get(category)
+        if entries is None:
+            continue
+        for name, ref in sorted(entries.get_object().items()):
+            h.update(f"{category}{name}".encode())
+            h.update(_object_digest(ref, seen))
+    return h.hexdigest()
+
+
+def _stream_extent(page):
+    # numpy와 PyPDF2는 검증이 처음 필요할 때 로드 (REUSE_MODES만 쓰는 CLI 시작을 가볍게)
+    import numpy as np
+
+    import stream_bbox
+
+    boxes = stream_bbox.page_boxes(page)
+    if boxes.shape[0] == 0:
+        return None
+    return np.concatenate([boxes.min(axis=0)[[0, 2]], boxes.max(axis=0)[[1, 3]]])
+
+
+class LayoutMemo:
+    """Fingerprint → page geometry memo, per document or shared across files."""
+
+    def __init__(self):
+        self.hits = 0       # 분석을 건너뛴 페이지 수
+        self.misses = 0     # 새로 분석한 페이지 수
+        self.rejected = 0   # 지문은 같았지만 검증에 실패한 페이지 수
+        self._entries: Dict[Tuple, Tuple] = {}
+        self._doc = None
+        self._seen: Dict[int, bytes] = {}
+
+    def geometry(self, page, params: Tuple, compute: Callable[[], Tuple], verify: bool = True):
+        """Return the geometry of *page*, reusing a memoized template result when possible.
+
+        *params* are the analysis options the geometry depends on; *compute*
+        runs the full analysis on a miss. With *verify* a hit is confirmed
+        by a stream-engine pass before it is reused.
+        """
+        if page.pdf is not self._doc:
+            # 객체 id 기반 다이제스트 캐시는 문서가 바뀌면 무효 (문서 참조를 잡아 id 재사용 방지)
+            self._doc = page.pdf
+            self._seen = {}
+
+        key = (page_fingerprint(page, self._seen), params, verify)
+        entry = self._entries.get(key)
+        extent = None
+        if entry is not None:
+            geometry, expected = entry
+            if not verify:
+                self.hits += 1
+                return geometry
+            extent = _stream_extent(page)
+            if _same_extent(extent, expected):
+                self.hits += 1
+                return geometry
+            self.rejected += 1
+
+        self.misses += 1
+        geometry = compute()
+        if entry is None:
+            if verify and extent is None:
+                extent = _stream_extent(page)
+            self._entries[key] = (geometry, extent)
+        return geometry
+
+    def stats(self) -> dict:
+        return {"avoided": self.hits, "analyzed": self.misses, "rejected": self.rejected}
+
+
+def _same_extent(a, b) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    import numpy as np
+
+    return bool(np.all(np.abs(a - b) <= _VERIFY_TOLERANCE))
@@ -1,9 +1,12 @@
 import sys
 import os
-import threading
+import multiprocessing
+import queue
 import subprocess
+import time
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Optional, Tuple, Union
 
 # PyQt6.QtWidgets에서 필요한 클래스들을 더 명시적으로 가져옵니다.
 from PyQt6 import QtCore, QtGui, QtWidgets
@@ -11,52 +14,231 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QIcon, QPaintEvent, QKeyEvent, QDragEnterEvent, QDropEvent
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGroupBox, QLineEdit, QPushButton, QListWidget, QProgressBar,
-    QMessageBox, QFileDialog, QListWidgetItem, QLabel, QStyle, QStatusBar
+    QGroupBox, QLineEdit, QPushButton, QListView, QProgressBar,
+    QMessageBox, QFileDialog, QStyle, QStatusBar, QLabel, QSpinBox, QCheckBox
 )
 
 # 아래 라인을 통해 실제 PDF 변환 함수를 가져옵니다.
 # 이 파일이 실제로 존재해야 합니다.
-from center_pdf import center_pdf
+# 변환은 WarmPool의 워커 프로세스에서 하므로 창을 띄우는 이 프로세스는
+# numpy/pdfplumber/PyPDF2를 불러오지 않습니다.
+from center_batch import WarmPool
+from center_cache import ResultCache
+from center_discover import output_up_to_date
+from center_metrics import FileStats
+
+
+# 진행 막대에서 파일 하나가 차지하는 칸 수
+PROGRESS_STEPS = 1000
+
+# 파일 하나에 허용하는 시간(분)과 워커 프로세스 하나의 메모리(주소 공간) 한도(GB)의 최댓값.
+# 사용자가 정하며 기본값 0은 제한 없음. 넘기면 워커를 종료하고 새로 띄운 뒤 그 파일을 실패로 표시함.
+# 메모리 한도는 RLIMIT_AS를 쓰므로 POSIX(Linux, macOS)에서만 적용됨
+MAX_FILE_TIMEOUT_MINUTES = 24 * 60
+MAX_MEMORY_LIMIT_GB = 1024
+
+# 파일 목록에 표시하는 변환 상태별 글자색
+FILE_STATES = {
+    "running": "#0078d7",
+    "ok": "#107c10",
+    "failed": "#d13438",
+    "cancelled": "#797775",
+}
+
+
+def default_concurrency() -> int:
+    """Return the default number of files converted at once: up to 4, one per core."""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def format_duration(seconds: float) -> str:
+    """Format *seconds* as e.g. "42초", "3분 05초" or "1시간 02분"."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}초"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}분 {seconds:02d}초"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}시간 {minutes:02d}분"
 
 
 class ConversionWorker(QtCore.QThread):
-    """PDF 변환 작업을 수행하는 워커 스레드"""
+    """변환 작업을 프로세스 풀에 나누어 맡기고, 끝나는 순서대로 파일별 결과를 알리는 스레드"""
+    # 파일 하나가 끝날 때마다 (끝난 파일 수, 전체 파일 수, 파일 이름)
     progress_update = pyqtSignal(int, int, str)
+    # 전체 진행 상황: (진행 막대 값, 변환 중인 파일 수, 초당 쪽 수, 남은 시간(초), 모르면 -1)
+    page_progress = pyqtSignal(int, int, float, float)
+    # 파일별 상태: (파일 경로, 상태, 목록에 표시할 문구). 상태는 FILE_STATES 중 하나
+    file_status = pyqtSignal(str, str, str)
+    # 파일 하나가 끝날 때마다 (파일 이름, 단계 시간·카운터 요약)
+    stats_update = pyqtSignal(str, str)
     finished = pyqtSignal(int, int)
     # is_cancelled 플래그를 추가하여 취소 시 특별한 처리를 할 수 있도록 합니다.
     is_cancelled = False
-
-    def __init__(self, file_paths: List[str], output_dir: str):
+    # 페이지 진행 시그널 최소 간격(초): 페이지마다 보내면 시그널 처리 자체가 병목이 됨
+    PROGRESS_INTERVAL = 0.1
+    # 취소 후 이 시간(초) 안에 끝나지 않은 작업은 워커 프로세스를 종료해 끊음
+    CANCEL_GRACE = 2.0
+
+    def __init__(self, file_paths: List[str], output_dir: str, pool: WarmPool,
+                 concurrency: int = 1, cache: ResultCache = None,
+                 output_names: Optional[List[str]] = None, skip_existing: bool = False):
         super().__init__()
         self.file_paths = file_paths
         self.output_dir = output_dir
+        # 파일별 output_dir 기준 상대 출력 경로 (없으면 파일 이름)
+        self.output_paths = self._output_paths(
+            output_names or [os.path.basename(path) for path in file_paths])
+        self.pool = pool
+        self.concurrency = max(1, concurrency)
+        self.cache = cache
+        self.cache_hits = 0
+        # 출력이 이미 있고 입력보다 오래되지 않은 파일은 변환하지 않음 (중단된 변환을 이어서 할 때)
+        self.skip_existing = skip_existing
+        self.skipped = 0
         self.is_running = True
+        # 풀 스레드가 넣는 (작업 번호, CenterResult)
+        self.results = queue.Queue()
+        # 전체 파일의 단계별 누적 시간(초)과 읽고 쓴 바이트 수
+        self.stage_totals = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self._start_time = 0.0
+        self._last_emit = 0.0
+
+    def _output_paths(self, output_names: List[str]) -> List[str]:
+        """Join *output_names* to output_dir, numbering names already taken in this run."""
+        taken = set()
+        output_paths = []
+        for name in output_names:
+            output_path = os.path.join(self.output_dir, name)
+            stem, suffix = os.path.splitext(output_path)
+            number = 1
+            # 다른 폴더의 같은 이름 파일이 서로 덮어쓰지 않도록 "이름 (2).pdf"처럼 번호를 붙임
+            while os.path.normcase(output_path) in taken:
+                number += 1
+                output_path = f"{stem} ({number}){suffix}"
+            taken.add(os.path.normcase(output_path))
+            output_paths.append(output_path)
+        return output_paths
+
+    def _on_stats(self, stats: FileStats):
+        for name, seconds in stats.stages.items():
+            self.stage_totals[name] = self.stage_totals.get(name, 0.0) + seconds
+        self.bytes_read += stats.bytes_read
+        self.bytes_written += stats.bytes_written
+        self.stats_update.emit(os.path.basename(stats.input_path), stats.summary())
+
+    def stats_summary(self) -> str:
+        """Return the accumulated stage times of this run, slowest first."""
+        stages = sorted(self.stage_totals.items(), key=lambda item: -item[1])
+        parts = [f"{name} {seconds:.2f}s" for name, seconds in stages[:4]]
+        parts.append(f"{self.bytes_read / 1048576:.1f}→{self.bytes_written / 1048576:.1f} MB")
+        return ", ".join(parts)
+
+    def _emit_progress(self, finished: int, pages_done: int, running: dict, force: bool = False):
+        """Emit page_progress for all files at most every PROGRESS_INTERVAL.
+
+        *running* maps the job id of every file in flight to (pages done, total pages).
+        """
+        now = time.perf_counter()
+        if not force and now - self._last_emit < self.PROGRESS_INTERVAL:
+            return
+        self._last_emit = now
+        partial = sum(done / total for done, total in running.values() if total)
+        pages = pages_done + sum(done for done, _ in running.values())
+        elapsed = now - self._start_time
+        rate = pages / elapsed if elapsed > 0 else 0.0
+        # 남은 쪽 수 = 변환 중인 파일의 남은 쪽 + 시작하지 않은 파일 수 × 지금까지 파일당 평균 쪽 수
+        files_done = finished + partial
+        remaining = sum(total - done for done, total in running.values())
+        remaining += (pages / files_done if files_done else 0.0) * (
+            len(self.file_paths) - finished - len(running))
+        eta = remaining / rate if rate > 0 and files_done else -1.0
+        value = int((finished + partial) * PROGRESS_STEPS)
+        self.page_progress.emit(value, len(running), rate, eta)
+
+    def _submit(self, job_id: int, file_path: str):
+        self.pool.submit(job_id, file_path, self.output_paths[job_id], self.results.put,
+                         cache=self.cache, stats=True)
+        self.file_status.emit(file_path, "running", "변환 중")
+
+    def _cancel_all(self, job_ids: Iterable[int]):
+        for job_id in job_ids:
+            self.file_status.emit(self.file_paths[job_id], "cancelled", "취소됨")
 
     def run(self):
         total_count = len(self.file_paths)
         success_count = 0
         failure_count = 0
-
-        for i, file_path in enumerate(self.file_paths):
-            if not self.is_running:
-                # 외부에서 중단 신호를 받으면 is_cancelled 플래그를 설정하고 루프를 빠져나갑니다.
+        finished = 0
+        pages_done = 0
+        pending = deque(range(total_count))
+        running = {}  # 작업 번호 -> (처리한 쪽, 전체 쪽)
+        cancelled_at = None
+        self._start_time = time.perf_counter()
+        self.pool.reset()
+
+        while pending or running:
+            if not self.is_running and cancelled_at is None:
+                # 새 작업은 보내지 않고, 실행 중인 작업은 다음 페이지에서 멈추게 함
                 self.is_cancelled = True
+                cancelled_at = time.perf_counter()
+                self.pool.cancel()
+                self._cancel_all(pending)
+                pending.clear()
+            if cancelled_at is not None and time.perf_counter() - cancelled_at > self.CANCEL_GRACE:
+                # 한 페이지 안에서 오래 걸리는 작업: 워커 프로세스를 종료하고 새로 띄움
+                self.pool.terminate()
+                self._cancel_all(running)
+                running.clear()
                 break
 
-            base_name = os.path.basename(file_path)
-            output_file_path = os.path.join(self.output_dir, base_name)
-            self.progress_update.emit(i + 1, total_count, base_name)
+            while pending and len(running) < self.concurrency:
+                job_id = pending.popleft()
+                file_path = self.file_paths[job_id]
+                if self.skip_existing and output_up_to_date(file_path, self.output_paths[job_id]):
+                    success_count += 1
+                    finished += 1
+                    self.skipped += 1
+                    self.file_status.emit(file_path, "ok", "건너뜀 · 이미 변환됨")
+                    self.progress_update.emit(finished, total_count, os.path.basename(file_path))
+                    continue
+                running[job_id] = (0, 0)
+                self._submit(job_id, file_path)
+
+            for job_id, done, total in self.pool.progress():
+                if job_id in running:
+                    running[job_id] = (done, total)
+                    self.file_status.emit(self.file_paths[job_id], "running", f"{done}/{total}쪽")
 
             try:
-                is_success = center_pdf(file_path, output_file_path)
-                if is_success:
-                    success_count += 1
-                else:
-                    failure_count += 1
-            except Exception as e:
-                print(f"Error converting {base_name}: {e}")
+                job_id, result = self.results.get(timeout=0.05)
+            except queue.Empty:
+                self._emit_progress(finished, pages_done, running)
+                continue
+            if running.pop(job_id, None) is None:
+                continue
+
+            file_path = self.file_paths[job_id]
+            if result.stats is not None:
+                self._on_stats(result.stats)
+            if result.ok:
+                success_count += 1
+                self.cache_hits += result.cached
+                detail = "캐시" if result.cached else f"{result.seconds:.1f}s"
+                self.file_status.emit(file_path, "ok", f"완료 · {result.pages}쪽 · {detail}")
+            elif result.cancelled:
+                self.file_status.emit(file_path, "cancelled", "취소됨")
+            else:
+                print(f"Error converting {os.path.basename(file_path)}: {result.error}")
                 failure_count += 1
+                self.file_status.emit(file_path, "failed", f"실패: {result.error}")
+            finished += 1
+            pages_done += result.pages
+            self.progress_update.emit(finished, total_count, os.path.basename(file_path))
+            self._emit_progress(finished, pages_done, running, force=True)
 
         self.finished.emit(success_count, failure_count)
 
@@ -64,10 +246,213 @@ class ConversionWorker(QtCore.QThread):
         self.is_running = False
 
 
-class DragDropListWidget(QListWidget):
-    """드래그 앤 드롭을 지원하고, 안내 메시지를 표시하는 리스트 위젯"""
-    # ↓ 메인윈도우에 파일 경로를 알리는 커스텀 시그널
-    fileDropped = QtCore.pyqtSignal(str)
+class FolderScanWorker(QtCore.QThread):
+    """드롭한 파일과 폴더에서 PDF를 찾아 일정 개수씩 묶어 알려주는 스레드"""
+    # 찾은 (PDF 경로, 출력 폴더 기준 상대 경로) 묶음 (UI 스레드에서 목록에 추가).
+    # 폴더에서 찾은 파일은 드롭한 폴더 이름부터 시작하는 상대 경로를 그대로 씀
+    batch_found = pyqtSignal(list)
+
+    # 한 번에 보내는 경로 수: 너무 작으면 시그널이 많아지고, 너무 크면 목록이 늦게 채워짐
+    BATCH_SIZE = 500
+
+    def __init__(self, paths: Iterable[str], parent=None):
+        super().__init__(parent)
+        self.paths = list(paths)
+        self.is_running = True
+
+    def _walk(self, directory: str):
+        """Yield every PDF below *directory*, in name order per folder, without following links."""
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            if not self.is_running:
+                return
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk(entry.path)
+                elif entry.name.lower().endswith(".pdf") and entry.is_file():
+                    yield entry.path
+            except OSError:
+                continue
+
+    def run(self):
+        batch = []
+        for path in self.paths:
+            path = os.path.normpath(path)
+            found = self._walk(path) if os.path.isdir(path) else (
+                [path] if path.lower().endswith(".pdf") else [])
+            base = os.path.dirname(path)
+            for file_path in found:
+                if not self.is_running:
+                    return
+                batch.append((file_path, os.path.relpath(file_path, base)))
+                if len(batch) >= self.BATCH_SIZE:
+                    self.batch_found.emit(batch)
+                    batch = []
+        if batch:
+            self.batch_found.emit(batch)
+
+    def stop(self):
+        self.is_running = False
+
+
+class FileListModel(QtCore.QAbstractListModel):
+    """변환할 PDF 경로 목록. 중복 검사는 집합으로 하므로 파일 수와 관계없이 빠릅니다."""
+    # 변환 상태 (상태, 표시할 문구), 상태가 없으면 None
+    STATUS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths: List[str] = []
+        self._index = set()
+        self._status = {}
+        # 경로 -> 출력 폴더 기준 상대 출력 경로
+        self._outputs = {}
+        # 경로 -> 행 번호 (상태를 바꿀 때 목록을 훑지 않도록, 행을 지우면 다시 만듦)
+        self._rows = {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self._paths[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return path
+        if role == Qt.ItemDataRole.ToolTipRole:
+            status = self._status.get(path)
+            return f"{path}\n{status[1]}" if status else path
+        if role == self.STATUS_ROLE:
+            return self._status.get(path)
+        return None
+
+    def add_paths(self, paths: Iterable[Union[str, Tuple[str, str]]]) -> int:
+        """Append the paths not already listed, in one insert; return how many were added.
+
+        An item is a path, saved under its file name, or a (path, output name) pair
+        whose output name is relative to the output folder.
+        """
+        new = []
+        for item in paths:
+            path, output_name = item if isinstance(item, tuple) else (item, os.path.basename(item))
+            path = os.path.normpath(path)
+            if path not in self._index:
+                self._index.add(path)
+                self._outputs[path] = os.path.normpath(output_name)
+                new.append(path)
+        if new:
+            first = len(self._paths)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(new) - 1)
+            self._paths.extend(new)
+            self._rows.update((path, first + i) for i, path in enumerate(new))
+            self.endInsertRows()
+        return len(new)
+
+    def remove_row(self, row: int):
+        if 0 <= row < len(self._paths):
+            self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+            path = self._paths.pop(row)
+            self._index.discard(path)
+            self._status.pop(path, None)
+            self._outputs.pop(path, None)
+            self._rows = {p: i for i, p in enumerate(self._paths)}
+            self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._paths.clear()
+        self._index.clear()
+        self._status.clear()
+        self._outputs.clear()
+        self._rows.clear()
+        self.endResetModel()
+
+    def set_status(self, path: str, state: str, text: str):
+        """Show *state* ("running", "ok", ...) and *text* next to *path*, if it is still listed."""
+        row = self._rows.get(os.path.normpath(path))
+        if row is None:
+            return
+        self._status[self._paths[row]] = (state, text)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self.STATUS_ROLE])
+
+    def clear_status(self):
+        if self._status:
+            self._status.clear()
+            self.dataChanged.emit(self.index(0), self.index(len(self._paths) - 1), [self.STATUS_ROLE])
+
+    def paths(self) -> List[str]:
+        return list(self._paths)
+
+    def output_names(self) -> List[str]:
+        """Return the output path of each listed file relative to the output folder, in list order."""
+        return [self._outputs[path] for path in self._paths]
+
+
+class FileItemDelegate(QtWidgets.QStyledItemDelegate):
+    """경로와 삭제 버튼을 직접 그리는 델리게이트 (행마다 위젯을 만들지 않음)"""
+    delete_requested = pyqtSignal(int)
+
+    ROW_HEIGHT = 34
+    BUTTON_SIZE = 24
+
+    def _button_rect(self, option) -> QtCore.QRect:
+        rect = option.rect
+        size = self.BUTTON_SIZE
+        return QtCore.QRect(rect.right() - size - 5, rect.top() + (rect.height() - size) // 2,
+                            size, size)
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter: QtGui.QPainter, option, index):
+        painter.save()
+        button = self._button_rect(option)
+        text_rect = option.rect.adjusted(10, 0, -(self.BUTTON_SIZE + 15), 0)
+
+        # 변환 상태는 삭제 버튼 왼쪽에 오른쪽 정렬로 (경로 폭의 절반까지)
+        status = index.data(FileListModel.STATUS_ROLE)
+        if status:
+            state, status_text = status
+            status_text = option.fontMetrics.elidedText(
+                status_text, Qt.TextElideMode.ElideRight, text_rect.width() // 2)
+            painter.setPen(QtGui.QColor(FILE_STATES.get(state, "#333")))
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight,
+                             status_text)
+            text_rect.setRight(text_rect.right() - option.fontMetrics.horizontalAdvance(status_text) - 10)
+
+        text = option.fontMetrics.elidedText(
+            index.data(), Qt.TextElideMode.ElideMiddle, text_rect.width())
+        painter.setPen(option.palette.color(QtGui.QPalette.ColorRole.Text))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+
+        # 기존 삭제 버튼과 같은 빨간 원과 휴지통 아이콘
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QtGui.QColor("#e81123"))
+        painter.drawEllipse(button)
+        style = option.widget.style() if option.widget else QApplication.style()
+        icon = style.standardIcon(QStyle.StandardPixmap.SP_TrashIcon)
+        icon.paint(painter, button.adjusted(5, 5, -5, -5))
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QtCore.QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._button_rect(option).contains(event.position().toPoint())):
+            self.delete_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class DragDropListView(QListView):
+    """드래그 앤 드롭(파일과 폴더)을 지원하고, 목록이 비면 안내 메시지를 표시하는 목록 뷰"""
+    # ↓ 메인윈도우에 드롭된 경로(파일 또는 폴더) 목록을 알리는 커스텀 시그널
+    pathsDropped = QtCore.pyqtSignal(list)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -75,16 +460,17 @@ class DragDropListWidget(QListWidget):
         self.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
         self.setDropIndicatorShown(True)
+        # 모든 행의 높이가 같으므로 수천 개의 행도 크기 계산 없이 그림
+        self.setUniformItemSizes(True)
 
-        # ── MainWindow가 시그널을 받을 수 있게 자동 연결
-        main_win = self.window()
-        if hasattr(main_win, "add_file_item"):
-            self.fileDropped.connect(main_win.add_file_item)
+    @staticmethod
+    def _is_acceptable(path: str) -> bool:
+        return path.lower().endswith(".pdf") or os.path.isdir(path)
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
+                if self._is_acceptable(url.toLocalFile()):
                     event.acceptProposedAction()
                     return
         event.ignore()
@@ -93,18 +479,18 @@ class DragDropListWidget(QListWidget):
         event.acceptProposedAction()
 
     def dropEvent(self, event: QDropEvent):
-        # 커스텀 시그널을 통해 메인윈도우에 전달
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path.lower().endswith(".pdf"):
-                self.fileDropped.emit(file_path)
+        # 폴더는 UI 스레드에서 뒤지지 않고 경로만 넘김
+        paths = [url.toLocalFile() for url in event.mimeData().urls()]
+        paths = [path for path in paths if path and self._is_acceptable(path)]
+        if paths:
+            self.pathsDropped.emit(paths)
 
         event.acceptProposedAction()      # 드롭 최종 수락
         self.viewport().update()
 
     def paintEvent(self, event: QPaintEvent):
         super().paintEvent(event)
-        if self.count() == 0:
+        if self.model() is None or self.model().rowCount() == 0:
             painter = QtGui.QPainter(self.viewport())
             painter.save()
             font = self.font()
@@ -114,7 +500,8 @@ class DragDropListWidget(QListWidget):
             painter.setPen(color)
             rect = self.viewport().rect()
             painter.drawText(
-                rect, Qt.AlignmentFlag.AlignCenter, "PDF 파일을 이곳으로 드래그하거나\n'파일 추가' 버튼으로 선택해주세요.")
+                rect, Qt.AlignmentFlag.AlignCenter,
+                "PDF 파일이나 폴더를 이곳으로 드래그하거나\n'파일 추가' 버튼으로 선택해주세요.")
             painter.restore()
 
 # (개선) MainWindow 클래스에 모든 로직을 통합하고 UI 개선 사항을 적용
@@ -134,6 +521,14 @@ class MainWindow(QMainWindow):
 
         self.settings = QtCore.QSettings("MyCompany", "PDFCenteringApp")
         self.conversion_worker = None
+        # 변환을 맡는 워커 프로세스 풀: 창이 뜬 뒤 한 번 만들어 여러 번의 변환에 재사용
+        self.pool: WarmPool = None
+        # 마지막으로 끝난 파일: (끝난 파일 수, 전체 파일 수, 이름)
+        self.current_file = (0, 0, "")
+        # 폴더를 뒤지는 중인 스레드 (여러 번 드롭하면 동시에 여러 개)
+        self.scan_workers: List[FolderScanWorker] = []
+        # 같은 파일을 다시 변환할 때 이전 결과를 재사용하는 캐시 (실행 간 유지)
+        self.result_cache = ResultCache()
 
         self.init_ui()
         self.apply_stylesheet()
@@ -163,7 +558,16 @@ class MainWindow(QMainWindow):
         # 2. 파일 목록 영역
         list_group = QGroupBox("2. 변환할 PDF 파일 목록")
         list_layout = QVBoxLayout()
-        self.file_list_widget = DragDropListWidget(self)
+        self.file_model = FileListModel(self)
+        self.file_list_widget = DragDropListView(self)
+        self.file_list_widget.setModel(self.file_model)
+        delegate = FileItemDelegate(self.file_list_widget)
+        delegate.delete_requested.connect(self.file_model.remove_row)
+        self.file_list_widget.setItemDelegate(delegate)
+        self.file_list_widget.pathsDropped.connect(self.add_paths_async)
+        # 행이 추가·삭제되면 빈 목록 안내 문구를 다시 그림
+        self.file_model.rowsInserted.connect(self.file_list_widget.viewport().update)
+        self.file_model.rowsRemoved.connect(self.file_list_widget.viewport().update)
         list_layout.addWidget(self.file_list_widget, 1)
 
         # (제안 3, 4) 파일 추가 및 목록 비우기 버튼
@@ -192,6 +596,45 @@ class MainWindow(QMainWindow):
         self.convert_cancel_button.setMinimumHeight(40)
         self.convert_cancel_button.setObjectName("ConvertButton")
         self.convert_cancel_button.clicked.connect(self.toggle_conversion)
+
+        concurrency_layout = QHBoxLayout()
+        self.concurrency_spin = QSpinBox(self)
+        self.concurrency_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self.concurrency_spin.setValue(
+            int(self.settings.value("concurrency", default_concurrency())))
+        concurrency_layout.addWidget(QLabel("동시 변환 파일 수", self))
+        concurrency_layout.addWidget(self.concurrency_spin)
+        concurrency_layout.addStretch(1)
+
+        # 파일당 시간 제한과 워커 메모리 한도 (0 = 제한 없음)
+        self.timeout_spin = QSpinBox(self, suffix="분", specialValueText="제한 없음")
+        self.timeout_spin.setRange(0, MAX_FILE_TIMEOUT_MINUTES)
+        self.timeout_spin.setValue(int(self.settings.value("fileTimeoutMinutes", 0)))
+        self.timeout_spin.setToolTip("파일 하나가 이 시간 안에 끝나지 않으면 워커를 종료하고 실패로 표시합니다.")
+        self.memory_spin = QSpinBox(self, suffix=" GB", specialValueText="제한 없음")
+        self.memory_spin.setRange(0, MAX_MEMORY_LIMIT_GB)
+        self.memory_spin.setValue(int(self.settings.value("memoryLimitGB", 0)))
+        if os.name == "posix":
+            self.memory_spin.setToolTip(
+                "워커 프로세스 하나의 주소 공간이 이 크기를 넘으면 워커를 교체하고 실패로 표시합니다.")
+        else:
+            # RLIMIT_AS가 없는 Windows에서는 적용되지 않음
+            self.memory_spin.setValue(0)
+            self.memory_spin.setEnabled(False)
+            self.memory_spin.setToolTip("메모리 한도는 Linux와 macOS에서만 지원합니다.")
+        self.skip_existing_check = QCheckBox("이미 변환된 파일 건너뛰기", self)
+        self.skip_existing_check.setChecked(
+            self.settings.value("skipExisting", False, type=bool))
+        self.skip_existing_check.setToolTip(
+            "출력 파일이 이미 있고 입력 파일보다 오래되지 않았으면 다시 변환하지 않습니다.\n"
+            "중단된 변환을 다시 시작하면 남은 파일만 변환합니다.\n"
+            "변환 설정은 비교하지 않으므로, 설정을 바꾸거나 프로그램을 업데이트한 뒤에는 끄고 변환하세요.")
+        concurrency_layout.addWidget(self.skip_existing_check)
+        concurrency_layout.addWidget(QLabel("파일당 시간 제한", self))
+        concurrency_layout.addWidget(self.timeout_spin)
+        concurrency_layout.addWidget(QLabel("메모리 한도", self))
+        concurrency_layout.addWidget(self.memory_spin)
+        action_layout.addLayout(concurrency_layout)
         action_layout.addWidget(self.progress_bar)
         action_layout.addWidget(self.convert_cancel_button)
         action_group.setLayout(action_layout)
@@ -249,7 +692,7 @@ class MainWindow(QMainWindow):
                 border-radius: 5px;
                 background-color: #fff;
             }
-            QListWidget {
+            QListView {
                 border: 2px dashed #aaa;
                 border-radius: 8px;
                 background-color: #fdfdfd;
@@ -285,39 +728,31 @@ class MainWindow(QMainWindow):
         else:
             self.path_edit.setText(str(Path.home()))
 
-    # (제안 2) 파일 아이템을 리스트에 추가하는 메서드 (삭제 버튼 포함)
-
+    # (제안 2) 파일을 목록에 추가하는 메서드 (삭제 버튼은 델리게이트가 그림)
     def add_file_item(self, file_path):
-        current_paths = [self.file_list_widget.itemWidget(self.file_list_widget.item(
-            i)).findChild(QLabel).text() for i in range(self.file_list_widget.count())]
-        if file_path in current_paths:
-            return
-
-        item = QListWidgetItem(self.file_list_widget)
-        item_widget = QWidget()
-        item_layout = QHBoxLayout(item_widget)
-        item_layout.setContentsMargins(5, 5, 5, 5)
-
-        file_label = QLabel(file_path)
-        file_label.setToolTip(file_path)  # 긴 경로를 위해 툴팁 추가
-
-        delete_button = QPushButton(self.style().standardIcon(
-            QStyle.StandardPixmap.SP_TrashIcon), "")
-        delete_button.setFixedSize(24, 24)
-        delete_button.setStyleSheet(
-            "background-color: #e81123; border-radius: 12px;")
-
-        # lambda 함수로 현재 아이템을 캡처하여 삭제 로직 연결
-        delete_button.clicked.connect(
-            lambda _, it=item: self.file_list_widget.takeItem(self.file_list_widget.row(it)))
-
-        item_layout.addWidget(file_label)
-        item_layout.addStretch()
-        item_layout.addWidget(delete_button)
-
-        item.setSizeHint(item_widget.sizeHint())
-        self.file_list_widget.addItem(item)
-        self.file_list_widget.setItemWidget(item, item_widget)
+        self.file_model.add_paths([file_path])
+
+    def add_paths_async(self, paths: List[str]):
+        """Find the PDFs in *paths* (files or folders) on a worker thread and list them in batches."""
+        worker = FolderScanWorker(paths, self)
+        worker.batch_found.connect(lambda paths, w=worker: self.on_scan_batch(w, paths))
+        worker.finished.connect(lambda w=worker: self.on_scan_finished(w))
+        self.scan_workers.append(worker)
+        self.status_bar.showMessage("PDF 파일을 찾는 중...")
+        worker.start()
+
+    def on_scan_batch(self, worker: FolderScanWorker, paths: List[str]):
+        if not worker.is_running:
+            return  # 목록을 비운 뒤 도착한 묶음은 버림
+        self.file_model.add_paths(paths)
+        self.status_bar.showMessage(f"PDF 파일을 찾는 중... (목록 {self.file_model.rowCount()}개)")
+
+    def on_scan_finished(self, worker: FolderScanWorker):
+        if worker in self.scan_workers:
+            self.scan_workers.remove(worker)
+        worker.deleteLater()
+        if not self.scan_workers:
+            self.status_bar.showMessage(f"목록에 {self.file_model.rowCount()}개의 파일이 있습니다.")
 
     def select_output_dir(self):
         current_path = self.path_edit.text() or str(Path.home())
@@ -331,12 +766,13 @@ class MainWindow(QMainWindow):
     def add_files_dialog(self):
         files, _ = QFileDialog.getOpenFileNames(
             self, "PDF 파일 선택", "", "PDF Files (*.pdf)")
-        for file_path in files:
-            self.add_file_item(file_path)
+        self.file_model.add_paths(files)
 
     # (제안 3) '목록 비우기' 메서드
     def clear_file_list(self):
-        self.file_list_widget.clear()
+        for worker in self.scan_workers:
+            worker.stop()
+        self.file_model.clear()
 
     # (제안 7) 변환 시작/취소 토글 메서드
     def toggle_conversion(self):
@@ -353,32 +789,63 @@ class MainWindow(QMainWindow):
             # 변환 시작 로직 실행
             self.start_conversion()
 
+    def start_pool(self):
+        """Start the worker processes (if not running with the chosen concurrency) so they warm up."""
+        concurrency = self.concurrency_spin.value()
+        timeout = self.timeout_spin.value() * 60.0 or None
+        memory_limit = (self.memory_spin.value() << 30) or None
+        if self.pool is not None and (self.pool.workers, self.pool.timeout, self.pool.memory_limit) == (
+                concurrency, timeout, memory_limit):
+            return
+        if self.pool is not None:
+            self.pool.close()
+        self.pool = WarmPool(concurrency, timeout=timeout, memory_limit=memory_limit)
+
     def start_conversion(self):
         output_dir = self.path_edit.text()
         if not output_dir or not os.path.isdir(output_dir):
             QMessageBox.warning(self, "경고", "유효한 저장 경로를 선택해주세요.")
             return
 
-        if self.file_list_widget.count() == 0:
+        if self.file_model.rowCount() == 0:
             QMessageBox.warning(self, "경고", "변환할 PDF 파일을 추가해주세요.")
             return
 
-        file_paths = [self.file_list_widget.itemWidget(self.file_list_widget.item(
-            i)).findChild(QLabel).text() for i in range(self.file_list_widget.count())]
+        file_paths = self.file_model.paths()
 
         self.set_ui_enabled(False)
-        self.progress_bar.setRange(0, len(file_paths))
+        # 파일마다 PROGRESS_STEPS 칸을 두어 파일 안의 페이지 진행도 막대에 반영
+        self.progress_bar.setRange(0, len(file_paths) * PROGRESS_STEPS)
         self.progress_bar.setValue(0)
         self.status_bar.showMessage("변환 준비 중...")
+        self.file_model.clear_status()
+        self.current_file = (0, len(file_paths), "")
+        self.start_pool()
 
-        self.conversion_worker = ConversionWorker(file_paths, output_dir)
+        self.conversion_worker = ConversionWorker(
+            file_paths, output_dir, self.pool, self.concurrency_spin.value(), self.result_cache,
+            self.file_model.output_names(), self.skip_existing_check.isChecked())
         self.conversion_worker.progress_update.connect(self.update_progress)
+        self.conversion_worker.page_progress.connect(self.update_page_progress)
+        self.conversion_worker.file_status.connect(self.file_model.set_status)
+        self.conversion_worker.stats_update.connect(self.update_stats)
         self.conversion_worker.finished.connect(self.on_conversion_finished)
         self.conversion_worker.start()
 
-    def update_progress(self, current, total, filename):
-        self.progress_bar.setValue(current)
-        self.status_bar.showMessage(f"({current}/{total}) {filename} 변환 중...")
+    def update_progress(self, finished, total, filename):
+        self.current_file = (finished, total, filename)
+        self.status_bar.showMessage(f"({finished}/{total}) {filename} 완료")
+
+    def update_page_progress(self, value, running, rate, eta):
+        self.progress_bar.setValue(value)
+        finished, count, _ = self.current_file
+        message = f"({finished}/{count}) 변환 중 {running}개 · {rate:.1f}쪽/s"
+        if eta >= 0:
+            message += f" · 남은 시간 약 {format_duration(eta)}"
+        self.status_bar.showMessage(message)
+
+    def update_stats(self, filename, summary):
+        self.status_bar.showMessage(f"{filename}: {summary}")
 
     def on_conversion_finished(self, success_count, failure_count):
         self.set_ui_enabled(True)
@@ -391,7 +858,10 @@ class MainWindow(QMainWindow):
             return
 
         self.status_bar.showMessage(
-            f"변환 완료! (성공: {success_count}, 실패: {failure_count})")
+            f"변환 완료! (성공: {success_count}, 실패: {failure_count}, "
+            f"캐시 적중: {self.conversion_worker.cache_hits}, "
+            f"건너뜀: {self.conversion_worker.skipped}) "
+            f"· {self.conversion_worker.stats_summary()}")
 
         msg_box = QMessageBox(self)
         open_folder_button = None
@@ -461,16 +931,29 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event: QtGui.QCloseEvent):
         # 창을 닫기 전 설정 저장 및 실행 중인 스레드 정리
         self.settings.setValue("outputDir", self.path_edit.text())
+        self.settings.setValue("concurrency", self.concurrency_spin.value())
+        self.settings.setValue("fileTimeoutMinutes", self.timeout_spin.value())
+        self.settings.setValue("memoryLimitGB", self.memory_spin.value())
+        self.settings.setValue("skipExisting", self.skip_existing_check.isChecked())
+        for worker in list(self.scan_workers):
+            worker.stop()
+            worker.wait()
         if self.conversion_worker and self.conversion_worker.isRunning():
             self.conversion_worker.stop()
             self.conversion_worker.wait()  # 스레드가 완전히 종료될 때까지 대기
+        if self.pool is not None:
+            self.pool.close()
         super().closeEvent(event)
 
 
 def main():
+    # 패키징된 실행 파일에서 워커 프로세스가 창을 다시 띄우지 않도록 함
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    # 창이 그려진 뒤 워커 프로세스를 띄워 무거운 모듈을 미리 불러옵니다.
+    QtCore.QTimer.singleShot(0, window.start_pool)
     sys.exit(app.exec())
 
 
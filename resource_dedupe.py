@@ -0,0 +1,97 @@
+"""resource_dedupe.py
+
+Shared-resource deduplication for ``center_pdf`` output.
+
+Documents stamped from one template often embed the same background image,
+seal and fonts once per page, and a combined output of many such files
+carries one copy per file. Before a ``PdfWriter`` is serialized,
+:func:`dedupe_writer` hashes every stream object (images, embedded fonts,
+form XObjects, content streams) and every font, font descriptor, encoding
+and graphics-state dictionary, points all references at the first object of
+each identical group and blanks the rest.
+
+Objects that refer to other objects are compared by their serialized form,
+references included, so a form XObject or font only merges once the objects
+it uses have merged; the pass repeats until nothing changes. Dropped objects
+are written as ``null`` (a few bytes each) so object numbers stay valid.
+"""
+
+import hashlib
+import io
+from dataclasses import dataclass
+from typing import Dict, List
+
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, NullObject, StreamObject
+
+# 스트림이 아닌 객체 중 합쳐도 되는 사전의 /Type (주석·페이지처럼 한 곳에만 속해야 하는 객체는 제외)
+_SHARED_TYPES = ("/Font", "/FontDescriptor", "/Encoding", "/ExtGState")
+
+_NULL_SIZE = len(b"null")
+
+
+@dataclass
+class DedupeReport:
+    """Objects merged and output bytes saved by :func:`dedupe_writer`; accumulates across calls."""
+
+    objects: int = 0
+    bytes_saved: int = 0
+
+    def __str__(self) -> str:
+        return f"중복 객체 {self.objects}개 제거, {self.bytes_saved / 1024:.0f} KiB 절약"
+
+
+def _shareable(obj) -> bool:
+    if isinstance(obj, StreamObject):
+        return True
+    return isinstance(obj, DictionaryObject) and obj.get("/Type") in _SHARED_TYPES
+
+
+def _serialize(obj) -> bytes:
+    out = io.BytesIO()
+    obj.write_to_stream(out, None)
+    return out.getvalue()
+
+
+def _rewrite(obj, remap: Dict[int, IndirectObject]) -> bool:
+    """Point the references inside *obj* (not followed) at their kept objects; return whether any changed."""
+    changed = False
+    items = obj.items() if isinstance(obj, DictionaryObject) else enumerate(obj)
+    for key, value in list(items):
+        if isinstance(value, IndirectObject):
+            target = remap.get(value.idnum)
+            if target is not None:
+                obj[key] = target
+                changed = True
+        elif isinstance(value, (DictionaryObject, ArrayObject)):
+            changed |= _rewrite(value, remap)
+    return changed
+
+
+def dedupe_writer(writer, report: DedupeReport = None) -> DedupeReport:
+    """Merge identical shareable objects of *writer* (a ``PdfWriter``) in place.
+
+    Call it after the last page is added and before ``write()``. The counts
+    are added to *report* (a new one if None), which is returned.
+    """
+    report = report if report is not None else DedupeReport()
+    objects: List = writer._objects
+    # 직렬화한 내용의 해시 -> 남길 객체의 위치
+    kept: Dict[bytes, int] = {}
+    todo = [i for i, obj in enumerate(objects) if _shareable(obj)]
+    while todo:
+        remap: Dict[int, IndirectObject] = {}
+        for i in todo:
+            data = _serialize(objects[i])
+            first = kept.setdefault(hashlib.sha256(data).digest(), i)
+            if first != i:
+                remap[i + 1] = IndirectObject(first + 1, 0, writer)
+                objects[i] = NullObject()
+                report.objects += 1
+                report.bytes_saved += len(data) - _NULL_SIZE
+        if not remap:
+            break
+        # 참조가 바뀐 객체는 이제 다른 객체와 같아졌을 수 있으므로 다시 비교
+        todo = [i for i, obj in enumerate(objects)
+                if isinstance(obj, (DictionaryObject, ArrayObject)) and _rewrite(obj, remap)
+                and _shareable(obj)]
+    return report
@@ -0,0 +1,352 @@
+"""stream_bbox.py
+
+Content-stream bbox engine for ``center_pdf``.
+
+Walks a page's content stream once through PyPDF2 (no pdfminer layout pass),
+tracking the CTM and text matrix, and bounds glyph runs, painted paths,
+images and form XObjects in default user space. Coordinates are returned
+relative to the MediaBox origin, matching what pdfplumber reports.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from PyPDF2.generic import ContentStream
+
+Matrix = Tuple[float, float, float, float, float, float]
+
+IDENTITY: Matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# 폼 XObject가 자기 자신을 참조하는 악성 파일에 대비한 재귀 깊이 제한
+_MAX_FORM_DEPTH = 12
+
+_PAINT_OPS = {b"S", b"s", b"f", b"F", b"f*", b"B", b"B*", b"b", b"b*"}
+
+
+def _mult(m1: Matrix, m2: Matrix) -> Matrix:
+    """Return m1 × m2 (apply m1 first, then m2)."""
+    a1, b1, c1, d1, e1, f1 = m1
+    a2, b2, c2, d2, e2, f2 = m2
+    return (
+        a1 * a2 + b1 * c2,
+        a1 * b2 + b1 * d2,
+        c1 * a2 + d1 * c2,
+        c1 * b2 + d1 * d2,
+        e1 * a2 + f1 * c2 + e2,
+        e1 * b2 + f1 * d2 + f2,
+    )
+
+
+def _apply(m: Matrix, x: float, y: float) -> Tuple[float, float]:
+    a, b, c, d, e, f = m
+    return a * x + c * y + e, b * x + d * y + f
+
+
+def _box_corners(m: Matrix, x0: float, y0: float, x1: float, y1: float):
+    """Yield the four corners of (x0, y0, x1, y1) mapped through *m*."""
+    yield _apply(m, x0, y0)
+    yield _apply(m, x1, y0)
+    yield _apply(m, x0, y1)
+    yield _apply(m, x1, y1)
+
+
+class _Font:
+    """Glyph metrics needed to bound text: widths, descent, code length."""
+
+    def __init__(self, font_dict):
+        self.widths: Dict[int, float] = {}
+        self.default_width = 0.0
+        self.descent = 0.0
+        self.scale = 0.001
+        self.two_byte = False
+
+        if font_dict is None:
+            self.default_width = 500.0
+            return
+
+        subtype = font_dict.get("/Subtype")
+        if subtype == "/Type0":
+            self._load_composite(font_dict)
+            return
+
+        if subtype == "/Type3" and "/FontMatrix" in font_dict:
+            self.scale = float(font_dict["/FontMatrix"][0])
+
+        widths = font_dict.get("/Widths")
+        if widths is not None:
+            first = int(font_dict.get("/FirstChar", 0))
+            for i, w in enumerate(widths.get_object()):
+                self.widths[first + i] = float(w)
+        descriptor = font_dict.get("/FontDescriptor")
+        if descriptor is not None:
+            descriptor = descriptor.get_object()
+            self.descent = float(descriptor.get("/Descent", 0)) * self.scale
+            self.default_width = float(descriptor.get("/MissingWidth", 0))
+        if widths is None:
+            self._load_standard(font_dict)
+
+    def _load_composite(self, font_dict):
+        self.two_byte = True
+        self.default_width = 1000.0
+        descendants = font_dict.get("/DescendantFonts")
+        if not descendants:
+            return
+        cid_font = descendants.get_object()[0].get_object()
+        self.default_width = float(cid_font.get("/DW", 1000))
+        descriptor = cid_font.get("/FontDescriptor")
+        if descriptor is not None:
+            self.descent = float(descriptor.get_object().get("/Descent", 0)) * 0.001
+
+        # /W 배열: c [w1 w2 ...] 또는 c_first c_last w 형태가 섞여 있음
+        w_array = list(cid_font.get("/W", []) or [])
+        i = 0
+        while i < len(w_array):
+            start = int(w_array[i])
+            nxt = w_array[i + 1].get_object() if i + 1 < len(w_array) else None
+            if isinstance(nxt, list):
+                for j, w in enumerate(nxt):
+                    self.widths[start + j] = float(w)
+                i += 2
+            elif i + 2 < len(w_array):
+                end = int(nxt)
+                w = float(w_array[i + 2])
+                for cid in range(start, end + 1):
+                    self.widths[cid] = w
+                i += 3
+            else:
+                break
+
+    def _load_standard(self, font_dict):
+        """Fall back to the standard-14 AFM metrics shipped with pdfminer."""
+        base = str(font_dict.get("/BaseFont", "")).lstrip("/").split("+")[-1]
+        try:
+            from pdfminer.encodingdb import EncodingDB
+            from pdfminer.fontmetrics import FONT_METRICS
+        except ImportError:
+            self.default_width = self.default_width or 500.0
+            return
+        if base not in FONT_METRICS:
+            self.default_width = self.default_width or 500.0
+            return
+        descriptor, glyph_widths = FONT_METRICS[base]
+        self.descent = float(descriptor.get("Descent", 0)) * self.scale
+        encoding = font_dict.get("/Encoding")
+        name = encoding if isinstance(encoding, str) else "StandardEncoding"
+        cid2unicode = EncodingDB.get_encoding(str(name).lstrip("/"))
+        for code, char in cid2unicode.items():
+            if char in glyph_widths:
+                self.widths[code] = float(glyph_widths[char])
+        self.default_width = self.default_width or float(glyph_widths.get(" ", 500))
+
+    def codes(self, data: bytes) -> Iterable[int]:
+        if self.two_byte:
+            for i in range(0, len(data) - 1, 2):
+                yield (data[i] << 8) | data[i + 1]
+        else:
+            yield from data
+
+    def width(self, code: int) -> float:
+        return self.widths.get(code, self.default_width) * self.scale
+
+
+class _State:
+    __slots__ = ("ctm", "font", "size", "char_space", "word_space", "hscale",
+                 "leading", "rise")
+
+    def __init__(self):
+        self.ctm = IDENTITY
+        self.font = None
+        self.size = 0.0
+        self.char_space = 0.0
+        self.word_space = 0.0
+        self.hscale = 1.0
+        self.leading = 0.0
+        self.rise = 0.0
+
+    def copy(self) -> "_State":
+        other = _State.__new__(_State)
+        for slot in _State.__slots__:
+            setattr(other, slot, getattr(self, slot))
+        return other
+
+
+class _Interpreter:
+    """Minimal content-stream interpreter that only tracks geometry."""
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+        self.boxes: List[Tuple[float, float, float, float]] = []
+        self._fonts: Dict[int, _Font] = {}
+
+    # -- resources -----------------------------------------------------
+    def _font(self, resources, name) -> _Font:
+        fonts = resources.get("/Font") if resources is not None else None
+        ref = fonts.get_object().get(name) if fonts is not None else None
+        if ref is None:
+            return _Font(None)
+        key = id(ref.get_object())
+        if key not in self._fonts:
+            self._fonts[key] = _Font(ref.get_object())
+        return self._fonts[key]
+
+    # -- recording -----------------------------------------------------
+    def _add_points(self, points):
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        self.boxes.append((min(xs), max(xs), min(ys), max(ys)))
+
+    def _add_box(self, m: Matrix, x0, y0, x1, y1):
+        self._add_points(list(_box_corners(m, x0, y0, x1, y1)))
+
+    # -- main loop -----------------------------------------------------
+    def run(self, contents, resources, ctm: Matrix = IDENTITY, depth: int = 0):
+        if contents is None:
+            return
+        stream = ContentStream(contents, self.pdf)
+        gs = _State()
+        gs.ctm = ctm
+        stack: List[_State] = []
+        path: List[Tuple[float, float]] = []
+        tm = tlm = IDENTITY
+
+        for operands, op in stream.operations:
+            if op == b"q":
+                stack.append(gs.copy())
+            elif op == b"Q":
+                if stack:
+                    gs = stack.pop()
+            elif op == b"cm":
+                gs.ctm = _mult(tuple(float(v) for v in operands), gs.ctm)
+
+            # 경로 구성 (좌표는 구성 시점의 CTM으로 변환)
+            elif op == b"m" or op == b"l":
+                path.append(_apply(gs.ctm, float(operands[0]), float(operands[1])))
+            elif op in (b"c", b"v", b"y"):
+                vals = [float(v) for v in operands]
+                for i in range(0, len(vals), 2):
+                    path.append(_apply(gs.ctm, vals[i], vals[i + 1]))
+            elif op == b"re":
+                x, y, w, h = (float(v) for v in operands)
+                path.extend(_box_corners(gs.ctm, x, y, x + w, y + h))
+            elif op in _PAINT_OPS:
+                if path:
+                    self._add_points(path)
+                path = []
+            elif op == b"n":
+                path = []
+
+            # 텍스트 상태
+            elif op == b"BT":
+                tm = tlm = IDENTITY
+            elif op == b"Tf":
+                gs.font = self._font(resources, operands[0])
+                gs.size = float(operands[1])
+            elif op == b"Tc":
+                gs.char_space = float(operands[0])
+            elif op == b"Tw":
+                gs.word_space = float(operands[0])
+            elif op == b"Tz":
+                gs.hscale = float(operands[0]) / 100.0
+            elif op == b"TL":
+                gs.leading = float(operands[0])
+            elif op == b"Ts":
+                gs.rise = float(operands[0])
+            elif op == b"Td" or op == b"TD":
+                tx, ty = float(operands[0]), float(operands[1])
+                if op == b"TD":
+                    gs.leading = -ty
+                tm = tlm = _mult((1.0, 0.0, 0.0, 1.0, tx, ty), tlm)
+            elif op == b"Tm":
+                tm = tlm = tuple(float(v) for v in operands)
+            elif op == b"T*":
+                tm = tlm = _mult((1.0, 0.0, 0.0, 1.0, 0.0, -gs.leading), tlm)
+
+            # 텍스트 출력
+            elif op == b"Tj":
+                tm = self._show(gs, tm, [operands[0]])
+            elif op == b"TJ":
+                tm = self._show(gs, tm, operands[0])
+            elif op == b"'":
+                tm = tlm = _mult((1.0, 0.0, 0.0, 1.0, 0.0, -gs.leading), tlm)
+                tm = self._show(gs, tm, [operands[0]])
+            elif op == b'"':
+                gs.word_space = float(operands[0])
+                gs.char_space = float(operands[1])
+                tm = tlm = _mult((1.0, 0.0, 0.0, 1.0, 0.0, -gs.leading), tlm)
+                tm = self._show(gs, tm, [operands[2]])
+
+            # 이미지 / XObject
+            elif op == b"INLINE IMAGE":
+                self._add_box(gs.ctm, 0.0, 0.0, 1.0, 1.0)
+            elif op == b"Do":
+                self._do_xobject(resources, operands[0], gs.ctm, depth)
+
+    def _show(self, gs: _State, tm: Matrix, items) -> Matrix:
+        """Bound one glyph run and return the advanced text matrix."""
+        font = gs.font or _Font(None)
+        size, hscale = gs.size, gs.hscale
+        x = 0.0
+        lo = hi = None
+        for item in items:
+            if isinstance(item, (str, bytes)):
+                data = item.original_bytes if hasattr(item, "original_bytes") else item
+                if isinstance(data, str):
+                    data = data.encode("latin-1", "replace")
+                for code in font.codes(data):
+                    w = font.width(code) * size * hscale
+                    lo = x if lo is None else min(lo, x)
+                    hi = x + w if hi is None else max(hi, x + w)
+                    spacing = gs.char_space
+                    if code == 32 and not font.two_byte:
+                        spacing += gs.word_space
+                    x += w + spacing * hscale
+            else:
+                x -= float(item) / 1000.0 * size * hscale
+
+        if lo is not None:
+            descent = font.descent * size + gs.rise
+            m = _mult(tm, gs.ctm)
+            self._add_box(m, lo, descent, hi, descent + size)
+        return _mult((1.0, 0.0, 0.0, 1.0, x, 0.0), tm)
+
+    def _do_xobject(self, resources, name, ctm: Matrix, depth: int):
+        xobjects = resources.get("/XObject") if resources is not None else None
+        ref = xobjects.get_object().get(name) if xobjects is not None else None
+        if ref is None:
+            return
+        xobj = ref.get_object()
+        subtype = xobj.get("/Subtype")
+        if subtype == "/Image":
+            self._add_box(ctm, 0.0, 0.0, 1.0, 1.0)
+        elif subtype == "/Form" and depth < _MAX_FORM_DEPTH:
+            matrix = xobj.get("/Matrix")
+            form_ctm = _mult(tuple(float(v) for v in matrix), ctm) if matrix else ctm
+            form_resources = xobj.get("/Resources")
+            form_resources = form_resources.get_object() if form_resources else resources
+            self.run(xobj, form_resources, form_ctm, depth + 1)
+
+
+def page_size(page) -> Tuple[float, float]:
+    """Return (width, height) of *page*'s MediaBox."""
+    box = page.mediabox
+    return float(box.width), float(box.height)
+
+
+def page_boxes(page) -> np.ndarray:
+    """Return an (N, 4) array of (x0, x1, y0, y1) rows, one per drawn object.
+
+    Coordinates are relative to the MediaBox lower-left corner, the same
+    layout ``center_pdf._object_coords`` produces for pdfplumber pages.
+    """
+    resources = page.get("/Resources")
+    resources = resources.get_object() if resources is not None else None
+    interp = _Interpreter(page.pdf)
+    contents = page.get("/Contents")
+    interp.run(contents.get_object() if contents is not None else None, resources)
+    if not interp.boxes:
+        return np.empty((0, 4))
+
+    boxes = np.array(interp.boxes, dtype=np.float64)
+    boxes[:, :2] -= float(page.mediabox.left)
+    boxes[:, 2:] -= float(page.mediabox.bottom)
+    return boxes
@@ -0,0 +1,166 @@
+"""stream_writer.py
+
+Progressive PDF writer for ``center_pdf``'s streaming mode.
+
+``PdfWriter`` clones every page into memory and serializes the whole
+document in ``write()``, so peak memory grows with page count. This writer
+instead serializes each page — and every object it references that has not
+been written yet — as soon as the page is added, then lets the caller drop
+the source objects. Only the object-number map and the xref offsets (a few
+integers per object) are kept until :meth:`close` writes the page tree,
+catalog, xref table and trailer.
+
+Like ``PdfWriter.add_page``, only pages are carried over; document-level
+structures (outlines, names, AcroForm) are not copied.
+"""
+
+from collections import deque
+from typing import BinaryIO, Deque, Dict, List, Tuple
+
+from PyPDF2.generic import (ArrayObject, DictionaryObject, EncodedStreamObject,
+                            IndirectObject, NameObject, NumberObject, StreamObject,
+                            TextStringObject)
+
+_CATALOG_NUM = 1
+_PAGES_NUM = 2
+
+_PAGE_SKIP_KEYS = ("/Parent", "/StructParents")
+
+
+class StreamingPdfWriter:
+    """Write pages to *stream* one at a time, keeping only xref bookkeeping in memory."""
+
+    def __init__(self, stream: BinaryIO, header: bytes = b"%PDF-1.3"):
+        self.stream = stream
+        self._offsets: Dict[int, int] = {}
+        self._numbers: Dict[Tuple[int, int, int], int] = {}
+        self._pending: Deque[Tuple[int, object]] = deque()
+        self._pages: List[int] = []
+        self._next_num = _PAGES_NUM + 1
+        self.stream.write(header + b"\n%\xe2\xe3\xcf\xd3\n")
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    @staticmethod
+    def _key(ref: IndirectObject) -> Tuple[int, int, int]:
+        return id(ref.pdf), ref.idnum, ref.generation
+
+    def reserve_pages(self, pages):
+        """Assign output numbers to all source *pages* up front.
+
+        Links and annotations that point at a page then resolve to its output
+        object instead of dragging the source page (and, through /Parent, the
+        whole source page tree) into the file.
+        """
+        for page in pages:
+            ref = getattr(page, "indirect_reference", None)
+            if ref is not None and self._key(ref) not in self._numbers:
+                self._numbers[self._key(ref)] = self._allocate()
+
+    def _allocate(self) -> int:
+        num = self._next_num
+        self._next_num += 1
+        return num
+
+    def _ref(self, ref: IndirectObject) -> IndirectObject:
+        """Map a source indirect reference to its output number, queueing it on first sight."""
+        key = self._key(ref)
+        num = self._numbers.get(key)
+        if num is None:
+            num = self._numbers[key] = self._allocate()
+            self._pending.append((num, ref))
+        return IndirectObject(num, 0, None)
+
+    def _translate(self, obj):
+        """Return *obj* with every reference renumbered for the output file."""
+        if isinstance(obj, IndirectObject):
+            return self._ref(obj)
+        if isinstance(obj, StreamObject):
+            # 직접 객체로 붙어 있는 스트림(변환된 콘텐츠 등)은 별도 객체로 분리
+            num = self._allocate()
+            self._pending.append((num, obj))
+            return IndirectObject(num, 0, None)
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({k: self._translate(v) for k, v in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self._translate(v) for v in obj)
+        return obj
+
+    def _serialize(self, num: int, obj, translated: bool = False):
+        self._offsets[num] = self.stream.tell()
+        self.stream.write(f"{num} 0 obj\n".encode())
+        if isinstance(obj, StreamObject):
+            if isinstance(obj, EncodedStreamObject):
+                data = obj._data
+            else:
+                data = obj.get_data()
+                obj = {k: v for k, v in obj.items() if k not in ("/Filter", "/DecodeParms")}
+            header = DictionaryObject({k: self._translate(v) for k, v in obj.items() if k != "/Length"})
+            header[NameObject("/Length")] = NumberObject(len(data))
+            header.write_to_stream(self.stream, None)
+            self.stream.write(b"\nstream\n" + data + b"\nendstream")
+        else:
+            (obj if translated else self._translate(obj)).write_to_stream(self.stream, None)
+        self.stream.write(b"\nendobj\n")
+
+    def _flush_pending(self):
+        while self._pending:
+            num, obj = self._pending.popleft()
+            if isinstance(obj, IndirectObject):
+                obj = obj.get_object()
+            self._serialize(num, obj)
+
+    def add_page(self, page):
+        """Serialize *page* and everything it references that is not yet written."""
+        ref = getattr(page, "indirect_reference", None)
+        if ref is not None:
+            # 주석의 /P 등 다른 객체가 이 페이지를 가리키면 같은 번호로 연결되도록 등록
+            num = self._numbers.get(self._key(ref)) or self._allocate()
+            self._numbers[self._key(ref)] = num
+        else:
+            num = self._allocate()
+
+        page_dict = self._translate(
+            DictionaryObject({k: v for k, v in page.items() if k not in _PAGE_SKIP_KEYS}))
+        page_dict[NameObject("/Parent")] = IndirectObject(_PAGES_NUM, 0, None)
+        self._serialize(num, page_dict, translated=True)
+        self._pages.append(num)
+        self._flush_pending()
+        self.stream.flush()
+
+    def close(self):
+        """Write the page tree, catalog, xref table and trailer."""
+        self._flush_pending()
+        pages = DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Count"): NumberObject(len(self._pages)),
+            NameObject("/Kids"): ArrayObject(IndirectObject(n, 0, None) for n in self._pages),
+        })
+        self._serialize(_PAGES_NUM, pages, translated=True)
+        catalog = DictionaryObject({
+            NameObject("/Type"): NameObject("/Catalog"),
+            NameObject("/Pages"): IndirectObject(_PAGES_NUM, 0, None),
+        })
+        self._serialize(_CATALOG_NUM, catalog, translated=True)
+        info_num = self._allocate()
+        self._serialize(info_num, DictionaryObject({
+            NameObject("/Producer"): TextStringObject("PyPDF2"),
+        }))
+
+        xref_pos = self.stream.tell()
+        size = self._next_num
+        lines = [f"xref\n0 {size}\n".encode(), b"0000000000 65535 f \n"]
+        for num in range(1, size):
+            offset = self._offsets.get(num)
+            if offset is None:
+                lines.append(b"0000000000 65535 f \n")
+            else:
+                lines.append(f"{offset:010d} 00000 n \n".encode())
+        self.stream.write(b"".join(lines))
+        self.stream.write(
+            f"trailer\n<< /Size {size} /Root {_CATALOG_NUM} 0 R /Info {info_num} 0 R >>\n"
+            f"startxref\n{xref_pos}\n%%EOF\n".encode()
+        )
+        self.stream.flush()
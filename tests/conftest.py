@@ -0,0 +1,97 @@
+"""Shared fixtures: the repo root on ``sys.path`` and small generated PDFs.
+
+PDFs are built with PyPDF2 like ``benchmarks/corpus.py``, so no binary
+fixtures are checked in. The ``offset_pdf`` pages have a MediaBox and
+CropBox that do not start at the origin, and the content sits off-center
+inside them, so centering shifts every page.
+"""
+
+import io
+import sys
+import zlib
+from pathlib import Path
+from typing import List, Union
+
+import pytest
+from PyPDF2 import PdfWriter
+from PyPDF2.generic import (ArrayObject, DecodedStreamObject, DictionaryObject,
+                            EncodedStreamObject, NameObject, NumberObject, RectangleObject)
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+# 원점에서 떨어진 MediaBox (왼쪽 아래 40, 60)
+OFFSET_BOX = (40, 60, 652, 852)
+OFFSET_PAGES = 3
+
+
+def _image(writer: PdfWriter, size: int = 64):
+    # 렌더링 해상도에 따라 위상이 바뀌어도 차이가 적도록 잡음이 아닌 그러데이션을 씀
+    rows = bytes(v for y in range(size) for x in range(size)
+                 for v in (x * 4 % 256, y * 4 % 256, 128))
+    image = EncodedStreamObject()
+    image._data = zlib.compress(rows)
+    image.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(size),
+        NameObject("/Height"): NumberObject(size),
+        NameObject("/ColorSpace"): NameObject("/DeviceRGB"),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+        NameObject("/Filter"): NameObject("/FlateDecode"),
+    })
+    return writer._add_object(image)
+
+
+def make_pdf(pages: List[Union[str, List[str]]], box=(0, 0, 612, 792)) -> bytes:
+    """Return a PDF with one page per content string, all sharing /F1 (Helvetica) and /Im0.
+
+    A page given as a list of strings gets an array /Contents with one
+    stream per string.
+    """
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    image = _image(writer)
+    left, bottom, right, top = box
+    for content in pages:
+        writer.add_blank_page(right - left, top - bottom)
+        page = writer.pages[-1]
+        page.mediabox = RectangleObject(box)
+        page.cropbox = RectangleObject(box)
+        streams = []
+        for part in [content] if isinstance(content, str) else content:
+            stream = DecodedStreamObject()
+            stream.set_data(part.encode("latin-1"))
+            streams.append(writer._add_object(stream))
+        page[NameObject("/Contents")] = streams[0] if isinstance(content, str) else ArrayObject(streams)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+            NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): image}),
+        })
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def build_offset_pdf(pages: int = OFFSET_PAGES) -> bytes:
+    """Return a PDF whose pages have an offset MediaBox and off-center text, paths and an image."""
+    left, bottom, _, _ = OFFSET_BOX
+    contents = []
+    for i in range(pages):
+        # 페이지마다 다른 방향으로 치우치게 배치
+        x, y = left + 30 + 60 * i, bottom + 40 + 90 * i
+        contents.append(
+            f"BT /F1 14 Tf {x} {y + 300} Td (Page {i + 1} of the offset box test) Tj ET "
+            f"1 w {x} {y} 220 160 re S 0.2 0.4 0.8 rg {x + 10} {y + 10} 80 60 re f "
+            f"q 120 0 0 120 {x + 100} {y + 20} cm /Im0 Do Q")
+    return make_pdf(contents, OFFSET_BOX)
+
+
+@pytest.fixture(scope="session")
+def offset_pdf() -> bytes:
+    return build_offset_pdf()
@@ -0,0 +1,118 @@
+"""asyncio API: results, failures and the concurrency bound."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from PyPDF2 import PdfReader
+
+import center_async
+from center_async import AsyncCenterer, CenterError, center_many_async, center_pdf_async
+from conftest import OFFSET_PAGES
+
+
+@pytest.fixture
+def jobs(tmp_path, offset_pdf):
+    pairs = []
+    for i in range(5):
+        src = tmp_path / f"in{i}.pdf"
+        src.write_bytes(offset_pdf)
+        pairs.append((src, tmp_path / "out" / src.name))
+    return pairs
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+def test_center_one_file_on_threads(jobs):
+    async def run():
+        async with AsyncCenterer(executor="thread", max_workers=2) as centerer:
+            return await center_pdf_async(*jobs[0], centerer=centerer, engine="stream")
+
+    result = asyncio.run(run())
+    assert result.ok and result.pages == OFFSET_PAGES
+    assert len(PdfReader(jobs[0][1]).pages) == OFFSET_PAGES
+
+
+def test_center_one_file_on_processes(jobs):
+    async def run():
+        async with AsyncCenterer(max_workers=1) as centerer:
+            return await centerer.center(*jobs[0], engine="stream")
+
+    assert asyncio.run(run()).pages == OFFSET_PAGES
+    assert jobs[0][1].exists()
+
+
+def test_failure_raises_center_error_with_cause(tmp_path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+
+    async def run():
+        async with AsyncCenterer(executor="thread") as centerer:
+            await centerer.center(broken, tmp_path / "out.pdf", engine="stream")
+
+    with pytest.raises(CenterError) as info:
+        asyncio.run(run())
+    assert info.value.__cause__ is not None
+    assert not (tmp_path / "out.pdf").exists()
+
+
+def test_center_many_yields_failures_as_results(jobs, tmp_path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    pairs = jobs + [(broken, tmp_path / "out" / "broken.pdf")]
+
+    async def run():
+        centerer = AsyncCenterer(executor="thread", max_workers=2)
+        try:
+            return await _collect(center_many_async(pairs, centerer=centerer, engine="stream"))
+        finally:
+            centerer.close()
+
+    results = asyncio.run(run())
+    assert sorted(r.input_path for r in results) == sorted(str(src) for src, _ in pairs)
+    failed = [r for r in results if not r.ok]
+    assert [r.input_path for r in failed] == [str(broken)]
+    assert failed[0].error
+
+
+def test_concurrency_is_bounded(jobs, monkeypatch):
+    running, peak = 0, 0
+    lock = threading.Lock()
+    center_job = center_async._center_job
+
+    def tracked(job):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        try:
+            time.sleep(0.05)
+            return center_job(job)
+        finally:
+            with lock:
+                running -= 1
+
+    monkeypatch.setattr(center_async, "_center_job", tracked)
+
+    async def run():
+        async with AsyncCenterer(2, executor="thread", max_workers=4) as centerer:
+            return await _collect(centerer.center_many(jobs, engine="stream"))
+
+    assert len(asyncio.run(run())) == len(jobs)
+    assert peak == 2
+
+
+@pytest.mark.parametrize("options", [{"engine": "nope"}, {"dedupe": True, "streaming": True},
+                                     {"progress": print}])
+def test_bad_options_are_rejected_before_submitting(jobs, options):
+    centerer = AsyncCenterer(executor="thread")
+
+    async def run():
+        await centerer.center(*jobs[0], **options)
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+    assert centerer._executor is None
@@ -0,0 +1,41 @@
+"""Option checks in ``center_batch`` and the job queue runner."""
+
+import pytest
+
+from center_batch import center_batch
+from center_jobs import JobQueue, run_queue
+from conftest import make_pdf
+
+BAD_OPTIONS = [
+    {"engine": "nope"},
+    {"transform": "nope"},
+    {"reuse": "nope"},
+    {"raster_dpi": 0},
+    {"dedupe": True, "streaming": True},
+    {"dedupe": True, "incremental": True},
+]
+
+
+@pytest.fixture
+def jobs(tmp_path):
+    pairs = []
+    for i in range(3):
+        src = tmp_path / f"in{i}.pdf"
+        src.write_bytes(make_pdf(["BT /F1 12 Tf 100 100 Td (x) Tj ET"]))
+        pairs.append((src, tmp_path / "out" / src.name))
+    return pairs
+
+
+@pytest.mark.parametrize("options", BAD_OPTIONS)
+def test_center_batch_rejects_bad_options_before_converting(jobs, options):
+    with pytest.raises(ValueError):
+        center_batch(jobs, workers=2, **options)
+    assert not any(dst.exists() for _, dst in jobs)
+
+
+@pytest.mark.parametrize("options", BAD_OPTIONS)
+def test_run_queue_rejects_bad_options_before_adding_jobs(jobs, tmp_path, options):
+    job_queue = JobQueue(tmp_path / "jobs.db")
+    with pytest.raises(ValueError):
+        run_queue(job_queue, jobs, workers=1, **options)
+    assert job_queue.counts().get("pending", 0) == 0
@@ -0,0 +1,66 @@
+"""The on-disk result cache: hits reproduce the converted bytes without reconverting."""
+
+import os
+
+import pytest
+
+from center_cache import ResultCache
+from center_pdf import _cache_params, center_pdf
+
+
+@pytest.fixture
+def source(tmp_path, offset_pdf):
+    path = tmp_path / "in.pdf"
+    path.write_bytes(offset_pdf)
+    return path
+
+
+@pytest.mark.parametrize("link", [False, True])
+def test_hit_returns_identical_bytes(tmp_path, source, link):
+    cache = ResultCache(tmp_path / "cache", link=link)
+    first, second = tmp_path / "first.pdf", tmp_path / "second.pdf"
+    assert center_pdf(source, first, engine="stream", cache=cache)
+    assert cache.stats()["misses"] == 1
+
+    assert center_pdf(source, second, engine="stream", cache=cache)
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+    assert second.read_bytes() == first.read_bytes()
+
+
+def test_different_options_miss(tmp_path, source):
+    cache = ResultCache(tmp_path / "cache")
+    center_pdf(source, tmp_path / "a.pdf", engine="stream", cache=cache)
+    center_pdf(source, tmp_path / "b.pdf", engine="stream", margin=10, cache=cache)
+    assert cache.stats()["hits"] == 0
+
+
+def test_fetch_replaces_output_without_leaving_temporary_files(tmp_path, source):
+    cache = ResultCache(tmp_path / "cache")
+    output = tmp_path / "out" / "result.pdf"
+    center_pdf(source, output, engine="stream", cache=cache)
+    expected = output.read_bytes()
+
+    output.write_bytes(b"stale")
+    key = cache.key(source, _cache_params({"engine": "stream"}))
+    assert cache.fetch(key, output) is not None
+    assert output.read_bytes() == expected
+    assert os.listdir(output.parent) == ["result.pdf"]
+
+
+def test_missing_entry_is_a_miss(tmp_path, source):
+    cache = ResultCache(tmp_path / "cache")
+    output = tmp_path / "out.pdf"
+    assert cache.fetch(cache.key(source, _cache_params({"engine": "stream"})), output) is None
+    assert not output.exists()
+    assert cache.stats()["misses"] == 1
+
+
+def test_evict_keeps_the_cache_within_max_bytes(tmp_path, source):
+    cache = ResultCache(tmp_path / "cache")
+    for margin in range(3):
+        center_pdf(source, tmp_path / f"{margin}.pdf", engine="stream", margin=margin, cache=cache)
+    size = cache.size()
+    cache.evict(size // 2)
+    assert 0 < cache.size() <= size // 2
+    cache.clear()
+    assert cache.size() == 0
@@ -0,0 +1,72 @@
+"""Resource deduplication: identical images and fonts are written once, rendering is unchanged."""
+
+import io
+import random
+
+import pytest
+from PyPDF2 import PdfReader
+
+from center_batch import center_batch
+from center_pdf import center_pdf_bytes, center_pdf_combined
+from dedupe_check import _same_render, certificates
+from resource_dedupe import DedupeReport
+
+PAGES = 4
+SIZE = 64
+
+
+@pytest.fixture(scope="module")
+def inputs(tmp_path_factory):
+    rng = random.Random(0)
+    background = rng.randbytes(SIZE * SIZE * 3)
+    seal = rng.randbytes((SIZE // 4) ** 2 * 3)
+    folder = tmp_path_factory.mktemp("certificates")
+    paths = []
+    for i in range(2):
+        path = folder / f"cert{i}.pdf"
+        certificates(path, i, PAGES, background, seal, SIZE)
+        paths.append(path)
+    return paths
+
+
+def _images(data: bytes) -> int:
+    return len({page["/Resources"]["/XObject"].raw_get(name).idnum
+                for page in PdfReader(io.BytesIO(data)).pages
+                for name in page["/Resources"]["/XObject"]})
+
+
+def test_per_file_dedupe_shrinks_output_and_renders_the_same(inputs):
+    plain = center_pdf_bytes(inputs[0], engine="stream")
+    report = DedupeReport()
+    deduped = center_pdf_bytes(inputs[0], engine="stream", dedupe=True, dedupe_report=report)
+
+    assert _images(plain) == 2 * PAGES
+    assert _images(deduped) == 2
+    assert report.objects >= 2 * (PAGES - 1)
+    assert report.bytes_saved > 0
+    assert len(deduped) < len(plain)
+    assert _same_render(plain, deduped, dpi=36.0)
+
+
+def test_combined_output_shares_resources_across_files(inputs, tmp_path):
+    plain, deduped = tmp_path / "plain.pdf", tmp_path / "deduped.pdf"
+    assert center_pdf_combined(inputs, plain, engine="stream", dedupe=False) == 2 * PAGES
+    report = DedupeReport()
+    center_pdf_combined(inputs, deduped, engine="stream", dedupe_report=report)
+
+    assert _images(deduped.read_bytes()) == 2
+    assert deduped.stat().st_size < plain.stat().st_size
+    assert _same_render(plain.read_bytes(), deduped.read_bytes(), dpi=36.0)
+
+
+def test_batch_reports_bytes_deduped(inputs, tmp_path):
+    jobs = [(path, tmp_path / path.name) for path in inputs]
+    summary = center_batch(jobs, workers=1, engine="stream", dedupe=True)
+    assert all(result.ok for result in summary.results)
+    assert all(result.bytes_deduped > 0 for result in summary.results)
+
+
+@pytest.mark.parametrize("other", ["streaming", "incremental"])
+def test_dedupe_cannot_be_combined_with(inputs, other):
+    with pytest.raises(ValueError, match="dedupe"):
+        center_pdf_bytes(inputs[0], engine="stream", dedupe=True, **{other: True})
@@ -0,0 +1,94 @@
+"""Input discovery: include/exclude patterns, output placement and up-to-date skips."""
+
+import os
+
+import pytest
+
+from center_discover import DiscoveryReport, discover, output_up_to_date
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "in"
+    for name in ["a.pdf", "b.pdf", "notes.txt", "centered_old.pdf",
+                 "sub/c.pdf", "sub/deep/d.pdf", "drafts/e.pdf", "sub/drafts/f.pdf"]:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"%PDF-1.4\n")
+    return root
+
+
+def _relative(pairs, root):
+    return [src.relative_to(root).as_posix() for src, _ in pairs]
+
+
+def test_top_level_only_by_default(tree):
+    pairs = list(discover(tree))
+    assert _relative(pairs, tree) == ["a.pdf", "b.pdf"]
+    assert [dst.name for _, dst in pairs] == ["centered_a.pdf", "centered_b.pdf"]
+    assert all(dst.parent == src.parent for src, dst in pairs)
+
+
+def test_recursive_walk_keeps_structure_under_output_root(tree, tmp_path):
+    out = tmp_path / "out"
+    pairs = list(discover(tree, out, recursive=True))
+    assert _relative(pairs, tree) == ["a.pdf", "b.pdf", "centered_old.pdf", "drafts/e.pdf",
+                                      "sub/c.pdf", "sub/deep/d.pdf", "sub/drafts/f.pdf"]
+    for src, dst in pairs:
+        assert dst == out / src.relative_to(tree)
+
+
+def test_exclude_by_name_prunes_folders(tree, tmp_path):
+    pairs = discover(tree, tmp_path / "out", recursive=True, exclude=["drafts", "b.*"])
+    assert _relative(pairs, tree) == ["a.pdf", "centered_old.pdf", "sub/c.pdf", "sub/deep/d.pdf"]
+
+
+def test_patterns_with_a_slash_match_relative_paths(tree, tmp_path):
+    pairs = discover(tree, tmp_path / "out", recursive=True, include=["drafts/*.pdf"])
+    assert _relative(pairs, tree) == ["drafts/e.pdf"]
+    pairs = discover(tree, tmp_path / "out", recursive=True, exclude=["sub/deep", "*.txt"],
+                     include=["*"])
+    assert _relative(pairs, tree) == ["a.pdf", "b.pdf", "centered_old.pdf", "drafts/e.pdf",
+                                      "sub/c.pdf", "sub/drafts/f.pdf"]
+
+
+def test_output_folder_inside_the_input_is_not_walked(tree):
+    out = tree / "out"
+    (out / "a.pdf").parent.mkdir()
+    (out / "a.pdf").write_bytes(b"%PDF-1.4\n")
+    assert "out/a.pdf" not in _relative(discover(tree, out, recursive=True), tree)
+
+
+def test_up_to_date_outputs_are_skipped(tree, tmp_path):
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "a.pdf").write_bytes(b"done")
+    (out / "b.pdf").write_bytes(b"")  # 비어 있으면 최신이 아님
+    report = DiscoveryReport()
+    assert _relative(discover(tree, out, report=report), tree) == ["b.pdf", "centered_old.pdf"]
+    assert (report.found, report.skipped) == (3, 1)
+
+    assert len(list(discover(tree, out, skip_up_to_date=False))) == 3
+
+
+def test_output_up_to_date_compares_mtimes(tmp_path):
+    src, dst = tmp_path / "in.pdf", tmp_path / "out.pdf"
+    src.write_bytes(b"%PDF-1.4\n")
+    assert not output_up_to_date(src, dst)
+    dst.write_bytes(b"done")
+    os.utime(src, (1_000_000, 1_000_000))
+    assert output_up_to_date(src, dst)
+    with os.scandir(tmp_path) as it:
+        entry = next(e for e in it if e.name == "in.pdf")
+    assert output_up_to_date(entry, dst)
+
+    os.utime(src, None)
+    os.utime(dst, (1_000_000, 1_000_000))
+    assert not output_up_to_date(src, dst)
+
+
+def test_unreadable_folder_is_reported(tmp_path):
+    errors = []
+    report = DiscoveryReport()
+    assert list(discover(tmp_path / "missing", report=report, on_error=errors.append)) == []
+    assert report.errors == 1 and isinstance(errors[0], OSError)
@@ -0,0 +1,62 @@
+"""Incremental output appends an update to the original bytes instead of rewriting them."""
+
+import io
+
+import numpy as np
+import pypdfium2 as pdfium
+import pytest
+from PyPDF2 import PdfReader
+
+from center_pdf import center_pdf_bytes
+from conftest import OFFSET_BOX, OFFSET_PAGES, make_pdf
+
+# 두 번째 페이지는 콘텐츠 스트림이 배열
+ARRAY_PDF = make_pdf([
+    "BT /F1 14 Tf 60 80 Td (left bottom) Tj ET",
+    ["q 100 0 0 100 70 90 cm /Im0 Do Q ", "BT /F1 14 Tf 60 200 Td (array) Tj ET"],
+])
+
+
+def _render(data: bytes, dpi: float = 36.0):
+    pdf = pdfium.PdfDocument(data)
+    try:
+        return [page.render(scale=dpi / 72.0).to_numpy().copy() for page in pdf]
+    finally:
+        pdf.close()
+
+
+@pytest.mark.parametrize("transform", ["matrix", "box"])
+def test_output_starts_with_the_original_bytes(offset_pdf, transform):
+    data = center_pdf_bytes(offset_pdf, engine="stream", incremental=True, transform=transform)
+    assert data.startswith(offset_pdf)
+    assert data.count(b"%%EOF") == offset_pdf.count(b"%%EOF") + 1
+    assert len(PdfReader(io.BytesIO(data), strict=True).pages) == OFFSET_PAGES
+
+
+@pytest.mark.parametrize("source", [pytest.param(None, id="offset"), pytest.param(ARRAY_PDF, id="array")])
+@pytest.mark.parametrize("transform", ["matrix", "box"])
+def test_renders_like_a_full_rewrite(offset_pdf, source, transform):
+    source = source or offset_pdf
+    full = center_pdf_bytes(source, engine="stream", transform=transform)
+    incremental = center_pdf_bytes(source, engine="stream", transform=transform, incremental=True)
+    expected, actual = _render(full), _render(incremental)
+    assert len(actual) == len(expected)
+    for want, got in zip(expected, actual):
+        assert got.shape == want.shape
+        assert np.array_equal(got, want)
+
+
+def test_box_transform_adds_no_content_streams(offset_pdf):
+    data = center_pdf_bytes(offset_pdf, engine="stream", incremental=True, transform="box")
+    for source, page in zip(PdfReader(io.BytesIO(offset_pdf)).pages,
+                            PdfReader(io.BytesIO(data)).pages):
+        assert page.raw_get("/Contents").idnum == source.raw_get("/Contents").idnum
+        assert [float(v) for v in page.mediabox] != list(OFFSET_BOX)
+
+
+def test_unshifted_pages_are_not_redefined():
+    centered = center_pdf_bytes(ARRAY_PDF, engine="stream")
+    data = center_pdf_bytes(centered, engine="stream", incremental=True)
+    update = data[len(centered):]
+    assert data.startswith(centered)
+    assert b"/Type /Page" not in update
@@ -0,0 +1,145 @@
+"""SQLite job queue: exclusive claims, lease expiry, attempts and resumed runs."""
+
+import time
+
+import pytest
+
+from center_batch import CenterResult
+from center_jobs import DONE, FAILED, PENDING, RUNNING, JobQueue, run_queue
+
+LEASE = 0.2
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "jobs.sqlite"
+
+
+@pytest.fixture
+def pairs(tmp_path):
+    return [(tmp_path / f"in{i}.pdf", tmp_path / "out" / f"in{i}.pdf") for i in range(4)]
+
+
+def _ok(job, pages=1):
+    return CenterResult(job.input_path, job.output_path, True, pages)
+
+
+def _failed(job):
+    return CenterResult(job.input_path, job.output_path, False, error="boom")
+
+
+def test_add_ignores_known_inputs(db, pairs):
+    with JobQueue(db) as queue:
+        assert queue.add(pairs) == len(pairs)
+        assert queue.add(pairs[:2] + [(pairs[0][0], "elsewhere.pdf")]) == 0
+        assert queue.counts()[PENDING] == len(pairs)
+        assert [job.output_path for job in queue.jobs()] == [str(dst) for _, dst in pairs]
+
+
+def test_runners_never_claim_the_same_job(db, pairs):
+    with JobQueue(db) as a, JobQueue(db) as b:
+        a.add(pairs)
+        first, second = a.claim("a", 3), b.claim("b", 3)
+        assert len(first) == 3 and len(second) == 1
+        assert not {job.id for job in first} & {job.id for job in second}
+        assert b.claim("b", 3) == []
+        assert all(job.state == RUNNING and job.attempts == 1 for job in first + second)
+
+
+def test_expired_lease_is_claimed_again(db, pairs):
+    with JobQueue(db, lease=LEASE) as a, JobQueue(db, lease=LEASE) as b:
+        a.add(pairs[:1])
+        (job,) = a.claim("a")
+        assert b.claim("b") == []
+
+        time.sleep(LEASE * 1.5)
+        (again,) = b.claim("b")
+        assert again.id == job.id
+        assert again.worker == "b" and again.attempts == 2
+
+        # 리스를 잃은 러너의 결과는 기록하지 않음
+        a.finish("a", job.id, _ok(job))
+        assert b.counts()[RUNNING] == 1
+        b.finish("b", again.id, _ok(again, pages=3))
+        (done,) = b.jobs(DONE)
+        assert done.worker == "b" and done.pages == 3
+
+
+def test_heartbeat_keeps_the_lease(db, pairs):
+    with JobQueue(db, lease=LEASE) as a, JobQueue(db, lease=LEASE) as b:
+        a.add(pairs[:1])
+        (job,) = a.claim("a")
+        for _ in range(3):
+            time.sleep(LEASE / 2)
+            a.heartbeat("a", [job.id])
+        assert b.claim("b") == []
+
+
+def test_abandoned_job_fails_after_max_attempts(db, pairs):
+    with JobQueue(db, lease=LEASE, max_attempts=1) as queue:
+        queue.add(pairs[:1])
+        queue.claim("a")
+        time.sleep(LEASE * 1.5)
+        assert queue.claim("b") == []
+        (job,) = queue.jobs(FAILED)
+        assert job.error
+
+
+def test_failed_jobs_are_retried_up_to_max_attempts(db, pairs):
+    with JobQueue(db, max_attempts=2) as queue:
+        queue.add(pairs[:1])
+        for expected in (1, 2):
+            (job,) = queue.claim("a")
+            assert job.attempts == expected
+            queue.finish("a", job.id, _failed(job))
+            queue.requeue_failed()
+        assert queue.claim("a") == []
+        assert queue.counts()[FAILED] == 1
+
+        assert queue.retry() == 1
+        (job,) = queue.claim("a")
+        assert job.attempts == 1
+
+
+def test_release_and_cancel_do_not_use_up_attempts(db, pairs):
+    with JobQueue(db, max_attempts=1) as queue:
+        queue.add(pairs[:2])
+        first, second = queue.claim("a", 2)
+        queue.release("a", [first.id])
+        result = _ok(second)
+        result.cancelled = True
+        queue.finish("a", second.id, result)
+        assert [(job.state, job.attempts) for job in queue.jobs()] == [(PENDING, 0), (PENDING, 0)]
+
+
+def test_add_with_reset_requeues_finished_jobs(db, pairs):
+    with JobQueue(db) as queue:
+        queue.add(pairs[:3])
+        done, failed, running = queue.claim("a", 3)
+        queue.finish("a", done.id, _ok(done))
+        queue.finish("a", failed.id, _failed(failed))
+
+        # 완료·실패 두 개를 되돌리고 새 입력 하나를 추가 (실행 중인 작업은 그대로)
+        assert queue.add([(src, f"{dst}.new") for src, dst in pairs], reset=True) == 3
+        states = {job.input_path: job for job in queue.jobs()}
+        assert states[done.input_path].state == PENDING
+        assert states[done.input_path].output_path == f"{pairs[0][1]}.new"
+        assert states[failed.input_path].attempts == 0
+        assert states[running.input_path].state == RUNNING
+
+
+def test_run_queue_converts_each_job_once(db, tmp_path, offset_pdf):
+    jobs = []
+    for i in range(3):
+        src = tmp_path / f"doc{i}.pdf"
+        src.write_bytes(offset_pdf)
+        jobs.append((src, tmp_path / "out" / src.name))
+
+    with JobQueue(db) as queue:
+        summary = run_queue(queue, jobs, workers=2, engine="stream")
+        assert len(summary.results) == len(jobs) and all(r.ok for r in summary.results)
+        assert all(job.output_sha256 for job in queue.jobs(DONE))
+        assert queue.counts()[DONE] == len(jobs)
+
+        assert run_queue(queue, jobs, workers=2, engine="stream").results == []
+        assert len(run_queue(queue, jobs, reset=True, workers=2, engine="stream").results) == len(jobs)
@@ -0,0 +1,60 @@
+"""Layout fingerprints and ``reuse`` on templated and differently laid out pages."""
+
+import io
+
+import pytest
+from PyPDF2 import PdfReader
+
+from center_pdf import center_pdf, center_pdf_bytes
+from conftest import make_pdf
+from page_fingerprint import LayoutMemo, page_fingerprint
+
+TEMPLATE = ("1 w 40 300 420 260 re S "
+            "BT /F1 22 Tf 120 500 Td (Certificate of Award) Tj ET "
+            "BT /F1 16 Tf {x} {y} Td ({name}) Tj ET")
+
+
+def _fingerprints(data: bytes):
+    return [page_fingerprint(page) for page in PdfReader(io.BytesIO(data)).pages]
+
+
+def test_names_in_one_template_share_a_fingerprint():
+    data = make_pdf([TEMPLATE.format(x=200, y=420, name=name) for name in ("Kim", "Lee")])
+    first, second = _fingerprints(data)
+    assert first == second
+
+
+def test_text_positions_change_the_fingerprint():
+    data = make_pdf([TEMPLATE.format(x=200, y=420, name="Kim"),
+                     TEMPLATE.format(x=60, y=120, name="Kim")])
+    first, second = _fingerprints(data)
+    assert first != second
+
+
+def test_fonts_change_the_fingerprint():
+    data = make_pdf(["BT /F1 12 Tf 100 100 Td (a) Tj ET", "BT /F1 30 Tf 100 100 Td (a) Tj ET"])
+    first, second = _fingerprints(data)
+    assert first != second
+
+
+def test_array_contents_are_fingerprinted_as_one_stream():
+    data = make_pdf([["1 w 40 300 420 260 re S", "BT /F1 16 Tf 200 420 Td (Kim) Tj ET"],
+                     ["1 w 40 300 420 260 re S", "BT /F1 16 Tf 200 420 Td (Lee) Tj ET"]])
+    first, second = _fingerprints(data)
+    assert first == second
+
+
+@pytest.mark.parametrize("reuse", ["verify", "trust"])
+def test_reuse_matches_full_analysis_on_array_contents(tmp_path, reuse):
+    data = make_pdf([["1 w 40 300 420 260 re S", TEMPLATE.format(x=200, y=420, name="Kim")],
+                     ["1 w 40 300 420 260 re S", TEMPLATE.format(x=60, y=120, name="Kim")],
+                     ["1 w 40 300 420 260 re S", TEMPLATE.format(x=200, y=420, name="Lee")]])
+    source = tmp_path / "in.pdf"
+    source.write_bytes(data)
+    memo = LayoutMemo()
+    assert center_pdf(source, tmp_path / f"{reuse}.pdf", engine="stream", reuse=reuse, memo=memo)
+    expected = center_pdf_bytes(data, engine="stream")
+    assert (tmp_path / f"{reuse}.pdf").read_bytes() == expected
+    # 첫째와 셋째 쪽은 같은 템플릿이고 둘째 쪽은 배치가 다름
+    assert memo.stats()["analyzed"] == 2
+    assert memo.stats()["avoided"] == 1
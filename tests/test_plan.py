@@ -0,0 +1,74 @@
+"""Plan files: analyze once, save as JSON or binary, apply like a direct conversion."""
+
+import io
+
+import pytest
+from PyPDF2 import PdfReader
+
+from center_pdf import center_pdf_bytes
+from center_plan import PlanMismatchError, analyze_pdf, apply_plan, load_plan, save_plan
+from conftest import OFFSET_PAGES, build_offset_pdf
+
+
+@pytest.fixture
+def source(tmp_path, offset_pdf):
+    path = tmp_path / "in.pdf"
+    path.write_bytes(offset_pdf)
+    return path
+
+
+@pytest.mark.parametrize("suffix", [".json", ".cfplan"])
+def test_round_trip(tmp_path, source, suffix):
+    plan = analyze_pdf(source, engine="stream", margin=5)
+    path = tmp_path / f"plan{suffix}"
+    save_plan(plan, path)
+    loaded = load_plan(path)
+    assert loaded.input_sha256 == plan.input_sha256
+    assert loaded.options == plan.options
+    assert len(loaded.pages) == OFFSET_PAGES
+    for original, restored in zip(plan.pages, loaded.pages):
+        assert restored.applied == original.applied
+        assert restored.tx == pytest.approx(original.tx)
+        assert restored.ty == pytest.approx(original.ty)
+        assert restored.bbox == pytest.approx(original.bbox)
+
+
+def test_apply_matches_direct_conversion(tmp_path, source):
+    plan_path = tmp_path / "plan.cfplan"
+    save_plan(analyze_pdf(source, engine="stream"), plan_path)
+    output = tmp_path / "out.pdf"
+    assert apply_plan(load_plan(plan_path), source, output) == OFFSET_PAGES
+
+    direct = PdfReader(io.BytesIO(center_pdf_bytes(source, engine="stream")))
+    for planned, converted in zip(PdfReader(output).pages, direct.pages):
+        assert planned.get_contents().get_data() == converted.get_contents().get_data()
+
+
+def test_apply_rejects_another_input(tmp_path, source, offset_pdf):
+    other = tmp_path / "other.pdf"
+    other.write_bytes(offset_pdf + b"\n")  # 내용은 같고 해시만 다름
+    with pytest.raises(PlanMismatchError):
+        apply_plan(analyze_pdf(source, engine="stream"), other, tmp_path / "out.pdf")
+
+
+def test_apply_rejects_page_count_mismatch_without_verify(tmp_path, source):
+    shorter = tmp_path / "shorter.pdf"
+    shorter.write_bytes(build_offset_pdf(OFFSET_PAGES - 1))
+    output = tmp_path / "out.pdf"
+    with pytest.raises(PlanMismatchError, match="pages"):
+        apply_plan(analyze_pdf(source, engine="stream"), shorter, output, verify=False)
+    assert not output.exists()
+
+
+def test_analyze_rejects_unknown_engine(source):
+    with pytest.raises(ValueError):
+        analyze_pdf(source, engine="nope")
+
+
+@pytest.mark.parametrize("keep", [10, -10])
+def test_load_rejects_truncated_binary_plan(tmp_path, source, keep):
+    path = tmp_path / "plan.cfplan"
+    save_plan(analyze_pdf(source, engine="stream"), path)
+    path.write_bytes(path.read_bytes()[:keep])
+    with pytest.raises(ValueError, match="truncated"):
+        load_plan(path)
@@ -0,0 +1,100 @@
+"""``center_server`` over a real localhost socket: 200, 503, 413 and 400."""
+
+import http.client
+import io
+import threading
+
+import pytest
+from PyPDF2 import PdfReader
+
+from center_server import CenterService, make_server
+from conftest import OFFSET_PAGES
+
+MAX_BODY = 1 << 20
+
+
+@pytest.fixture(scope="module")
+def server():
+    # 워커 1개, 대기열 0: 자리 하나만 잡고 있으면 다음 요청은 503
+    service = CenterService(workers=1, queue_size=0)
+    service.start()
+    httpd = make_server(service, port=0, max_body=MAX_BODY, quiet=True)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+
+def _post(httpd, body: bytes = b"", headers=None, query: str = ""):
+    """POST /center with exactly *headers* (no automatic Content-Length); return (status, headers, body)."""
+    connection = http.client.HTTPConnection(*httpd.server_address, timeout=30)
+    try:
+        connection.putrequest("POST", f"/center{query}")
+        for name, value in (headers or {}).items():
+            connection.putheader(name, value)
+        connection.endheaders()
+        if body:
+            connection.send(body)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def test_center_returns_the_centered_pdf(server, offset_pdf):
+    status, headers, body = _post(server, offset_pdf, {"Content-Length": str(len(offset_pdf))},
+                                  "?engine=stream")
+    assert status == 200
+    assert headers["Content-Type"] == "application/pdf"
+    assert headers["X-Pages"] == str(OFFSET_PAGES)
+    assert len(PdfReader(io.BytesIO(body)).pages) == OFFSET_PAGES
+
+
+def test_full_queue_is_refused_before_the_body_is_read(server, offset_pdf):
+    with server.service.admit():
+        # 본문을 보내지 않아도 바로 거절되어야 함
+        status, headers, _ = _post(server, headers={"Content-Length": str(len(offset_pdf))})
+    assert status == 503
+    assert headers["Retry-After"] == "1"
+    assert headers["Connection"] == "close"
+
+
+def test_body_over_the_limit_is_refused(server):
+    status, _, body = _post(server, headers={"Content-Length": str(MAX_BODY + 1)})
+    assert status == 413
+    assert str(MAX_BODY).encode() in body
+
+
+@pytest.mark.parametrize("headers, query", [
+    ({"Content-Length": "abc"}, ""),
+    ({"Content-Length": "-5"}, ""),
+    ({"Content-Length": "9"}, ""),  # 본문이 PDF가 아님
+    ({"Content-Length": "0"}, "?engine=bogus"),
+    ({"Content-Length": "0"}, "?dedupe=1&streaming=1"),
+    ({"Content-Length": "0"}, "?dedupe=1&incremental=1"),
+])
+def test_bad_requests_get_400(server, headers, query):
+    body = b"not a pdf" if headers["Content-Length"] == "9" else b""
+    status, _, _ = _post(server, body, headers, query)
+    assert status == 400
+
+
+def test_option_combinations_are_checked_before_the_worker(server, offset_pdf):
+    # 본문이 올바른 PDF여도 워커로 보내기 전에 400으로 거절
+    status, _, body = _post(server, offset_pdf, {"Content-Length": str(len(offset_pdf))},
+                            "?dedupe=1&streaming=1")
+    assert status == 400
+    assert b"dedupe" in body
+
+
+def test_statuses_are_counted_in_metrics(server):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=30)
+    try:
+        connection.request("GET", "/metrics")
+        metrics = connection.getresponse().read().decode()
+    finally:
+        connection.close()
+    for status in (200, 503, 413, 400):
+        assert f'status="{status}"' in metrics
@@ -0,0 +1,53 @@
+"""Streaming output writes the same pages as the default writer, one page at a time."""
+
+import io
+
+import pypdfium2 as pdfium
+import pytest
+from PyPDF2 import PdfReader
+
+from center_pdf import center_pdf, center_pdf_bytes
+from conftest import OFFSET_PAGES
+
+
+class _Pipe:
+    """Write-only sink without ``tell`` or ``seek``, like a pipe or socket."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+
+@pytest.mark.parametrize("transform", ["matrix", "box"])
+def test_streaming_matches_default_output(tmp_path, offset_pdf, transform):
+    source = tmp_path / "in.pdf"
+    source.write_bytes(offset_pdf)
+    default, streamed = tmp_path / "default.pdf", tmp_path / "streamed.pdf"
+    assert center_pdf(source, default, engine="stream", transform=transform)
+    assert center_pdf(source, streamed, engine="stream", transform=transform, streaming=True)
+
+    expected, actual = PdfReader(default), PdfReader(streamed, strict=True)
+    assert len(actual.pages) == OFFSET_PAGES
+    for want, got in zip(expected.pages, actual.pages):
+        assert got.get_contents().get_data() == want.get_contents().get_data()
+        assert list(got.mediabox) == list(want.mediabox)
+        assert list(got.cropbox) == list(want.cropbox)
+    assert len(pdfium.PdfDocument(str(streamed))) == OFFSET_PAGES
+
+
+def test_shared_resources_are_written_once(offset_pdf):
+    reader = PdfReader(io.BytesIO(center_pdf_bytes(offset_pdf, engine="stream", streaming=True)))
+    images = {page["/Resources"]["/XObject"].raw_get("/Im0").idnum for page in reader.pages}
+    fonts = {page["/Resources"]["/Font"].raw_get("/F1").idnum for page in reader.pages}
+    assert len(images) == len(fonts) == 1
+
+
+def test_streaming_to_a_write_only_sink(offset_pdf):
+    pipe = _Pipe()
+    assert center_pdf_bytes(offset_pdf, pipe, engine="stream", streaming=True) == OFFSET_PAGES
+    data = b"".join(pipe.chunks)
+    assert data == center_pdf_bytes(offset_pdf, engine="stream", streaming=True)
+    assert len(PdfReader(io.BytesIO(data), strict=True).pages) == OFFSET_PAGES
@@ -0,0 +1,52 @@
+"""``--transform box`` against ``--transform matrix`` on pages with an offset MediaBox."""
+
+import io
+
+import pytest
+from PyPDF2 import PdfReader
+
+from center_pdf import center_pdf_bytes
+from center_plan import analyze_pdf
+from conftest import OFFSET_BOX, OFFSET_PAGES
+from transform_check import check_document
+
+BOXES = ("mediabox", "cropbox")
+
+
+def _pages(data: bytes):
+    return PdfReader(io.BytesIO(data)).pages
+
+
+@pytest.mark.parametrize("engine", ["stream", "pdfplumber"])
+def test_box_shift_renders_like_matrix_transform(offset_pdf, engine):
+    result = check_document(offset_pdf, engine, dpi=150.0, tolerance=8)
+    assert result["pages"] == OFFSET_PAGES
+    assert result["diff_pct"] <= 0.5
+    assert result["streams_identical"]
+
+
+def test_box_shift_moves_every_page_box_by_the_same_amount(offset_pdf):
+    matrix = _pages(center_pdf_bytes(offset_pdf, engine="stream", transform="matrix"))
+    box = _pages(center_pdf_bytes(offset_pdf, engine="stream", transform="box"))
+    for source, matrix_page, box_page in zip(_pages(offset_pdf), matrix, box):
+        assert [float(v) for v in matrix_page.mediabox] == list(OFFSET_BOX)
+        dx = float(box_page.mediabox.left) - float(source.mediabox.left)
+        dy = float(box_page.mediabox.bottom) - float(source.mediabox.bottom)
+        assert (dx, dy) != (0.0, 0.0)
+        for name in BOXES:
+            moved, original = getattr(box_page, name), getattr(source, name)
+            assert float(moved.left) - float(original.left) == pytest.approx(dx)
+            assert float(moved.bottom) - float(original.bottom) == pytest.approx(dy)
+            assert float(moved.width) == pytest.approx(float(original.width))
+            assert float(moved.height) == pytest.approx(float(original.height))
+
+
+@pytest.mark.parametrize("transform", ["matrix", "box"])
+def test_centered_output_needs_no_further_shift(offset_pdf, tmp_path, transform):
+    output = tmp_path / f"{transform}.pdf"
+    output.write_bytes(center_pdf_bytes(offset_pdf, engine="stream", transform=transform))
+    plan = analyze_pdf(output, engine="stream")
+    assert len(plan.pages) == OFFSET_PAGES
+    for page in plan.pages:
+        assert page.tx == pytest.approx(0.0, abs=0.5)
+        assert page.ty == pytest.approx(0.0, abs=0.5)